@@ -0,0 +1,78 @@
+"""Measure the cost of classifying objects while snapshotting.
+
+Compares the full duck-typing probe chain with the per-class cache for a
+mix of built-in containers, library structures and user-defined classes.
+
+Run with ``python -m benchmarks.snapshot_probe [objects-per-kind]``.
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+from dsa_visualizer.core import snapshotter
+from dsa_visualizer.data_structures.implementations.structures import (
+    BinarySearchTree,
+    Stack,
+)
+
+
+class Node:
+    def __init__(self, value: object) -> None:
+        self.value = value
+        self.next = None
+
+
+class Chain:
+    def __init__(self) -> None:
+        self.head = Node(0)
+
+
+class TreeNode:
+    def __init__(self, value: object) -> None:
+        self.value = value
+        self.left = None
+        self.right = None
+
+
+class Tree:
+    def __init__(self) -> None:
+        self.root = TreeNode(0)
+
+
+class Plain:
+    pass
+
+
+def _objects(count: int) -> list[object]:
+    makers = (list, dict, Stack, BinarySearchTree, Chain, Tree, Plain)
+    return [make() for make in makers for _ in range(count)]
+
+
+def _uncached(objects: list[object]) -> None:
+    policy = snapshotter.CapturePolicy()
+    for value in objects:
+        snapshotter._classify(value)(value, policy)
+
+
+def _cached(objects: list[object]) -> None:
+    policy = snapshotter.CapturePolicy()
+    for value in objects:
+        snapshotter._describe(value, policy)
+
+
+def main(argv: list[str]) -> None:
+    count = int(argv[0]) if argv else 1000
+    objects = _objects(count)
+    snapshotter._CLASS_DESCRIBERS.clear()
+    for label, run in (("probe chain", _uncached), ("class cache", _cached)):
+        seconds = min(
+            timeit.repeat(lambda run=run: run(objects), number=5, repeat=5)
+        ) / 5
+        per_object = seconds / len(objects) * 1e6
+        print(f"{label:12} {per_object:8.3f} us/object ({len(objects)} objects)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
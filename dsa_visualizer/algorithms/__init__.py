@@ -9,11 +9,12 @@ from dsa_visualizer.algorithms.types import (
     HighlightContext,
     TreeHighlightContext,
 )
-from dsa_visualizer.algorithms.runner import AlgorithmRunner
+from dsa_visualizer.algorithms.runner import AlgorithmRunner, Examines
 
 __all__ = [
     "AlgorithmStep",
     "HighlightContext",
     "TreeHighlightContext",
     "AlgorithmRunner",
+    "Examines",
 ]
@@ -0,0 +1,242 @@
+"""Run a search algorithm for many targets and summarize its cost.
+
+Batch runs drive the same step generators as the visualizer but keep no
+step history: each target's generator is drained and only its final step,
+step count and comparison count are kept. Linear and binary search over
+numeric buffers take a NumPy-vectorized path when NumPy is installed; it
+reproduces the generators' counts exactly.
+"""
+
+from __future__ import annotations
+
+import array
+import math
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+
+from dsa_visualizer.algorithms.search.binary import binary_search
+from dsa_visualizer.algorithms.search.linear import linear_search
+from dsa_visualizer.algorithms.types import AlgorithmStep, TreeHighlightContext
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - NumPy is optional
+    numpy = None
+
+
+@dataclass(frozen=True)
+class CostSummary:
+    """Aggregate of one per-target cost over a batch."""
+
+    mean: float
+    """Average cost per target."""
+
+    p95: int
+    """95th percentile cost (nearest rank)."""
+
+    worst: int
+    """Highest cost of any target."""
+
+
+@dataclass(frozen=True)
+class BatchSearchResult:
+    """Outcome of running one search algorithm for many targets."""
+
+    algorithm: str
+    """Name of the algorithm that was run."""
+
+    targets: tuple[object, ...] = field(repr=False)
+    """Targets in the order they were searched for."""
+
+    results: tuple[object, ...] = field(repr=False)
+    """Final result for each target (index, node, or -1/None if absent)."""
+
+    steps: tuple[int, ...] = field(repr=False)
+    """Number of visualization steps each target took."""
+
+    comparisons: tuple[int, ...] = field(repr=False)
+    """Number of elements each target examined."""
+
+    step_summary: CostSummary
+    """Aggregate of ``steps``."""
+
+    comparison_summary: CostSummary
+    """Aggregate of ``comparisons``."""
+
+    def __str__(self) -> str:
+        steps = self.step_summary
+        comparisons = self.comparison_summary
+        return (
+            f"{self.algorithm}: {len(self.targets)} targets\n"
+            f"  steps:       mean {steps.mean:.2f}, p95 {steps.p95}, "
+            f"worst {steps.worst}\n"
+            f"  comparisons: mean {comparisons.mean:.2f}, "
+            f"p95 {comparisons.p95}, worst {comparisons.worst}"
+        )
+
+
+def search_batch(
+    name: str,
+    algorithm: Callable[[object, object], Iterator[AlgorithmStep]],
+    data: object,
+    targets: Iterable[object],
+) -> BatchSearchResult:
+    """Run ``algorithm`` over ``data`` once per target.
+
+    Args:
+        name: Display name of the algorithm.
+        algorithm: A search generator (array or tree).
+        data: The sequence or tree root to search.
+        targets: Values to search for.
+
+    Returns:
+        Per-target results and counts with their aggregates.
+    """
+    targets = tuple(targets)
+    fast_path = _FAST_PATHS.get(algorithm)
+    counts = None
+    if fast_path is not None and numpy is not None:
+        counts = fast_path(data, targets)
+    if counts is None:
+        counts = _drain_all(algorithm, data, targets)
+    results, steps, comparisons = counts
+    return BatchSearchResult(
+        algorithm=name,
+        targets=targets,
+        results=tuple(results),
+        steps=tuple(steps),
+        comparisons=tuple(comparisons),
+        step_summary=summarize(steps),
+        comparison_summary=summarize(comparisons),
+    )
+
+
+def summarize(costs: Sequence[int]) -> CostSummary:
+    """Compute mean, p95 and worst of a list of costs."""
+    if not costs:
+        return CostSummary(mean=0.0, p95=0, worst=0)
+    ordered = sorted(costs)
+    rank = math.ceil(0.95 * len(ordered)) - 1
+    return CostSummary(
+        mean=sum(ordered) / len(ordered),
+        p95=ordered[rank],
+        worst=ordered[-1],
+    )
+
+
+def _drain_all(
+    algorithm: Callable[[object, object], Iterator[AlgorithmStep]],
+    data: object,
+    targets: tuple[object, ...],
+) -> tuple[list[object], list[int], list[int]]:
+    """Drain one generator per target, keeping only the counts."""
+    results: list[object] = []
+    steps: list[int] = []
+    comparisons: list[int] = []
+    for target in targets:
+        last = None
+        compared = 0
+        previous = None
+        for step in algorithm(data, target):
+            last = step
+            focus = _focus(step)
+            if focus and focus != previous:
+                compared += 1
+            previous = focus
+        results.append(last.result if last is not None else None)
+        steps.append(last.step_number if last is not None else 0)
+        comparisons.append(compared)
+    return results, steps, comparisons
+
+
+def _focus(step: AlgorithmStep) -> object:
+    """The element a step examines, or None.
+
+    Generators spread one comparison over several steps (examine, then
+    report the outcome), so a comparison is counted each time the focus
+    moves to an element rather than once per highlighted step.
+    """
+    highlights = step.highlights
+    if isinstance(highlights, TreeHighlightContext):
+        if highlights.comparing_node is not None:
+            return highlights.comparing_node
+        return highlights.found_node
+    return highlights.current or None
+
+
+def _numeric_arrays(data: object, targets: tuple[object, ...]) -> tuple | None:
+    """Convert data and targets to NumPy arrays of one numeric kind.
+
+    Returns None when the vectorized path would not compare values exactly
+    as Python does (mixed or non-numeric types, lazy sequences like range).
+    """
+    if not isinstance(data, (list, tuple, array.array, memoryview, numpy.ndarray)):
+        return None
+    if len(data) == 0 or not targets:
+        return None
+    try:
+        values = numpy.asarray(data)
+        wanted = numpy.asarray(targets)
+    except (TypeError, ValueError):
+        return None
+    if values.ndim != 1 or wanted.ndim != 1:
+        return None
+    kinds = {values.dtype.kind, wanted.dtype.kind}
+    if not (kinds <= {"i", "u"} or kinds == {"f"}):
+        return None
+    return values, wanted
+
+
+def _linear_numpy(
+    data: object, targets: tuple[object, ...]
+) -> tuple[list[int], list[int], list[int]] | None:
+    """Vectorized linear search counts: first occurrence of each target."""
+    arrays = _numeric_arrays(data, targets)
+    if arrays is None:
+        return None
+    values, wanted = arrays
+    n = len(values)
+    unique, first = numpy.unique(values, return_index=True)
+    pos = numpy.minimum(numpy.searchsorted(unique, wanted), len(unique) - 1)
+    hit = unique[pos] == wanted
+    index = numpy.where(hit, first[pos], -1)
+    # Each element checked costs a check step and an outcome step.
+    comparisons = numpy.where(hit, index + 1, n)
+    steps = numpy.where(hit, 2 * comparisons, 2 * n + 1)
+    return index.tolist(), steps.tolist(), comparisons.tolist()
+
+
+def _binary_numpy(
+    data: object, targets: tuple[object, ...]
+) -> tuple[list[int], list[int], list[int]] | None:
+    """Vectorized binary search: every target advances one probe per round."""
+    arrays = _numeric_arrays(data, targets)
+    if arrays is None:
+        return None
+    values, wanted = arrays
+    low = numpy.zeros(len(wanted), dtype=numpy.int64)
+    high = numpy.full(len(wanted), len(values) - 1, dtype=numpy.int64)
+    result = numpy.full(len(wanted), -1, dtype=numpy.int64)
+    comparisons = numpy.zeros(len(wanted), dtype=numpy.int64)
+    active = low <= high
+    while active.any():
+        mid = (low + high) // 2
+        probe = values[numpy.where(active, mid, 0)]
+        comparisons += active
+        found = active & (probe == wanted)
+        result[found] = mid[found]
+        right = active & ~found & (probe < wanted)
+        left = active & ~found & ~(probe < wanted)
+        low = numpy.where(right, mid + 1, low)
+        high = numpy.where(left, mid - 1, high)
+        active = active & ~found & (low <= high)
+    # Each probe yields a range step and an outcome step; a miss adds a
+    # final "not found" step.
+    steps = 2 * comparisons + (result == -1)
+    return result.tolist(), steps.tolist(), comparisons.tolist()
+
+
+_FAST_PATHS: dict[Callable, Callable] = {
+    linear_search: _linear_numpy,
+    binary_search: _binary_numpy,
+}
@@ -0,0 +1,98 @@
+"""Highlight sets that share one record across all steps of a run.
+
+Generators used to copy their ``visited`` set (and DFS its path) into a
+new frozenset or tuple for every step, which makes generating n steps
+O(n²). A ``MarkLog`` instead records, once per member, the step it was
+marked at and the step it was unmarked at. Each step keeps a ``MarkSet``
+view of the log frozen at that step. Taking a view and testing a member
+of it are both O(1).
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Hashable, Iterator
+from collections.abc import Set as AbstractSet
+
+_NEVER = sys.maxsize
+
+
+class MarkLog:
+    """A growing and shrinking set whose past states can be viewed cheaply.
+
+    A member can be marked again after it was unmarked only before the
+    next ``freeze``, since a view must not change once it was taken.
+    """
+
+    def __init__(self) -> None:
+        # member -> [time marked, time unmarked]
+        self._spans: dict[Hashable, list[int]] = {}
+        self._time = 0
+        self._size = 0
+
+    def add(self, member: Hashable) -> None:
+        """Mark ``member``; marking a marked member does nothing."""
+        span = self._spans.get(member)
+        if span is None:
+            self._spans[member] = [self._time, _NEVER]
+        elif span[1] == _NEVER:
+            return
+        elif span[1] == self._time:
+            # Unmarked since the last view, so no view saw it leave.
+            span[1] = _NEVER
+        else:
+            raise ValueError(f"{member!r} was already marked and unmarked")
+        self._size += 1
+
+    def discard(self, member: Hashable) -> None:
+        """Unmark ``member`` if it is marked."""
+        span = self._spans.get(member)
+        if span is not None and span[1] == _NEVER:
+            span[1] = self._time
+            self._size -= 1
+
+    def __contains__(self, member: object) -> bool:
+        span = self._spans.get(member)
+        return span is not None and span[1] == _NEVER
+
+    def __len__(self) -> int:
+        return self._size
+
+    def freeze(self) -> MarkSet:
+        """A view of the members marked now; later changes do not show."""
+        view = MarkSet(self._spans, self._time, self._size)
+        self._time += 1
+        return view
+
+
+class MarkSet(AbstractSet):
+    """Read-only view of a ``MarkLog`` at one point in time.
+
+    Compares equal to a frozenset with the same members.
+    """
+
+    __slots__ = ("_size", "_spans", "_time")
+
+    def __init__(self, spans: dict[Hashable, list[int]], time: int, size: int) -> None:
+        self._spans = spans
+        self._time = time
+        self._size = size
+
+    def __contains__(self, member: object) -> bool:
+        span = self._spans.get(member)
+        return span is not None and span[0] <= self._time < span[1]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Members in the order they were marked."""
+        time = self._time
+        for member, (marked, unmarked) in list(self._spans.items()):
+            if marked <= time < unmarked:
+                yield member
+
+    def __len__(self) -> int:
+        return self._size
+
+    __hash__ = AbstractSet._hash
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({set(self)!r})"
@@ -0,0 +1,74 @@
+"""Render algorithm steps into display-ready frames."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from dsa_visualizer.algorithms.runner import AlgorithmRunner
+from dsa_visualizer.algorithms.types import (
+    AlgorithmFrame,
+    AlgorithmStep,
+    HighlightContext,
+)
+from dsa_visualizer.data_structures.render.array import render_array
+
+ARRAY_WINDOW = 32
+"""Most elements drawn for one step; longer arrays are shown in a window."""
+
+
+def render_step_content(
+    step: AlgorithmStep, data: Sequence | object | None = None
+) -> str | None:
+    """Render the data for a step with its highlights.
+
+    ``data`` replaces ``step.data``, e.g. with the array rebuilt by
+    ``AlgorithmRunner.data_at``. Sequences longer than ARRAY_WINDOW are
+    read through a window around the step's focus, so only the drawn
+    elements are ever indexed.
+
+    Returns None when the step data has no array visualization.
+    """
+    if data is None:
+        data = step.data
+    if isinstance(data, (str, bytes)) or not (
+        isinstance(data, Sequence) or hasattr(data, "__array__")
+    ):
+        return None
+    size = len(data)
+    if size <= ARRAY_WINDOW:
+        return render_array(data, highlights=step.highlights)
+    start = _window_start(size, step.highlights)
+    stop = start + ARRAY_WINDOW
+    window = [data[index] for index in range(start, stop)]
+    content = render_array(window, highlights=step.highlights, offset=start)
+    return f"{content}\n{_window_note(start, stop, size)}"
+
+
+def _window_start(size: int, highlights: HighlightContext) -> int:
+    """First index of the window that keeps the step's focus in view."""
+    focus = highlights.found or highlights.current or highlights.comparing
+    if focus:
+        center = min(focus)
+    elif highlights.boundaries is not None:
+        low, high = highlights.boundaries
+        center = low + (high - low) // 2
+    else:
+        center = 0
+    return max(0, min(center - ARRAY_WINDOW // 2, size - ARRAY_WINDOW))
+
+
+def _window_note(start: int, stop: int, size: int) -> str:
+    """Describe which part of a windowed array is on screen."""
+    return f"Showing [{start}:{stop}] of {size} elements"
+
+
+def render_frame(runner: AlgorithmRunner, step: AlgorithmStep) -> AlgorithmFrame:
+    """Build an AlgorithmFrame for the runner's current step."""
+    return AlgorithmFrame(
+        name=runner.name,
+        step_number=runner.step_number,
+        total_steps=runner.total_steps,
+        action=step.action,
+        is_complete=step.is_complete,
+        content=render_step_content(step, runner.data_at(runner.current_index)),
+    )
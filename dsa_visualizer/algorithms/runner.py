@@ -1,31 +1,92 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Sequence
 from dataclasses import dataclass, field
+from itertools import islice
 
 from dsa_visualizer.algorithms.types import AlgorithmStep
 
+KEYFRAME_INTERVAL = 1024
+"""Steps between two keyframes, which a capped runner never drops."""
+
+
+@dataclass(frozen=True)
+class Examines:
+    """Step predicate: the step examines array index ``index``.
+
+    A predicate for ``AlgorithmRunner.fast_forward`` that, unlike a
+    lambda, can be sent to the kernel process.
+    """
+
+    index: int
+
+    def __call__(self, step: AlgorithmStep) -> bool:
+        return self.index in getattr(step.highlights, "current", ())
+
 
 @dataclass
 class AlgorithmRunner:
     """Manages step-by-step algorithm execution.
 
     Collects steps from an algorithm generator and allows navigation
-    through them (forward, backward, reset).
+    through them (forward, backward, reset, seek).
+
+    A runner created ``from_factory`` with ``max_steps`` keeps at most that
+    many steps besides its keyframes (every ``keyframe_interval``-th step).
+    A dropped step is regenerated by replaying a fresh generator from the
+    factory, which always starts at step 0: a keyframe is only a step that
+    is never dropped, not a point a replay can resume from. Reaching a
+    dropped step therefore costs time linear in its index, once per
+    ``max_steps`` dropped steps, since each replay restores that many.
     """
 
     name: str
     """Name of the algorithm being run."""
 
-    steps: list[AlgorithmStep] = field(default_factory=list)
-    """History of algorithm steps."""
+    steps: list[AlgorithmStep | None] = field(default_factory=list)
+    """History of algorithm steps; dropped steps are None."""
 
     current_index: int = -1
     """Current position in steps (-1 means not started)."""
 
+    keyframe_interval: int = KEYFRAME_INTERVAL
+    """Steps between two keyframes."""
+
+    max_steps: int | None = None
+    """Most non-keyframe steps kept in memory (None keeps every step)."""
+
     _generator: Iterator[AlgorithmStep] | None = field(default=None, repr=False)
     """Internal generator for lazy step collection."""
 
+    _factory: Callable[[], Iterator[AlgorithmStep]] | None = field(
+        default=None, repr=False
+    )
+    """Creates a fresh generator to regenerate dropped steps."""
+
+    _write_steps: list[int] = field(default_factory=list, repr=False)
+    """Indices of the collected steps that have writes, in order."""
+
+    _writes: list[tuple[tuple[int, object], ...]] = field(
+        default_factory=list, repr=False
+    )
+    """Writes of those steps, kept when the steps themselves are dropped."""
+
+    _kept: OrderedDict[int, None] = field(default_factory=OrderedDict, repr=False)
+    """Non-keyframe steps in memory, least recently used first."""
+
+    def __post_init__(self) -> None:
+        if self.max_steps is not None:
+            if self._factory is None:
+                raise ValueError("max_steps needs a factory to regenerate steps")
+            if self.max_steps < self.keyframe_interval:
+                raise ValueError("max_steps must be at least keyframe_interval")
+        for index, step in enumerate(self.steps):
+            if step.writes:
+                self._write_steps.append(index)
+                self._writes.append(step.writes)
+
     @classmethod
     def from_generator(
         cls, name: str, generator: Iterator[AlgorithmStep]
@@ -36,6 +97,29 @@ class AlgorithmRunner:
         """
         return cls(name=name, steps=[], current_index=-1, _generator=generator)
 
+    @classmethod
+    def from_factory(
+        cls,
+        name: str,
+        factory: Callable[[], Iterator[AlgorithmStep]],
+        *,
+        max_steps: int | None = None,
+        keyframe_interval: int = KEYFRAME_INTERVAL,
+    ) -> AlgorithmRunner:
+        """Create a runner from a function that starts the algorithm.
+
+        Each call of ``factory`` must yield the same steps. With
+        ``max_steps``, steps beyond the cap are dropped and regenerated
+        when they are visited again.
+        """
+        return cls(
+            name=name,
+            keyframe_interval=keyframe_interval,
+            max_steps=max_steps,
+            _generator=factory(),
+            _factory=factory,
+        )
+
     @classmethod
     def from_steps(cls, name: str, steps: list[AlgorithmStep]) -> AlgorithmRunner:
         """Create a runner from a pre-computed list of steps."""
@@ -49,25 +133,7 @@ class AlgorithmRunner:
 
         Returns None if no more steps available.
         """
-        next_index = self.current_index + 1
-
-        # If we have the step already, just move to it
-        if next_index < len(self.steps):
-            self.current_index = next_index
-            return self.steps[self.current_index]
-
-        # Try to get next step from generator
-        if self._generator is not None:
-            try:
-                step = next(self._generator)
-                self.steps.append(step)
-                self.current_index = next_index
-                return step
-            except StopIteration:
-                self._generator = None
-                return None
-
-        return None
+        return self.seek(self.current_index + 1)
 
     def rewind(self) -> AlgorithmStep | None:
         """Move backward one step and return it.
@@ -82,7 +148,53 @@ class AlgorithmRunner:
         if self.current_index == -1:
             return None
 
-        return self.steps[self.current_index]
+        return self._step_at(self.current_index)
+
+    def seek(self, index: int) -> AlgorithmStep | None:
+        """Move to the step at ``index`` (0-based) and return it.
+
+        Steps not collected yet are pulled from the generator first.
+        Returns None, without moving, if the run has no such step.
+        """
+        if index < 0 or not self._collect(index):
+            return None
+        self.current_index = index
+        return self._step_at(index)
+
+    def fast_forward(
+        self, predicate: Callable[[AlgorithmStep], bool] | None = None
+    ) -> AlgorithmStep | None:
+        """Run ahead to the first later step matching ``predicate``.
+
+        Without a predicate, runs to the last step. The steps passed on
+        the way are not rendered, and are not kept either when the runner
+        can regenerate them. Returns the step moved to, or None, without
+        moving, if no later step matches.
+
+        Testing a predicate on already generated steps that were dropped
+        regenerates them, replaying from step 0 once per ``max_steps`` of
+        them.
+        """
+        if predicate is None:
+            last = None
+            while (step := self._next_step()) is not None:
+                last = step
+                self._store(len(self.steps), step, new=True, keep=False)
+            if last is not None:
+                self._store(len(self.steps) - 1, last)
+            if self.current_index >= len(self.steps) - 1:
+                return None
+            return self.seek(len(self.steps) - 1)
+
+        for index in range(self.current_index + 1, len(self.steps)):
+            if predicate(self._step_at(index)):
+                return self.seek(index)
+        while (step := self._next_step()) is not None:
+            matched = predicate(step)
+            self._store(len(self.steps), step, new=True, keep=matched)
+            if matched:
+                return self.seek(len(self.steps) - 1)
+        return None
 
     def reset(self) -> None:
         """Reset to the beginning (before first step)."""
@@ -95,7 +207,24 @@ class AlgorithmRunner:
         """
         if self.current_index < 0 or self.current_index >= len(self.steps):
             return None
-        return self.steps[self.current_index]
+        return self._step_at(self.current_index)
+
+    def data_at(self, index: int) -> Sequence | object:
+        """The array as it is after step ``index``.
+
+        Steps share their base data; when no step up to ``index`` wrote to
+        it, that base is returned as is. Otherwise a copy of the base with
+        those writes applied is built.
+        """
+        step = self._step_at(index)
+        count = bisect_right(self._write_steps, index)
+        if count == 0:
+            return step.data
+        data = list(step.data)
+        for writes in self._writes[:count]:
+            for position, value in writes:
+                data[position] = value
+        return data
 
     @property
     def is_complete(self) -> bool:
@@ -126,3 +255,88 @@ class AlgorithmRunner:
     def step_number(self) -> int:
         """Return current step number (1-indexed), or 0 if not started."""
         return self.current_index + 1
+
+    def _collect(self, index: int) -> bool:
+        """Pull steps from the generator until ``index`` exists."""
+        while index >= len(self.steps):
+            step = self._next_step()
+            if step is None:
+                return False
+            self._store(len(self.steps), step, new=True)
+        return True
+
+    def _next_step(self) -> AlgorithmStep | None:
+        """The generator's next step, or None once it is exhausted."""
+        if self._generator is None:
+            return None
+        try:
+            return next(self._generator)
+        except StopIteration:
+            self._generator = None
+            return None
+
+    def _store(
+        self,
+        index: int,
+        step: AlgorithmStep,
+        *,
+        new: bool = False,
+        keep: bool = True,
+    ) -> None:
+        """Put ``step`` at ``index``, or drop it if ``keep`` is False and
+        the factory can regenerate it."""
+        keyframe = index % self.keyframe_interval == 0
+        if not keep and self._factory is not None and not keyframe:
+            kept_step = None
+        else:
+            kept_step = step
+        if new:
+            if step.writes:
+                self._write_steps.append(index)
+                self._writes.append(step.writes)
+            self.steps.append(kept_step)
+        else:
+            self.steps[index] = kept_step
+        if kept_step is None or self.max_steps is None or keyframe:
+            return
+        self._kept[index] = None
+        self._kept.move_to_end(index)
+        while len(self._kept) > self.max_steps:
+            dropped, _ = self._kept.popitem(last=False)
+            self.steps[dropped] = None
+
+    def _step_at(self, index: int) -> AlgorithmStep:
+        step = self.steps[index]
+        if step is None:
+            self._regenerate(index)
+            step = self.steps[index]
+            assert step is not None
+        elif index in self._kept:
+            self._kept.move_to_end(index)
+        return step
+
+    def _regenerate(self, index: int) -> None:
+        """Replay the factory to restore the dropped step at ``index``.
+
+        A generator cannot be resumed from a keyframe, so every replay
+        starts over at step 0 and takes time linear in ``index`` however
+        close the nearest keyframe is. So that scrubbing backwards does not
+        pay that for every step, a replay also restores the dropped steps
+        before ``index``, as many as ``max_steps`` allows (one interval
+        without a cap).
+        """
+        assert self._factory is not None
+        start = index - index % self.keyframe_interval
+        stop = min(start + self.keyframe_interval, len(self.steps))
+        first = max(0, stop - (self.max_steps or self.keyframe_interval))
+        wanted = None
+        replay = islice(self._factory(), first, stop)
+        for position, step in enumerate(replay, first):
+            if position == index:
+                wanted = step
+            elif self.steps[position] is None:
+                self._store(position, step)
+        if wanted is None:
+            raise RuntimeError(f"{self.name} yielded fewer steps when replayed")
+        # Stored last, so the step asked for is the most recently used.
+        self._store(index, wanted)
@@ -9,12 +9,13 @@ Binary Search: O(log n) time complexity
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 
+from dsa_visualizer.algorithms.marks import MarkLog
 from dsa_visualizer.algorithms.types import AlgorithmStep, HighlightContext
 
 
-def binary_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
+def binary_search(arr: Sequence, target: object) -> Iterator[AlgorithmStep]:
     """Generate steps for binary search visualization.
 
     Searches for target in a sorted array using binary search.
@@ -27,12 +28,12 @@ def binary_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
     Yields:
         AlgorithmStep for each operation in the search.
     """
-    if not arr:
+    if len(arr) == 0:
         yield AlgorithmStep(
             step_number=1,
             action=f"Array is empty, {target!r} not found",
             highlights=HighlightContext(),
-            data=list(arr),
+            data=arr,
             is_complete=True,
             result=-1,
         )
@@ -41,7 +42,7 @@ def binary_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
     low = 0
     high = len(arr) - 1
     step_num = 0
-    visited: set[int] = set()
+    visited = MarkLog()
 
     while low <= high:
         mid = (low + high) // 2
@@ -53,10 +54,10 @@ def binary_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
             action=f"Search range: [{low}..{high}], mid = {mid}",
             highlights=HighlightContext(
                 current=frozenset({mid}),
-                visited=frozenset(visited),
+                visited=visited.freeze(),
                 boundaries=(low, high),
             ),
-            data=list(arr),
+            data=arr,
         )
 
         step_num += 1
@@ -70,10 +71,10 @@ def binary_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
                 action=f"Found {target!r} at index {mid}!",
                 highlights=HighlightContext(
                     found=frozenset({mid}),
-                    visited=frozenset(visited),
+                    visited=visited.freeze(),
                     boundaries=(low, high),
                 ),
-                data=list(arr),
+                data=arr,
                 is_complete=True,
                 result=mid,
             )
@@ -82,36 +83,36 @@ def binary_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
         elif mid_value < target:
             # Target is in right half
             visited.add(mid)
-            eliminated = frozenset(range(low, mid + 1))
+            eliminated = range(low, mid + 1)
             yield AlgorithmStep(
                 step_number=step_num,
                 action=f"arr[{mid}]={mid_value!r} < {target!r}, search right half",
                 highlights=HighlightContext(
                     current=frozenset({mid}),
                     comparing=frozenset({mid}),
-                    visited=frozenset(visited),
+                    visited=visited.freeze(),
                     eliminated=eliminated,
                     boundaries=(low, high),
                 ),
-                data=list(arr),
+                data=arr,
             )
             low = mid + 1
 
         else:
             # Target is in left half
             visited.add(mid)
-            eliminated = frozenset(range(mid, high + 1))
+            eliminated = range(mid, high + 1)
             yield AlgorithmStep(
                 step_number=step_num,
                 action=f"arr[{mid}]={mid_value!r} > {target!r}, search left half",
                 highlights=HighlightContext(
                     current=frozenset({mid}),
                     comparing=frozenset({mid}),
-                    visited=frozenset(visited),
+                    visited=visited.freeze(),
                     eliminated=eliminated,
                     boundaries=(low, high),
                 ),
-                data=list(arr),
+                data=arr,
             )
             high = mid - 1
 
@@ -121,9 +122,9 @@ def binary_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
         step_number=step_num,
         action=f"{target!r} not found in array",
         highlights=HighlightContext(
-            visited=frozenset(visited),
+            visited=visited.freeze(),
         ),
-        data=list(arr),
+        data=arr,
         is_complete=True,
         result=-1,
     )
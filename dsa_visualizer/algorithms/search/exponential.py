@@ -10,12 +10,13 @@ Exponential Search: O(log n) time complexity
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 
+from dsa_visualizer.algorithms.marks import MarkLog
 from dsa_visualizer.algorithms.types import AlgorithmStep, HighlightContext
 
 
-def exponential_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
+def exponential_search(arr: Sequence, target: object) -> Iterator[AlgorithmStep]:
     """Generate steps for exponential search visualization.
 
     Searches for target by exponentially increasing the range until
@@ -35,14 +36,14 @@ def exponential_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
             step_number=1,
             action=f"Array is empty, {target!r} not found",
             highlights=HighlightContext(),
-            data=list(arr),
+            data=arr,
             is_complete=True,
             result=-1,
         )
         return
 
     step_num = 0
-    visited: set[int] = set()
+    visited = MarkLog()
 
     # Check first element
     step_num += 1
@@ -52,9 +53,9 @@ def exponential_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
         action=f"Check index 0: arr[0]={arr[0]!r}",
         highlights=HighlightContext(
             current=frozenset({0}),
-            visited=frozenset(visited),
+            visited=visited.freeze(),
         ),
-        data=list(arr),
+        data=arr,
     )
 
     if arr[0] == target:
@@ -64,9 +65,9 @@ def exponential_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
             action=f"Found {target!r} at index 0!",
             highlights=HighlightContext(
                 found=frozenset({0}),
-                visited=frozenset(visited),
+                visited=visited.freeze(),
             ),
-            data=list(arr),
+            data=arr,
             is_complete=True,
             result=0,
         )
@@ -79,9 +80,9 @@ def exponential_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
         step_number=step_num,
         action="Starting exponential range expansion",
         highlights=HighlightContext(
-            visited=frozenset(visited),
+            visited=visited.freeze(),
         ),
-        data=list(arr),
+        data=arr,
     )
 
     while bound < n and arr[bound] < target:
@@ -93,10 +94,10 @@ def exponential_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
             action=f"Expand: bound={bound}, arr[{bound}]={arr[bound]!r} < {target!r}",
             highlights=HighlightContext(
                 current=frozenset({bound}),
-                visited=frozenset(visited),
+                visited=visited.freeze(),
                 boundaries=(bound // 2, min(bound, n - 1)),
             ),
-            data=list(arr),
+            data=arr,
         )
 
         bound *= 2
@@ -110,10 +111,10 @@ def exponential_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
         step_number=step_num,
         action=f"Binary search in range [{low}..{high}]",
         highlights=HighlightContext(
-            visited=frozenset(visited),
+            visited=visited.freeze(),
             boundaries=(low, high),
         ),
-        data=list(arr),
+        data=arr,
     )
 
     # Binary search phase
@@ -127,10 +128,10 @@ def exponential_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
             action=f"Binary: range [{low}..{high}], mid={mid}",
             highlights=HighlightContext(
                 current=frozenset({mid}),
-                visited=frozenset(visited),
+                visited=visited.freeze(),
                 boundaries=(low, high),
             ),
-            data=list(arr),
+            data=arr,
         )
 
         step_num += 1
@@ -142,10 +143,10 @@ def exponential_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
                 action=f"Found {target!r} at index {mid}!",
                 highlights=HighlightContext(
                     found=frozenset({mid}),
-                    visited=frozenset(visited),
+                    visited=visited.freeze(),
                     boundaries=(low, high),
                 ),
-                data=list(arr),
+                data=arr,
                 is_complete=True,
                 result=mid,
             )
@@ -158,10 +159,10 @@ def exponential_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
                 highlights=HighlightContext(
                     current=frozenset({mid}),
                     comparing=frozenset({mid}),
-                    visited=frozenset(visited),
+                    visited=visited.freeze(),
                     boundaries=(low, high),
                 ),
-                data=list(arr),
+                data=arr,
             )
             low = mid + 1
 
@@ -172,10 +173,10 @@ def exponential_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
                 highlights=HighlightContext(
                     current=frozenset({mid}),
                     comparing=frozenset({mid}),
-                    visited=frozenset(visited),
+                    visited=visited.freeze(),
                     boundaries=(low, high),
                 ),
-                data=list(arr),
+                data=arr,
             )
             high = mid - 1
 
@@ -185,9 +186,9 @@ def exponential_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
         step_number=step_num,
         action=f"{target!r} not found in array",
         highlights=HighlightContext(
-            visited=frozenset(visited),
+            visited=visited.freeze(),
         ),
-        data=list(arr),
+        data=arr,
         is_complete=True,
         result=-1,
     )
@@ -9,12 +9,13 @@ Interpolation Search: O(log log n) average time complexity
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 
+from dsa_visualizer.algorithms.marks import MarkLog
 from dsa_visualizer.algorithms.types import AlgorithmStep, HighlightContext
 
 
-def interpolation_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
+def interpolation_search(arr: Sequence, target: object) -> Iterator[AlgorithmStep]:
     """Generate steps for interpolation search visualization.
 
     Searches for target in a sorted array using interpolation formula
@@ -34,7 +35,7 @@ def interpolation_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
             step_number=1,
             action=f"Array is empty, {target!r} not found",
             highlights=HighlightContext(),
-            data=list(arr),
+            data=arr,
             is_complete=True,
             result=-1,
         )
@@ -43,7 +44,7 @@ def interpolation_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
     low = 0
     high = n - 1
     step_num = 0
-    visited: set[int] = set()
+    visited = MarkLog()
 
     while low <= high and arr[low] <= target <= arr[high]:
         step_num += 1
@@ -65,10 +66,10 @@ def interpolation_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
             action=f"Range [{low}..{high}], interpolated pos = {pos}",
             highlights=HighlightContext(
                 current=frozenset({pos}),
-                visited=frozenset(visited),
+                visited=visited.freeze(),
                 boundaries=(low, high),
             ),
-            data=list(arr),
+            data=arr,
         )
 
         step_num += 1
@@ -80,10 +81,10 @@ def interpolation_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
                 action=f"Found {target!r} at index {pos}!",
                 highlights=HighlightContext(
                     found=frozenset({pos}),
-                    visited=frozenset(visited),
+                    visited=visited.freeze(),
                     boundaries=(low, high),
                 ),
-                data=list(arr),
+                data=arr,
                 is_complete=True,
                 result=pos,
             )
@@ -96,10 +97,10 @@ def interpolation_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
                 highlights=HighlightContext(
                     current=frozenset({pos}),
                     comparing=frozenset({pos}),
-                    visited=frozenset(visited),
+                    visited=visited.freeze(),
                     boundaries=(low, high),
                 ),
-                data=list(arr),
+                data=arr,
             )
             low = pos + 1
 
@@ -110,10 +111,10 @@ def interpolation_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
                 highlights=HighlightContext(
                     current=frozenset({pos}),
                     comparing=frozenset({pos}),
-                    visited=frozenset(visited),
+                    visited=visited.freeze(),
                     boundaries=(low, high),
                 ),
-                data=list(arr),
+                data=arr,
             )
             high = pos - 1
 
@@ -123,9 +124,9 @@ def interpolation_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
         step_number=step_num,
         action=f"{target!r} not found in array",
         highlights=HighlightContext(
-            visited=frozenset(visited),
+            visited=visited.freeze(),
         ),
-        data=list(arr),
+        data=arr,
         is_complete=True,
         result=-1,
     )
@@ -10,12 +10,13 @@ Jump Search: O(√n) time complexity
 from __future__ import annotations
 
 import math
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 
+from dsa_visualizer.algorithms.marks import MarkLog
 from dsa_visualizer.algorithms.types import AlgorithmStep, HighlightContext
 
 
-def jump_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
+def jump_search(arr: Sequence, target: object) -> Iterator[AlgorithmStep]:
     """Generate steps for jump search visualization.
 
     Searches for target in a sorted array by jumping ahead by √n steps,
@@ -35,7 +36,7 @@ def jump_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
             step_number=1,
             action=f"Array is empty, {target!r} not found",
             highlights=HighlightContext(),
-            data=list(arr),
+            data=arr,
             is_complete=True,
             result=-1,
         )
@@ -44,14 +45,14 @@ def jump_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
     # Calculate optimal jump size
     jump_size = int(math.sqrt(n))
     step_num = 0
-    visited: set[int] = set()
+    visited = MarkLog()
 
     step_num += 1
     yield AlgorithmStep(
         step_number=step_num,
         action=f"Array size: {n}, jump size: √{n} = {jump_size}",
         highlights=HighlightContext(),
-        data=list(arr),
+        data=arr,
     )
 
     # Find the block where element may be present
@@ -68,10 +69,10 @@ def jump_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
             action=f"Jump to index {curr}: arr[{curr}]={arr[curr]!r} < {target!r}",
             highlights=HighlightContext(
                 current=frozenset({curr}),
-                visited=frozenset(visited),
+                visited=visited.freeze(),
                 boundaries=(prev, min(curr + jump_size - 1, n - 1)),
             ),
-            data=list(arr),
+            data=arr,
         )
 
         prev = curr
@@ -91,10 +92,10 @@ def jump_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
         step_number=step_num,
         action=f"Target may be in block [{block_start}..{block_end}], linear search",
         highlights=HighlightContext(
-            visited=frozenset(visited),
+            visited=visited.freeze(),
             boundaries=(block_start, block_end),
         ),
-        data=list(arr),
+        data=arr,
     )
 
     # Linear search within the block
@@ -108,10 +109,10 @@ def jump_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
             highlights=HighlightContext(
                 current=frozenset({i}),
                 comparing=frozenset({i}),
-                visited=frozenset(visited),
+                visited=visited.freeze(),
                 boundaries=(block_start, block_end),
             ),
-            data=list(arr),
+            data=arr,
         )
 
         if arr[i] == target:
@@ -121,9 +122,9 @@ def jump_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
                 action=f"Found {target!r} at index {i}!",
                 highlights=HighlightContext(
                     found=frozenset({i}),
-                    visited=frozenset(visited),
+                    visited=visited.freeze(),
                 ),
-                data=list(arr),
+                data=arr,
                 is_complete=True,
                 result=i,
             )
@@ -139,9 +140,9 @@ def jump_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
         step_number=step_num,
         action=f"{target!r} not found in array",
         highlights=HighlightContext(
-            visited=frozenset(visited),
+            visited=visited.freeze(),
         ),
-        data=list(arr),
+        data=arr,
         is_complete=True,
         result=-1,
     )
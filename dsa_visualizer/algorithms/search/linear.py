@@ -9,12 +9,13 @@ Linear Search: O(n) time complexity
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 
+from dsa_visualizer.algorithms.marks import MarkLog
 from dsa_visualizer.algorithms.types import AlgorithmStep, HighlightContext
 
 
-def linear_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
+def linear_search(arr: Sequence, target: object) -> Iterator[AlgorithmStep]:
     """Generate steps for linear search visualization.
 
     Searches for target in arr by checking each element sequentially.
@@ -27,18 +28,18 @@ def linear_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
     Yields:
         AlgorithmStep for each operation in the search.
     """
-    if not arr:
+    if len(arr) == 0:
         yield AlgorithmStep(
             step_number=1,
             action=f"Array is empty, {target!r} not found",
             highlights=HighlightContext(),
-            data=list(arr),
+            data=arr,
             is_complete=True,
             result=-1,
         )
         return
 
-    visited: set[int] = set()
+    visited = MarkLog()
     step_num = 0
 
     for i, value in enumerate(arr):
@@ -50,9 +51,9 @@ def linear_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
             action=f"Examine index {i}: arr[{i}] = {value!r}",
             highlights=HighlightContext(
                 current=frozenset({i}),
-                visited=frozenset(visited),
+                visited=visited.freeze(),
             ),
-            data=list(arr),
+            data=arr,
         )
 
         step_num += 1
@@ -66,9 +67,9 @@ def linear_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
                 action=f"Found {target!r} at index {i}!",
                 highlights=HighlightContext(
                     found=frozenset({i}),
-                    visited=frozenset(visited),
+                    visited=visited.freeze(),
                 ),
-                data=list(arr),
+                data=arr,
                 is_complete=True,
                 result=i,
             )
@@ -82,9 +83,9 @@ def linear_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
                 highlights=HighlightContext(
                     current=frozenset({i}),
                     comparing=frozenset({i}),
-                    visited=frozenset(visited),
+                    visited=visited.freeze(),
                 ),
-                data=list(arr),
+                data=arr,
             )
 
     # Not found after checking all elements
@@ -93,9 +94,9 @@ def linear_search(arr: list, target: object) -> Iterator[AlgorithmStep]:
         step_number=step_num,
         action=f"{target!r} not found in array",
         highlights=HighlightContext(
-            visited=frozenset(visited),
+            visited=visited.freeze(),
         ),
-        data=list(arr),
+        data=arr,
         is_complete=True,
         result=-1,
     )
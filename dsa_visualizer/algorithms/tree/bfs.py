@@ -12,6 +12,7 @@ from __future__ import annotations
 from collections import deque
 from collections.abc import Iterator
 
+from dsa_visualizer.algorithms.marks import MarkLog
 from dsa_visualizer.algorithms.types import AlgorithmStep, TreeHighlightContext
 
 
@@ -39,7 +40,7 @@ def bfs_search(root: object | None, target: object) -> Iterator[AlgorithmStep]:
         return
 
     step_number = 0
-    visited: set[int] = set()
+    visited = MarkLog()
 
     # Use queue for BFS
     queue: deque[object] = deque([root])
@@ -57,7 +58,7 @@ def bfs_search(root: object | None, target: object) -> Iterator[AlgorithmStep]:
             action=f"Visit node with value {node_value}, compare with target {target}",
             highlights=TreeHighlightContext(
                 current_node=node_id,
-                visited_nodes=frozenset(visited),
+                visited_nodes=visited.freeze(),
                 comparing_node=node_id,
             ),
             data=root,
@@ -73,7 +74,7 @@ def bfs_search(root: object | None, target: object) -> Iterator[AlgorithmStep]:
                 action=f"Found target {target}!",
                 highlights=TreeHighlightContext(
                     found_node=node_id,
-                    visited_nodes=frozenset(visited),
+                    visited_nodes=visited.freeze(),
                 ),
                 data=root,
                 is_complete=True,
@@ -98,7 +99,7 @@ def bfs_search(root: object | None, target: object) -> Iterator[AlgorithmStep]:
         step_number=step_number,
         action=f"Target {target} not found in tree",
         highlights=TreeHighlightContext(
-            visited_nodes=frozenset(visited),
+            visited_nodes=visited.freeze(),
         ),
         data=root,
         is_complete=True,
@@ -127,7 +128,7 @@ def bfs_traversal(root: object | None) -> Iterator[AlgorithmStep]:
         return
 
     step_number = 0
-    visited: set[int] = set()
+    visited = MarkLog()
     traversal_order: list[object] = []
 
     # Use queue for BFS
@@ -148,7 +149,7 @@ def bfs_traversal(root: object | None) -> Iterator[AlgorithmStep]:
             action=f"Visit node with value {node_value}",
             highlights=TreeHighlightContext(
                 current_node=node_id,
-                visited_nodes=frozenset(visited),
+                visited_nodes=visited.freeze(),
             ),
             data=root,
             is_complete=False,
@@ -170,7 +171,7 @@ def bfs_traversal(root: object | None) -> Iterator[AlgorithmStep]:
         step_number=step_number,
         action=f"BFS traversal complete. Order: {traversal_order}",
         highlights=TreeHighlightContext(
-            visited_nodes=frozenset(visited),
+            visited_nodes=visited.freeze(),
         ),
         data=root,
         is_complete=True,
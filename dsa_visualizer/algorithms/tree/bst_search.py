@@ -14,6 +14,7 @@ from __future__ import annotations
 
 from collections.abc import Iterator
 
+from dsa_visualizer.algorithms.marks import MarkLog
 from dsa_visualizer.algorithms.types import AlgorithmStep, TreeHighlightContext
 
 
@@ -42,14 +43,14 @@ def bst_search(root: object | None, target: object) -> Iterator[AlgorithmStep]:
         return
 
     step_number = 0
-    visited: set[int] = set()
-    path: list[int] = []
+    visited = MarkLog()
+    path = MarkLog()
     node = root
 
     while node is not None:
         node_id = id(node)
         node_value = _get_value(node)
-        path.append(node_id)
+        path.add(node_id)
 
         step_number += 1
 
@@ -61,8 +62,8 @@ def bst_search(root: object | None, target: object) -> Iterator[AlgorithmStep]:
                 action=f"Compare {target} with {node_value}: Equal - Found target!",
                 highlights=TreeHighlightContext(
                     found_node=node_id,
-                    visited_nodes=frozenset(visited),
-                    path_nodes=tuple(path),
+                    visited_nodes=visited.freeze(),
+                    path_nodes=path.freeze(),
                 ),
                 data=root,
                 is_complete=True,
@@ -88,8 +89,8 @@ def bst_search(root: object | None, target: object) -> Iterator[AlgorithmStep]:
             action=action,
             highlights=TreeHighlightContext(
                 current_node=node_id,
-                visited_nodes=frozenset(visited),
-                path_nodes=tuple(path),
+                visited_nodes=visited.freeze(),
+                path_nodes=path.freeze(),
                 comparing_node=node_id,
             ),
             data=root,
@@ -104,8 +105,8 @@ def bst_search(root: object | None, target: object) -> Iterator[AlgorithmStep]:
                 step_number=step_number,
                 action=f"No {direction} child - target {target} not found in tree",
                 highlights=TreeHighlightContext(
-                    visited_nodes=frozenset(visited),
-                    path_nodes=tuple(path),
+                    visited_nodes=visited.freeze(),
+                    path_nodes=path.freeze(),
                 ),
                 data=root,
                 is_complete=True,
@@ -121,7 +122,7 @@ def bst_search(root: object | None, target: object) -> Iterator[AlgorithmStep]:
         step_number=step_number,
         action=f"Target {target} not found in tree",
         highlights=TreeHighlightContext(
-            visited_nodes=frozenset(visited),
+            visited_nodes=visited.freeze(),
         ),
         data=root,
         is_complete=True,
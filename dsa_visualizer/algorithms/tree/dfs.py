@@ -11,6 +11,7 @@ from __future__ import annotations
 
 from collections.abc import Iterator
 
+from dsa_visualizer.algorithms.marks import MarkLog
 from dsa_visualizer.algorithms.types import AlgorithmStep, TreeHighlightContext
 
 
@@ -38,8 +39,9 @@ def dfs_search(root: object | None, target: object) -> Iterator[AlgorithmStep]:
         return
 
     step_number = 0
-    visited: set[int] = set()
-    path: list[int] = []
+    visited = MarkLog()
+    path = MarkLog()
+    trail: list[int] = []  # The ids in path, in order, for backtracking
 
     # Use iterative DFS with explicit stack
     stack: list[object] = [root]
@@ -50,7 +52,8 @@ def dfs_search(root: object | None, target: object) -> Iterator[AlgorithmStep]:
         node_value = _get_value(node)
 
         step_number += 1
-        path.append(node_id)
+        path.add(node_id)
+        trail.append(node_id)
 
         # Yield step for examining this node
         yield AlgorithmStep(
@@ -58,8 +61,8 @@ def dfs_search(root: object | None, target: object) -> Iterator[AlgorithmStep]:
             action=f"Visit node with value {node_value}, compare with target {target}",
             highlights=TreeHighlightContext(
                 current_node=node_id,
-                visited_nodes=frozenset(visited),
-                path_nodes=tuple(path),
+                visited_nodes=visited.freeze(),
+                path_nodes=path.freeze(),
                 comparing_node=node_id,
             ),
             data=root,
@@ -75,8 +78,8 @@ def dfs_search(root: object | None, target: object) -> Iterator[AlgorithmStep]:
                 action=f"Found target {target}!",
                 highlights=TreeHighlightContext(
                     found_node=node_id,
-                    visited_nodes=frozenset(visited),
-                    path_nodes=tuple(path),
+                    visited_nodes=visited.freeze(),
+                    path_nodes=path.freeze(),
                 ),
                 data=root,
                 is_complete=True,
@@ -98,11 +101,11 @@ def dfs_search(root: object | None, target: object) -> Iterator[AlgorithmStep]:
         # When backtracking (no more children or dead end), update path
         if left is None and right is None:
             # Backtrack: find the last node in path that still has unvisited children
-            while path:
+            while trail:
                 # Check if we need to keep this node in path
                 if _has_unvisited_children_in_stack(stack, path):
                     break
-                path.pop()
+                path.discard(trail.pop())
 
     # Target not found
     step_number += 1
@@ -110,7 +113,7 @@ def dfs_search(root: object | None, target: object) -> Iterator[AlgorithmStep]:
         step_number=step_number,
         action=f"Target {target} not found in tree",
         highlights=TreeHighlightContext(
-            visited_nodes=frozenset(visited),
+            visited_nodes=visited.freeze(),
         ),
         data=root,
         is_complete=True,
@@ -139,7 +142,7 @@ def dfs_traversal(root: object | None) -> Iterator[AlgorithmStep]:
         return
 
     step_number = 0
-    visited: set[int] = set()
+    visited = MarkLog()
     traversal_order: list[object] = []
 
     # Use iterative DFS with explicit stack
@@ -160,7 +163,7 @@ def dfs_traversal(root: object | None) -> Iterator[AlgorithmStep]:
             action=f"Visit node with value {node_value}",
             highlights=TreeHighlightContext(
                 current_node=node_id,
-                visited_nodes=frozenset(visited),
+                visited_nodes=visited.freeze(),
             ),
             data=root,
             is_complete=False,
@@ -182,7 +185,7 @@ def dfs_traversal(root: object | None) -> Iterator[AlgorithmStep]:
         step_number=step_number,
         action=f"DFS traversal complete. Order: {traversal_order}",
         highlights=TreeHighlightContext(
-            visited_nodes=frozenset(visited),
+            visited_nodes=visited.freeze(),
         ),
         data=root,
         is_complete=True,
@@ -197,10 +200,6 @@ def _get_value(node: object) -> object:
     return getattr(node, "data")
 
 
-def _has_unvisited_children_in_stack(stack: list[object], path: list[int]) -> bool:
+def _has_unvisited_children_in_stack(stack: list[object], path: MarkLog) -> bool:
     """Check if any node in the stack is a descendant of a path node."""
-    path_set = set(path)
-    for node in stack:
-        if id(node) in path_set:
-            return True
-    return False
+    return any(id(node) in path for node in stack)
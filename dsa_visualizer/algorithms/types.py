@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
+from dsa_visualizer.algorithms.marks import MarkSet
+
 
 @dataclass(frozen=True)
 class HighlightContext:
@@ -17,14 +20,20 @@ class HighlightContext:
     comparing: frozenset[int] = field(default_factory=frozenset)
     """Indices being compared."""
 
-    visited: frozenset[int] = field(default_factory=frozenset)
-    """Indices already visited/processed."""
+    visited: frozenset[int] | MarkSet = field(default_factory=frozenset)
+    """Indices already visited/processed.
+
+    Generators pass a ``MarkSet`` view so steps share one record.
+    """
 
     found: frozenset[int] = field(default_factory=frozenset)
     """Indices where a match was found."""
 
-    eliminated: frozenset[int] = field(default_factory=frozenset)
-    """Indices ruled out (e.g., binary search elimination)."""
+    eliminated: frozenset[int] | range = field(default_factory=frozenset)
+    """Indices ruled out (e.g., binary search elimination).
+
+    A contiguous run may be given as a range so it stays O(1) in size.
+    """
 
     boundaries: tuple[int, int] | None = None
     """Search range boundaries (low, high) if applicable."""
@@ -40,14 +49,17 @@ class TreeHighlightContext:
     current_node: int | None = None
     """Python id() of the node currently being examined."""
 
-    visited_nodes: frozenset[int] = field(default_factory=frozenset)
+    visited_nodes: frozenset[int] | MarkSet = field(default_factory=frozenset)
     """Python id() values of nodes already visited."""
 
     found_node: int | None = None
     """Python id() of the node where target was found."""
 
-    path_nodes: tuple[int, ...] = ()
-    """Python id() values of nodes in the current path (for traversal visualization)."""
+    path_nodes: tuple[int, ...] | MarkSet = ()
+    """Python id() values of nodes in the current path (for traversal visualization).
+
+    A ``MarkSet`` iterates in path order.
+    """
 
     comparing_node: int | None = None
     """Python id() of node being compared."""
@@ -70,11 +82,49 @@ class AlgorithmStep:
     highlights: HighlightContext
     """What to highlight in the visualization."""
 
-    data: list | object
-    """Current state of the data being operated on."""
+    data: Sequence | object
+    """The data being operated on.
+
+    Every step of an array run shares one read-only base sequence instead
+    of copying it; changes are recorded in ``writes``.
+    ``AlgorithmRunner.data_at`` rebuilds the array as it is after a step.
+    """
 
     is_complete: bool = False
     """True if the algorithm has finished."""
 
     result: object | None = None
     """Final result (only meaningful when is_complete=True)."""
+
+    writes: tuple[tuple[int, object], ...] = ()
+    """``(index, value)`` writes this step made to the array, in order.
+
+    Empty for searches; a swap is two writes.
+    """
+
+
+@dataclass(frozen=True)
+class AlgorithmFrame:
+    """A rendered algorithm step, ready to be displayed by the UI.
+
+    Frames carry only plain strings and numbers so they can be sent
+    across a process boundary (see ``dsa_visualizer.core.kernel``).
+    """
+
+    name: str
+    """Name of the algorithm being run."""
+
+    step_number: int
+    """1-indexed position of this step in the run."""
+
+    total_steps: int | None
+    """Total step count if known (generator exhausted), else None."""
+
+    action: str
+    """Human-readable description of this step."""
+
+    is_complete: bool = False
+    """True if the algorithm has finished."""
+
+    content: str | None = None
+    """Rendered visualization, or None if the data has no array view."""
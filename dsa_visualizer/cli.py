@@ -0,0 +1,148 @@
+"""Command-line entry point.
+
+``dsa`` with no arguments starts the interactive notebook. ``dsa run``
+executes scripts headlessly and prints the rendered memory deltas, and
+``dsa grade`` grades a directory of scripts in parallel; neither imports
+Textual.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import TextIO
+
+from dsa_visualizer.core.budget import ExecutionBudget
+from dsa_visualizer.core.grader import DEFAULT_TIMEOUT, grade_directory
+from dsa_visualizer.core.script import ScriptCell, run_script
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="dsa",
+        description="Visualize data structures and algorithms as ASCII diagrams.",
+    )
+    commands = parser.add_subparsers(dest="command")
+    run = commands.add_parser(
+        "run", help="run scripts cell by cell and print the memory deltas"
+    )
+    run.add_argument("scripts", nargs="+", type=Path, help="Python scripts to run")
+    run.add_argument(
+        "--format",
+        choices=("text", "jsonl"),
+        default="text",
+        help="output format (default: text)",
+    )
+    add_budget_arguments(run)
+
+    grade = commands.add_parser(
+        "grade", help="grade a directory of scripts in parallel into one JSONL file"
+    )
+    grade.add_argument("directory", type=Path, help="directory of scripts")
+    grade.add_argument(
+        "-o", "--output", type=Path, default=Path("grades.jsonl"),
+        help="JSONL file to write (default: grades.jsonl)",
+    )
+    grade.add_argument(
+        "--pattern", default="*.py", help="glob for scripts (default: *.py)"
+    )
+    grade.add_argument(
+        "-j", "--workers", type=int, help="worker processes (default: CPU count)"
+    )
+    grade.add_argument(
+        "--timeout", type=float, default=DEFAULT_TIMEOUT, metavar="SECONDS",
+        help=f"per-script timeout (default: {DEFAULT_TIMEOUT:g})",
+    )
+    add_budget_arguments(grade)
+    return parser
+
+
+def add_budget_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the per-cell budget options shared by the batch commands."""
+    group = parser.add_argument_group("per-cell budgets")
+    group.add_argument("--wall-time", type=float, metavar="SECONDS")
+    group.add_argument("--cpu-time", type=float, metavar="SECONDS")
+    group.add_argument("--memory", type=int, metavar="BYTES")
+    group.add_argument("--instructions", type=int, metavar="COUNT")
+
+
+def budget_from_args(args: argparse.Namespace) -> ExecutionBudget | None:
+    budget = ExecutionBudget(
+        wall_time=args.wall_time,
+        cpu_time=args.cpu_time,
+        memory=args.memory,
+        instructions=args.instructions,
+    )
+    if budget == ExecutionBudget():
+        return None
+    return budget
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "run":
+        return _run(args, sys.stdout)
+    if args.command == "grade":
+        return _grade(args)
+
+    # Imported lazily so the batch commands never load Textual.
+    from dsa_visualizer.main import main as run_app
+
+    run_app()
+    return 0
+
+
+def _run(args: argparse.Namespace, out: TextIO) -> int:
+    budget = budget_from_args(args)
+    status = 0
+    for path in args.scripts:
+        try:
+            source = path.read_text(encoding="utf-8")
+        except OSError as exc:
+            print(f"dsa run: {exc}", file=sys.stderr)
+            status = 2
+            continue
+        for cell in run_script(source, budget):
+            if not cell.ok:
+                status = max(status, 1)
+            if args.format == "jsonl":
+                _write_jsonl(out, path, cell)
+            else:
+                _write_text(out, path, cell)
+    return status
+
+
+def _grade(args: argparse.Namespace) -> int:
+    if not args.directory.is_dir():
+        print(f"dsa grade: not a directory: {args.directory}", file=sys.stderr)
+        return 2
+    failed = grade_directory(
+        args.directory,
+        args.output,
+        pattern=args.pattern,
+        workers=args.workers,
+        timeout=args.timeout or None,
+        budget=budget_from_args(args),
+    )
+    return 1 if failed else 0
+
+
+def _write_text(out: TextIO, path: Path, cell: ScriptCell) -> None:
+    out.write(f"# {path}:{cell.line} [{cell.index}]\n")
+    out.write(f"{cell.code}\n")
+    if cell.ok:
+        out.write(f"{cell.output}\n\n")
+    else:
+        out.write(f"Error: {cell.error}\n\n")
+
+
+def _write_jsonl(out: TextIO, path: Path, cell: ScriptCell) -> None:
+    record = {"script": str(path), **asdict(cell)}
+    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+"""Per-cell resource budgets.
+
+A ``BudgetMeter`` wraps the execution of one cell. It always measures wall
+and CPU time, and enforces whichever limits the ``ExecutionBudget`` sets:
+
+- wall time, CPU time and bytecode instructions through an event counter
+  (``sys.monitoring`` on Python 3.12+, ``sys.settrace`` otherwise) that only
+  counts the thread the meter was entered on;
+- CPU time and memory through ``RLIMIT_CPU``/``RLIMIT_AS`` as a backstop for
+  work done in C code, when the ``resource`` module is available and the cell
+  runs on the main thread.
+
+Memory use is measured per cell: with ``tracemalloc`` while a memory budget
+is set, and as the change in resident set size otherwise.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import signal
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from types import FrameType, TracebackType
+from typing import TYPE_CHECKING
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+if TYPE_CHECKING:
+    from typing import Self
+
+MONITORING_TOOL_ID = 4
+"""sys.monitoring tool id (ids 0-2 and 5 are reserved for debuggers,
+coverage, profilers and optimizers)."""
+
+CHECK_INTERVAL = 1024
+"""Events counted between two clock checks."""
+
+
+class BudgetExceeded(BaseException):
+    """Raised inside a cell when it runs past one of its budgets.
+
+    Like KeyboardInterrupt it derives from BaseException, so a cell's own
+    ``except Exception`` handlers cannot swallow it.
+    """
+
+
+@dataclass(frozen=True)
+class ExecutionBudget:
+    """Limits applied to a single cell. ``None`` disables a limit."""
+
+    wall_time: float | None = None
+    """Seconds of elapsed time."""
+
+    cpu_time: float | None = None
+    """Seconds of process CPU time."""
+
+    memory: int | None = None
+    """Bytes of address space the cell may add."""
+
+    instructions: int | None = None
+    """Bytecode instructions the cell may execute."""
+
+
+@dataclass(frozen=True)
+class ResourceUsage:
+    """What a cell actually consumed."""
+
+    wall_time: float
+    """Seconds of elapsed time."""
+
+    cpu_time: float
+    """Seconds of process CPU time."""
+
+    memory: int | None = None
+    """Bytes the cell added: its peak traced allocations under a memory
+    budget, the growth of the resident set otherwise (None if unavailable)."""
+
+    instructions: int | None = None
+    """Bytecode instructions executed (only counted under an instruction budget)."""
+
+
+class BudgetMeter:
+    """Context manager that measures and limits the code run inside it."""
+
+    def __init__(self, budget: ExecutionBudget | None = None) -> None:
+        self.budget = budget or ExecutionBudget()
+        self.usage: ResourceUsage | None = None
+        self._counter: _EventCounter | None = None
+        self._restore: list = []
+        self._tracing = False
+
+    def __enter__(self) -> Self:
+        budget = self.budget
+        if budget.memory is not None:
+            self._start_tracing()
+        else:
+            self._rss = _resident_set()
+        if budget.wall_time is not None or budget.cpu_time is not None or (
+            budget.instructions is not None
+        ):
+            self._counter = _EventCounter(budget)
+        if threading.current_thread() is threading.main_thread():
+            self._apply_rlimits()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        if self._counter is not None:
+            self._counter.start(self._wall_start, self._cpu_start)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self._counter is not None:
+            self._counter.stop()
+        wall = time.perf_counter() - self._wall_start
+        cpu = time.process_time() - self._cpu_start
+        while self._restore:
+            self._restore.pop()()
+        memory = self._memory_used()
+        instructions = None
+        if self._counter is not None and self.budget.instructions is not None:
+            instructions = self._counter.count
+        self.usage = ResourceUsage(wall, cpu, memory, instructions)
+        if isinstance(exc, MemoryError) and self.budget.memory is not None:
+            raise BudgetExceeded(
+                f"Memory budget of {self.budget.memory} bytes exceeded"
+            ) from exc
+
+    def _start_tracing(self) -> None:
+        self._tracing = not tracemalloc.is_tracing()
+        if self._tracing:
+            tracemalloc.start()
+        else:
+            tracemalloc.reset_peak()
+        self._traced, _ = tracemalloc.get_traced_memory()
+
+    def _memory_used(self) -> int | None:
+        if self.budget.memory is None:
+            rss = _resident_set()
+            if rss is None or self._rss is None:
+                return None
+            return rss - self._rss
+        _, peak = tracemalloc.get_traced_memory()
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+        return peak - self._traced
+
+    def _apply_rlimits(self) -> None:
+        if resource is None:
+            return
+        budget = self.budget
+        if budget.cpu_time is not None and hasattr(signal, "SIGXCPU"):
+            used = resource.getrusage(resource.RUSAGE_SELF)
+            spent = used.ru_utime + used.ru_stime
+            # Whole seconds only; the event counter handles the fine grain.
+            limit = math.ceil(spent + budget.cpu_time) + 1
+            self._lower_rlimit(resource.RLIMIT_CPU, limit)
+            previous = signal.signal(signal.SIGXCPU, _raise_cpu_exceeded)
+            self._restore.append(lambda: signal.signal(signal.SIGXCPU, previous))
+        if budget.memory is not None:
+            current = _address_space()
+            if current is not None:
+                self._lower_rlimit(resource.RLIMIT_AS, current + budget.memory)
+
+    def _lower_rlimit(self, which: int, limit: int) -> None:
+        soft, hard = resource.getrlimit(which)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        if soft != resource.RLIM_INFINITY and soft <= limit:
+            return
+        resource.setrlimit(which, (limit, hard))
+        self._restore.append(lambda: resource.setrlimit(which, (soft, hard)))
+
+
+class _EventCounter:
+    """Counts bytecode events and checks the clocks every CHECK_INTERVAL.
+
+    ``sys.monitoring`` reports events from every thread, so events of
+    threads other than the one that started the counter (the render and
+    prefetch workers) are ignored.
+    """
+
+    def __init__(self, budget: ExecutionBudget) -> None:
+        self.budget = budget
+        self.count = 0
+        self._next_check = CHECK_INTERVAL
+        self._opcodes = budget.instructions is not None
+        self._active = False
+        self._monitoring = False
+        self._previous_trace = None
+        self._thread = threading.get_ident()
+        # Frames already running at start, with the trace state to restore.
+        self._traced_frames: list[tuple[FrameType, object, bool]] = []
+
+    def start(self, wall_start: float, cpu_start: float) -> None:
+        budget = self.budget
+        self._wall_deadline = (
+            wall_start + budget.wall_time if budget.wall_time is not None else None
+        )
+        self._cpu_deadline = (
+            cpu_start + budget.cpu_time if budget.cpu_time is not None else None
+        )
+        self._active = True
+        monitoring = getattr(sys, "monitoring", None)
+        if monitoring is not None:
+            try:
+                monitoring.use_tool_id(MONITORING_TOOL_ID, "dsa-budget")
+            except ValueError:
+                monitoring = None
+        if monitoring is not None:
+            self._monitoring = True
+            event = monitoring.events.INSTRUCTION if self._opcodes else (
+                monitoring.events.LINE
+            )
+            monitoring.register_callback(MONITORING_TOOL_ID, event, self._on_event)
+            monitoring.set_events(MONITORING_TOOL_ID, event)
+        else:
+            self._previous_trace = sys.gettrace()
+            sys.settrace(self._global_trace)
+            # settrace only reaches frames entered from now on; the code
+            # inside the meter runs in a frame that is already running.
+            frame = sys._getframe(1)
+            while frame is not None:
+                self._traced_frames.append(
+                    (frame, frame.f_trace, frame.f_trace_opcodes)
+                )
+                frame.f_trace = self._local_trace
+                frame.f_trace_opcodes = self._opcodes
+                frame = frame.f_back
+
+    def stop(self) -> None:
+        if not self._active:
+            return
+        self._active = False
+        if self._monitoring:
+            monitoring = sys.monitoring
+            monitoring.set_events(MONITORING_TOOL_ID, 0)
+            for event in (monitoring.events.INSTRUCTION, monitoring.events.LINE):
+                monitoring.register_callback(MONITORING_TOOL_ID, event, None)
+            monitoring.free_tool_id(MONITORING_TOOL_ID)
+            self._monitoring = False
+        else:
+            sys.settrace(self._previous_trace)
+            for frame, trace, opcodes in self._traced_frames:
+                frame.f_trace = trace
+                frame.f_trace_opcodes = opcodes
+            self._traced_frames.clear()
+
+    def _on_event(self, *args: object) -> None:
+        if threading.get_ident() != self._thread:
+            return
+        self.count += 1
+        if self.count >= self._next_check:
+            self._check()
+
+    def _global_trace(self, frame: FrameType, event: str, arg: object):
+        frame.f_trace_opcodes = self._opcodes
+        return self._local_trace
+
+    def _local_trace(self, frame: FrameType, event: str, arg: object):
+        if self._opcodes:
+            # Must be re-armed on line events for CPython to emit opcodes.
+            frame.f_trace_opcodes = True
+            counted = event == "opcode"
+        else:
+            counted = event == "line"
+        if counted:
+            self.count += 1
+            if self.count >= self._next_check:
+                self._check()
+        return self._local_trace
+
+    def _check(self) -> None:
+        # After a failure the next check is a full interval away, which
+        # leaves room for the cell to unwind but re-raises if it keeps going.
+        budget = self.budget
+        self._next_check = self.count + CHECK_INTERVAL
+        if budget.instructions is not None:
+            if self.count > budget.instructions:
+                raise BudgetExceeded(
+                    f"Instruction budget of {budget.instructions} exceeded"
+                )
+            self._next_check = min(self._next_check, budget.instructions + 1)
+        if self._wall_deadline is not None and time.perf_counter() > self._wall_deadline:
+            raise BudgetExceeded(f"Wall-time budget of {budget.wall_time}s exceeded")
+        if self._cpu_deadline is not None and time.process_time() > self._cpu_deadline:
+            raise BudgetExceeded(f"CPU-time budget of {budget.cpu_time}s exceeded")
+
+
+def _raise_cpu_exceeded(signum: int, frame: FrameType | None) -> None:
+    raise BudgetExceeded("CPU-time budget exceeded")
+
+
+def _resident_set() -> int | None:
+    """Current resident set size in bytes, if the platform exposes it."""
+    return _statm_bytes(1)
+
+
+def _address_space() -> int | None:
+    """Current virtual memory size in bytes, if the platform exposes it."""
+    return _statm_bytes(0)
+
+
+def _statm_bytes(field: int) -> int | None:
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[field])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
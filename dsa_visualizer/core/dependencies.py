@@ -0,0 +1,157 @@
+"""Def/use graph over executed cells.
+
+Each executed cell is recorded with its ``CellEffects``. When a cell is
+edited, ``DependencyGraph.plan_rerun`` works out which cells have to run
+again, in notebook order, to bring the namespace to the state a full
+replay would produce, without replaying cells that cannot be affected.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from dsa_visualizer.core.effects import DYNAMIC_NAMES, CellEffects
+
+
+@dataclass(frozen=True)
+class CellNode:
+    """One executed cell in the graph."""
+
+    cell_id: int
+    source: str
+    effects: CellEffects
+
+    @property
+    def defs(self) -> frozenset[str]:
+        """Names whose value or contents the cell may change."""
+        effects = self.effects
+        return effects.binds | effects.deletes | effects.mutates
+
+    @property
+    def reads(self) -> frozenset[str]:
+        """Names whose current value the cell depends on."""
+        return self.effects.uses | self.effects.mutates
+
+    @property
+    def opaque_reads(self) -> bool:
+        """Whether the cell may read names the analysis cannot see."""
+        return bool(self.effects.uses & DYNAMIC_NAMES)
+
+    @property
+    def stateful(self) -> frozenset[str]:
+        """Names the cell updates relative to their previous value.
+
+        Re-running such a cell on its own would apply the update twice
+        (``arr.append(x)``, ``n += 1``), so the cells that produced the
+        previous value must run again first.
+        """
+        effects = self.effects
+        return effects.mutates | (effects.uses & effects.binds)
+
+
+class DependencyGraph:
+    """Cells in execution order, with the names each defines and reads."""
+
+    def __init__(self) -> None:
+        self._nodes: dict[int, CellNode] = {}
+
+    def __contains__(self, cell_id: int) -> bool:
+        return cell_id in self._nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def nodes(self) -> list[CellNode]:
+        """Recorded cells in execution order."""
+        return list(self._nodes.values())
+
+    def get(self, cell_id: int) -> CellNode | None:
+        return self._nodes.get(cell_id)
+
+    def record(self, cell_id: int, source: str, effects: CellEffects) -> None:
+        """Add a newly executed cell, or replace an edited one in place."""
+        self._nodes[cell_id] = CellNode(cell_id, source, effects)
+
+    def clear(self) -> None:
+        self._nodes.clear()
+
+    def plan_rerun(self, cell_id: int, effects: CellEffects) -> list[int]:
+        """Cells to run, in order, after ``cell_id`` is edited.
+
+        ``effects`` are those of the edited source. The plan includes every
+        later cell that reads a name affected so far, and every earlier cell
+        that produced state a planned cell updates in place. Cells using
+        exec/eval/globals() always run, and a dynamic cell in the plan makes
+        every later cell run too.
+        """
+        if cell_id not in self._nodes:
+            return [cell_id]
+        old = self._nodes[cell_id]
+        nodes = dict(self._nodes)
+        nodes[cell_id] = CellNode(cell_id, old.source, _merge(old.effects, effects))
+        order = list(nodes)
+
+        seeds = {cell_id}
+        while True:
+            plan = _forward(nodes, order, seeds)
+            required = set(seeds)
+            for planned in plan:
+                _add_producers(nodes, order, order.index(planned), required)
+            if required <= seeds:
+                return plan
+            seeds |= required
+
+
+def _forward(
+    nodes: dict[int, CellNode], order: list[int], seeds: set[int]
+) -> list[int]:
+    """Seeds plus every later cell that reads what the plan changes."""
+    start = min(order.index(seed) for seed in seeds)
+    affected: set[str] = set()
+    plan: list[int] = []
+    replay_all = False
+    for current in order[start:]:
+        node = nodes[current]
+        if replay_all or current in seeds or node.reads & affected or (
+            node.opaque_reads
+        ):
+            plan.append(current)
+            affected |= node.defs
+            if node.effects.dynamic:
+                replay_all = True
+    return plan
+
+
+def _add_producers(
+    nodes: dict[int, CellNode], order: list[int], position: int, seeds: set[int]
+) -> None:
+    """Add the earlier cells that produced the state a cell updates."""
+    node = nodes[order[position]]
+    if node.effects.dynamic:
+        # Unknown effects: replay from the first cell.
+        seeds.update(order[:position])
+        return
+    for name in node.stateful:
+        for index in range(position - 1, -1, -1):
+            producer = nodes[order[index]]
+            if name in producer.defs:
+                if producer.cell_id not in seeds:
+                    seeds.add(producer.cell_id)
+                    _add_producers(nodes, order, index, seeds)
+                break
+            if producer.effects.dynamic:
+                seeds.update(order[: index + 1])
+                break
+
+
+def _merge(first: CellEffects, second: CellEffects) -> CellEffects:
+    """Effects of either version of an edited cell."""
+    return CellEffects(
+        binds=first.binds | second.binds,
+        deletes=first.deletes | second.deletes,
+        mutates=first.mutates | second.mutates,
+        writes=first.writes | second.writes,
+        uses=first.uses | second.uses,
+        calls=first.calls | second.calls,
+        dynamic=first.dynamic or second.dynamic,
+    )
@@ -0,0 +1,348 @@
+"""Static analysis of which global names a cell can affect.
+
+``analyze_cell`` walks a cell's module AST once and records the names it
+binds, deletes, may mutate and reads. The Session uses this to re-snapshot
+only the touched names instead of every global. The analysis is
+conservative: when a cell can reach the namespace indirectly (``exec``,
+``globals()``, star imports, calls into user-defined functions or classes,
+calls through anything but a builtin or a name's method) it is marked
+``dynamic`` and the caller falls back to a full scan.
+"""
+
+from __future__ import annotations
+
+import ast
+import builtins
+import functools
+import types
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, replace
+
+DYNAMIC_NAMES = frozenset({
+    "exec",
+    "eval",
+    "globals",
+    "locals",
+    "vars",
+    "__import__",
+    "__builtins__",
+})
+"""Names whose use gives a cell indirect access to the namespace."""
+
+_READ_ONLY_CALLS = frozenset({
+    "all", "any", "bool", "dict", "enumerate", "frozenset", "hash", "id",
+    "isinstance", "iter", "len", "list", "max", "min", "print", "repr",
+    "reversed", "set", "sorted", "str", "sum", "tuple", "type", "zip",
+})
+"""Builtins that do not write into their arguments."""
+
+
+@dataclass(frozen=True)
+class CellEffects:
+    """Global names a cell binds, deletes, may mutate or reads."""
+
+    binds: frozenset[str] = frozenset()
+    deletes: frozenset[str] = frozenset()
+    mutates: frozenset[str] = frozenset()
+    """Names whose objects may change in place: method call receivers,
+    subscript/attribute targets and call arguments."""
+
+    writes: frozenset[str] = frozenset()
+    """The ``mutates`` names whose objects may change other than through
+    their own methods: subscript/attribute targets and call arguments."""
+
+    uses: frozenset[str] = frozenset()
+    """Names read by the cell, including those read inside its functions."""
+
+    calls: frozenset[str] = frozenset()
+    """Names the cell calls directly, outside its functions."""
+
+    dynamic: bool = False
+    """Whether the cell may touch names the analysis cannot see."""
+
+    @property
+    def scope(self) -> frozenset[str] | None:
+        """Names to re-snapshot, or None when a full scan is needed."""
+        if self.dynamic:
+            return None
+        return self.binds | self.deletes | self.mutates
+
+    def resolve(self, namespace: dict[str, object]) -> CellEffects:
+        """Mark the cell dynamic if it reads user-defined or hidden code.
+
+        Calling (or passing along) a function defined in the namespace runs
+        code the analysis never saw, which may rebind or mutate any global.
+        The same goes for a user-defined class, whose constructor and
+        methods are such functions, and for instances of one. Bound
+        methods, partials and lazy iterators (generators, ``map``) run code
+        on objects the cell does not name, and a called name must be a
+        plain function, a class or a builtin.
+        """
+        if self.dynamic:
+            return self
+        for name in self.uses:
+            value = namespace.get(name)
+            if _runs_user_code(value, namespace) or _runs_hidden_code(value):
+                return replace(self, dynamic=True)
+        for name in self.calls:
+            value = namespace.get(name, getattr(builtins, name, None))
+            if not _is_plain_callable(value):
+                return replace(self, dynamic=True)
+        return self
+
+
+def analyze_cell(tree: ast.Module) -> CellEffects:
+    """Collect the effects of a parsed cell on module-level names."""
+    visitor = _EffectsVisitor()
+    for statement in tree.body:
+        visitor.visit(statement)
+    return CellEffects(
+        binds=frozenset(visitor.binds),
+        deletes=frozenset(visitor.deletes),
+        mutates=frozenset(visitor.mutates),
+        writes=frozenset(visitor.writes),
+        uses=frozenset(visitor.uses),
+        calls=frozenset(visitor.calls),
+        dynamic=visitor.dynamic,
+    )
+
+
+def _runs_user_code(value: object, namespace: dict[str, object]) -> bool:
+    """Whether ``value`` is, or has methods that are, functions of ``namespace``."""
+    if isinstance(value, types.MethodType):
+        value = value.__func__
+    if isinstance(value, types.FunctionType):
+        return value.__globals__ is namespace
+    cls = value if isinstance(value, type) else type(value)
+    return any(
+        _defines_user_code(vars(base), namespace) for base in cls.__mro__[:-1]
+    )
+
+
+def _runs_hidden_code(value: object) -> bool:
+    """Whether using ``value`` may run code on objects it hides."""
+    if isinstance(value, (types.MethodType, functools.partial, Iterator)):
+        return True
+    return isinstance(value, types.BuiltinMethodType) and not _is_module_level(value)
+
+
+def _is_plain_callable(value: object) -> bool:
+    if isinstance(value, (type, types.FunctionType)):
+        return True
+    return isinstance(value, types.BuiltinFunctionType) and _is_module_level(value)
+
+
+def _is_module_level(function: types.BuiltinFunctionType) -> bool:
+    owner = function.__self__
+    return owner is None or isinstance(owner, types.ModuleType)
+
+
+def _defines_user_code(
+    attributes: Mapping[str, object], namespace: dict[str, object]
+) -> bool:
+    for attribute in attributes.values():
+        if isinstance(attribute, (staticmethod, classmethod)):
+            attribute = attribute.__func__
+        elif isinstance(attribute, property):
+            if any(
+                _runs_user_code(accessor, namespace)
+                for accessor in (attribute.fget, attribute.fset, attribute.fdel)
+                if accessor is not None
+            ):
+                return True
+            continue
+        if (
+            isinstance(attribute, types.FunctionType)
+            and attribute.__globals__ is namespace
+        ):
+            return True
+    return False
+
+
+def _root_name(node: ast.expr) -> str | None:
+    """The name at the root of ``a.b[c].d``-style expressions."""
+    while isinstance(node, (ast.Attribute, ast.Subscript, ast.Starred)):
+        node = node.value
+    if isinstance(node, ast.Name):
+        return node.id
+    return None
+
+
+_MODULE = "module"
+_CLASS = "class"
+_FUNCTION = "function"
+_COMPREHENSION = "comprehension"
+
+
+class _EffectsVisitor(ast.NodeVisitor):
+    def __init__(self) -> None:
+        self.binds: set[str] = set()
+        self.deletes: set[str] = set()
+        self.mutates: set[str] = set()
+        self.writes: set[str] = set()
+        self.uses: set[str] = set()
+        self.calls: set[str] = set()
+        self.dynamic = False
+        self._scopes = [_MODULE]
+        # Function and lambda bodies only run when called, so they
+        # contribute uses but no effects.
+        self._deferred = 0
+
+    def _in_scope(self, kind: str, nodes: list[ast.AST]) -> None:
+        self._scopes.append(kind)
+        self._deferred += kind == _FUNCTION
+        try:
+            for node in nodes:
+                self.visit(node)
+        finally:
+            self._deferred -= kind == _FUNCTION
+            self._scopes.pop()
+
+    def _mutate(self, node: ast.expr, *, write: bool = True) -> None:
+        name = _root_name(node)
+        if name is not None and not self._deferred:
+            self.mutates.add(name)
+            if write:
+                self.writes.add(name)
+
+    def visit_Name(self, node: ast.Name) -> None:
+        if isinstance(node.ctx, ast.Load):
+            self.uses.add(node.id)
+            if node.id in DYNAMIC_NAMES:
+                self.dynamic = True
+        elif isinstance(node.ctx, ast.Store):
+            self._bind(node.id)
+        elif self._scopes[-1] == _MODULE:
+            self.deletes.add(node.id)
+
+    def _visit_container(self, node: ast.Attribute | ast.Subscript) -> None:
+        if not isinstance(node.ctx, ast.Load):
+            self._mutate(node.value)
+        self.generic_visit(node)
+
+    visit_Attribute = _visit_container
+    visit_Subscript = _visit_container
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:
+        # ``x += y`` reads x and may mutate it in place as well as rebind it.
+        self._mutate(node.target)
+        if isinstance(node.target, ast.Name):
+            self.uses.add(node.target.id)
+        self.generic_visit(node)
+
+    def visit_NamedExpr(self, node: ast.NamedExpr) -> None:
+        # The walrus binds in the nearest scope that is not a comprehension.
+        self.visit(node.value)
+        scope = next(
+            kind for kind in reversed(self._scopes) if kind != _COMPREHENSION
+        )
+        if scope == _MODULE and isinstance(node.target, ast.Name):
+            self.binds.add(node.target.id)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        if not self._deferred:
+            self._note_callee(node.func)
+        if isinstance(node.func, ast.Attribute):
+            # A structure's own methods bump its version; a method of
+            # something inside it (``ll.head.data.append``) does not.
+            self._mutate(
+                node.func.value, write=not isinstance(node.func.value, ast.Name)
+            )
+        write = not (
+            isinstance(node.func, ast.Name) and node.func.id in _READ_ONLY_CALLS
+        )
+        for argument in node.args:
+            self._mutate(argument, write=write)
+        for keyword in node.keywords:
+            self._mutate(keyword.value, write=write)
+        self.generic_visit(node)
+
+    def _note_callee(self, callee: ast.expr) -> None:
+        if isinstance(callee, ast.Name):
+            self.calls.add(callee.id)
+        elif not (
+            isinstance(callee, ast.Attribute)
+            and isinstance(callee.value, (ast.Name, ast.Constant))
+        ):
+            # ``fns[0]()``, ``make()()``, ``a.b.c()``: which code runs
+            # cannot be told from the names alone.
+            self.dynamic = True
+
+    def _bind(self, name: str | None) -> None:
+        if name is not None and self._scopes[-1] == _MODULE:
+            self.binds.add(name)
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
+        # ``except E as e`` binds e and unbinds it again afterwards.
+        self._bind(node.name)
+        self.generic_visit(node)
+
+    def _visit_capture(
+        self, node: ast.MatchAs | ast.MatchStar | ast.MatchMapping
+    ) -> None:
+        self._bind(node.rest if isinstance(node, ast.MatchMapping) else node.name)
+        self.generic_visit(node)
+
+    visit_MatchAs = _visit_capture
+    visit_MatchStar = _visit_capture
+    visit_MatchMapping = _visit_capture
+
+    def _visit_import(self, node: ast.Import | ast.ImportFrom) -> None:
+        for alias in node.names:
+            if alias.name == "*":
+                self.dynamic = True
+            else:
+                self._bind(alias.asname or alias.name.split(".")[0])
+
+    visit_Import = _visit_import
+    visit_ImportFrom = _visit_import
+
+    def _visit_definition(
+        self, node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef
+    ) -> None:
+        self._bind(node.name)
+        for decorator in node.decorator_list:
+            self.visit(decorator)
+        if isinstance(node, ast.ClassDef):
+            for base in [*node.bases, *node.keywords]:
+                self.visit(base)
+            self._in_scope(_CLASS, node.body)
+            return
+        self.visit(node.args)
+        if node.returns is not None:
+            self.visit(node.returns)
+        self._in_scope(_FUNCTION, node.body)
+
+    visit_FunctionDef = _visit_definition
+    visit_AsyncFunctionDef = _visit_definition
+    visit_ClassDef = _visit_definition
+
+    def visit_arguments(self, node: ast.arguments) -> None:
+        # Only defaults (and annotations) are evaluated at definition time.
+        for default in [*node.defaults, *node.kw_defaults]:
+            if default is not None:
+                self.visit(default)
+
+    def visit_Lambda(self, node: ast.Lambda) -> None:
+        self.visit(node.args)
+        self._in_scope(_FUNCTION, [node.body])
+
+    def _visit_comprehension(
+        self, node: ast.ListComp | ast.SetComp | ast.DictComp | ast.GeneratorExp
+    ) -> None:
+        # The first iterable is evaluated in the enclosing scope.
+        generators = node.generators
+        self.visit(generators[0].iter)
+        parts: list[ast.AST] = [generators[0].target, *generators[0].ifs]
+        for generator in generators[1:]:
+            parts.extend([generator.iter, generator.target, *generator.ifs])
+        if isinstance(node, ast.DictComp):
+            parts.extend([node.key, node.value])
+        else:
+            parts.append(node.elt)
+        self._in_scope(_COMPREHENSION, parts)
+
+    visit_ListComp = _visit_comprehension
+    visit_SetComp = _visit_comprehension
+    visit_DictComp = _visit_comprehension
+    visit_GeneratorExp = _visit_comprehension
@@ -1,19 +1,32 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
+import array
+import ast
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    MutableSequence,
+    Sequence,
+)
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from dsa_visualizer.algorithms.runner import AlgorithmRunner
-from dsa_visualizer.algorithms.search.binary import binary_search
-from dsa_visualizer.algorithms.search.exponential import exponential_search
-from dsa_visualizer.algorithms.search.interpolation import interpolation_search
-from dsa_visualizer.algorithms.search.jump import jump_search
-from dsa_visualizer.algorithms.search.linear import linear_search
-from dsa_visualizer.algorithms.tree.bfs import bfs_search, bfs_traversal
-from dsa_visualizer.algorithms.tree.bst_search import bst_search
-from dsa_visualizer.algorithms.tree.dfs import dfs_search, dfs_traversal
 from dsa_visualizer.algorithms.types import AlgorithmStep
+from dsa_visualizer.core.budget import (
+    BudgetExceeded,
+    BudgetMeter,
+    ExecutionBudget,
+    ResourceUsage,
+)
+from dsa_visualizer.core.effects import CellEffects, analyze_cell
+from dsa_visualizer.core.registry import (
+    SEARCH_GROUP,
+    TREE_SEARCH_GROUP,
+    TREE_TRAVERSAL_GROUP,
+    LazyRegistry,
+)
 from dsa_visualizer.data_structures.implementations.structures import (
     BinarySearchTree,
     BinaryTree,
@@ -25,15 +38,28 @@ from dsa_visualizer.data_structures.implementations.structures import (
     Stack,
 )
 
+if TYPE_CHECKING:
+    from dsa_visualizer.algorithms.batch import BatchSearchResult
+
+
+# Registry of available search algorithms (modules are imported on first use;
+# plugins add more through the "dsa_visualizer.search" entry point group)
+SEARCH_ALGORITHMS: LazyRegistry[Callable[[Sequence, Any], Iterator[AlgorithmStep]]] = (
+    LazyRegistry(SEARCH_GROUP, {
+        "linear": "dsa_visualizer.algorithms.search.linear:linear_search",
+        "binary": "dsa_visualizer.algorithms.search.binary:binary_search",
+        "jump": "dsa_visualizer.algorithms.search.jump:jump_search",
+        "interpolation": (
+            "dsa_visualizer.algorithms.search.interpolation:interpolation_search"
+        ),
+        "exponential": (
+            "dsa_visualizer.algorithms.search.exponential:exponential_search"
+        ),
+    })
+)
 
-# Registry of available search algorithms
-SEARCH_ALGORITHMS: dict[str, Callable[[list, Any], Iterator[AlgorithmStep]]] = {
-    "linear": linear_search,
-    "binary": binary_search,
-    "jump": jump_search,
-    "interpolation": interpolation_search,
-    "exponential": exponential_search,
-}
+# Search runs keep at most this many steps between keyframes in memory
+MAX_RETAINED_STEPS = 65_536
 
 # Algorithm display names
 ALGORITHM_NAMES: dict[str, str] = {
@@ -45,17 +71,21 @@ ALGORITHM_NAMES: dict[str, str] = {
 }
 
 # Registry of available tree search algorithms
-TREE_SEARCH_ALGORITHMS: dict[str, Callable[[object, Any], Iterator[AlgorithmStep]]] = {
-    "dfs": dfs_search,
-    "bfs": bfs_search,
-    "bst": bst_search,
-}
+TREE_SEARCH_ALGORITHMS: LazyRegistry[Callable[[object, Any], Iterator[AlgorithmStep]]] = (
+    LazyRegistry(TREE_SEARCH_GROUP, {
+        "dfs": "dsa_visualizer.algorithms.tree.dfs:dfs_search",
+        "bfs": "dsa_visualizer.algorithms.tree.bfs:bfs_search",
+        "bst": "dsa_visualizer.algorithms.tree.bst_search:bst_search",
+    })
+)
 
 # Tree traversal algorithms (no target needed)
-TREE_TRAVERSAL_ALGORITHMS: dict[str, Callable[[object], Iterator[AlgorithmStep]]] = {
-    "dfs": dfs_traversal,
-    "bfs": bfs_traversal,
-}
+TREE_TRAVERSAL_ALGORITHMS: LazyRegistry[Callable[[object], Iterator[AlgorithmStep]]] = (
+    LazyRegistry(TREE_TRAVERSAL_GROUP, {
+        "dfs": "dsa_visualizer.algorithms.tree.dfs:dfs_traversal",
+        "bfs": "dsa_visualizer.algorithms.tree.bfs:bfs_traversal",
+    })
+)
 
 # Tree algorithm display names
 TREE_ALGORITHM_NAMES: dict[str, str] = {
@@ -69,6 +99,8 @@ TREE_ALGORITHM_NAMES: dict[str, str] = {
 class ExecutionResult:
     ok: bool
     error: str | None = None
+    usage: ResourceUsage | None = None
+    effects: CellEffects | None = None
 
 
 @dataclass
@@ -97,7 +129,8 @@ EXAMPLE_TREES: dict[str, list] = {
 
 
 class Executor:
-    def __init__(self) -> None:
+    def __init__(self, budget: ExecutionBudget | None = None) -> None:
+        self.budget = budget
         self.globals: dict[str, object] = {
             "LinkedList": LinkedList,
             "DoublyLinkedList": DoublyLinkedList,
@@ -112,7 +145,9 @@ class Executor:
 
         # Add search functions to globals
         self.globals["search"] = self._create_search_function()
+        self.globals["search_many"] = _search_many
         self.globals["tree_search"] = self._create_tree_search_function()
+        self.globals["tree_search_many"] = _tree_search_many
         self.globals["tree_traverse"] = self._create_tree_traverse_function()
 
         # Add example datasets
@@ -124,12 +159,13 @@ class Executor:
     def _create_search_function(self) -> Callable:
         """Create the search function that users call."""
 
-        def search(algorithm: str, data: list, target: object) -> str:
+        def search(algorithm: str, data: Sequence, target: object) -> str:
             """Start a search algorithm visualization.
 
             Args:
                 algorithm: Algorithm name ("linear", "binary", etc.)
-                data: The array to search in.
+                data: The array to search in. Read-only sequences (range,
+                    tuple, read-only buffers) are used as they are.
                 target: The value to find.
 
             Returns:
@@ -144,15 +180,18 @@ class Executor:
                 )
 
             # Get algorithm generator
+            arr = _frozen_sequence(data)
             algo_func = SEARCH_ALGORITHMS[algorithm_lower]
-            generator = algo_func(list(data), target)
 
-            # Create runner
+            # Create runner; the array is frozen, so dropped steps can be
+            # regenerated from a fresh generator
             name = ALGORITHM_NAMES.get(algorithm_lower, algorithm)
-            runner = AlgorithmRunner.from_generator(name, generator)
+            runner = AlgorithmRunner.from_factory(
+                name, lambda: algo_func(arr, target), max_steps=MAX_RETAINED_STEPS
+            )
 
             # Store for app to pick up
-            self.pending_algorithm = PendingAlgorithm(runner=runner, data=list(data))
+            self.pending_algorithm = PendingAlgorithm(runner=runner, data=arr)
 
             return f"Starting {name} for target {target!r}..."
 
@@ -237,19 +276,117 @@ class Executor:
 
         return tree_traverse
 
-    def execute(self, source: str) -> ExecutionResult:
+    def execute(
+        self, source: str, budget: ExecutionBudget | None = None
+    ) -> ExecutionResult:
+        """Run source in the executor globals.
+
+        ``budget`` overrides the executor's default budget for this call.
+        The returned result reports the resources the cell consumed and,
+        unless the source did not compile, the names it may have affected.
+        """
         # Clear any pending algorithm before execution
         self.pending_algorithm = None
 
+        meter = BudgetMeter(budget or self.budget)
+        effects = None
         try:
-            compiled = compile(source, "<input>", "exec")
-            exec(compiled, self.globals)
-        except Exception as exc:  # noqa: BLE001 - surface error message to user
-            return ExecutionResult(False, str(exc))
-        return ExecutionResult(True, None)
+            # Parse once: the tree feeds both the effect analysis and compile.
+            tree = ast.parse(source, "<input>", "exec")
+            compiled = compile(tree, "<input>", "exec")
+            effects = analyze_cell(tree)
+            with meter:
+                exec(compiled, self.globals)
+        except (Exception, BudgetExceeded) as exc:  # noqa: BLE001 - surface error message to user
+            if effects is not None:
+                effects = effects.resolve(self.globals)
+            return ExecutionResult(False, str(exc), meter.usage, effects)
+        return ExecutionResult(True, None, meter.usage, effects.resolve(self.globals))
 
     def pop_pending_algorithm(self) -> PendingAlgorithm | None:
         """Get and clear any pending algorithm."""
         pending = self.pending_algorithm
         self.pending_algorithm = None
         return pending
+
+
+def _search_many(
+    algorithm: str, data: Sequence, targets: Iterable[object]
+) -> BatchSearchResult:
+    """Run a search algorithm for many targets without animating it.
+
+    Args:
+        algorithm: Algorithm name ("linear", "binary", etc.)
+        data: The array to search in.
+        targets: The values to find.
+
+    Returns:
+        Per-target results and step/comparison counts with their mean,
+        p95 and worst case.
+    """
+    algorithm_lower = algorithm.lower()
+    if algorithm_lower not in SEARCH_ALGORITHMS:
+        available = ", ".join(sorted(SEARCH_ALGORITHMS.keys()))
+        raise ValueError(
+            f"Unknown algorithm: {algorithm!r}. "
+            f"Available: {available}"
+        )
+    from dsa_visualizer.algorithms.batch import search_batch
+
+    name = ALGORITHM_NAMES.get(algorithm_lower, algorithm)
+    return search_batch(name, SEARCH_ALGORITHMS[algorithm_lower], data, targets)
+
+
+def _tree_search_many(
+    algorithm: str, tree: object, targets: Iterable[object]
+) -> BatchSearchResult:
+    """Run a tree search algorithm for many targets without animating it.
+
+    Args:
+        algorithm: Algorithm name ("dfs", "bfs", "bst")
+        tree: The tree to search in (BinaryTree or BinarySearchTree).
+        targets: The values to find.
+
+    Returns:
+        Per-target results and step/comparison counts with their mean,
+        p95 and worst case.
+    """
+    algorithm_lower = algorithm.lower()
+    if algorithm_lower not in TREE_SEARCH_ALGORITHMS:
+        available = ", ".join(sorted(TREE_SEARCH_ALGORITHMS.keys()))
+        raise ValueError(
+            f"Unknown algorithm: {algorithm!r}. "
+            f"Available: {available}"
+        )
+    from dsa_visualizer.algorithms.batch import search_batch
+
+    root = getattr(tree, "root", tree)
+    name = TREE_ALGORITHM_NAMES.get(algorithm_lower, algorithm)
+    return search_batch(
+        name, TREE_SEARCH_ALGORITHMS[algorithm_lower], root, targets
+    )
+
+
+def _frozen_sequence(data: object) -> Sequence:
+    """Return ``data`` as a sequence that later cells cannot change.
+
+    Read-only sequences are returned as they are, so a ``range`` or a
+    read-only buffer of any size costs nothing. Mutable ones are copied
+    once, keeping compact buffers (array.array, memoryview, NumPy arrays)
+    in their own representation.
+    """
+    if isinstance(data, (range, tuple, str, bytes)):
+        return data
+    if isinstance(data, memoryview):
+        if data.readonly:
+            return data
+        return memoryview(data.tobytes()).cast(data.format)
+    if isinstance(data, array.array):
+        return array.array(data.typecode, data)
+    flags = getattr(data, "flags", None)
+    if flags is not None and hasattr(data, "__array__"):
+        # NumPy array: share it when it cannot be written through.
+        return data if not flags.writeable else data.copy()
+    if isinstance(data, Sequence) and not isinstance(data, MutableSequence):
+        return data
+    return list(data)
@@ -0,0 +1,107 @@
+"""Step a running algorithm ahead of the animation on a worker thread.
+
+The UI asks for one frame per animation tick. Pulling the step from the
+generator and rendering it on demand makes a slow step a late tick, so a
+worker thread keeps a few frames ready instead and a tick only takes the
+oldest one.
+
+While a prefetcher runs it owns the runner; ``pause`` hands the runner
+back positioned at the last frame taken, and ``cancel`` drops it.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+
+from dsa_visualizer.algorithms.render.frames import render_frame
+from dsa_visualizer.algorithms.runner import AlgorithmRunner
+from dsa_visualizer.algorithms.types import AlgorithmFrame
+
+PREFETCH_DEPTH = 8
+"""Frames the worker renders ahead of the one shown."""
+
+
+class FramePrefetcher:
+    """Advances an ``AlgorithmRunner`` and renders its frames ahead of time.
+
+    At most ``depth`` frames wait in the queue; ``next`` takes the oldest,
+    blocking only when the worker has not caught up yet.
+    """
+
+    def __init__(self, runner: AlgorithmRunner, depth: int = PREFETCH_DEPTH) -> None:
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        self._runner = runner
+        self._depth = depth
+        self._condition = threading.Condition()
+        self._frames: deque[AlgorithmFrame] = deque()
+        self._shown = runner.current_index
+        self._done = False
+        self._error: BaseException | None = None
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name="dsa-prefetch", daemon=True
+        )
+        self._thread.start()
+
+    def next(self) -> AlgorithmFrame | None:
+        """The next step's frame, or None once the algorithm ran out.
+
+        An exception the algorithm raised is re-raised here, in order.
+        """
+        with self._condition:
+            while not self._frames and not self._done:
+                self._condition.wait()
+            if not self._frames:
+                if self._error is not None:
+                    raise self._error
+                return None
+            frame = self._frames.popleft()
+            self._shown += 1
+            self._condition.notify_all()
+            return frame
+
+    def pause(self) -> AlgorithmRunner:
+        """Stop the worker and return the runner at the last frame taken.
+
+        Frames rendered ahead are discarded; their steps stay collected.
+        """
+        self.cancel()
+        self._thread.join()
+        self._runner.current_index = self._shown
+        return self._runner
+
+    def cancel(self) -> None:
+        """Stop the worker after its current step, without waiting."""
+        with self._condition:
+            self._stopped = True
+            self._frames.clear()
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        runner = self._runner
+        while True:
+            with self._condition:
+                while len(self._frames) >= self._depth and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+            frame = error = None
+            try:
+                step = runner.advance()
+                if step is not None:
+                    frame = render_frame(runner, step)
+            except Exception as exc:  # noqa: BLE001 - handed to next()
+                error = exc
+            with self._condition:
+                if self._stopped:
+                    return
+                if frame is None:
+                    self._done = True
+                    self._error = error
+                else:
+                    self._frames.append(frame)
+                self._condition.notify_all()
+                if self._done:
+                    return
@@ -0,0 +1,297 @@
+"""Parallel batch grading of student scripts.
+
+Scripts are fanned out across worker processes. Each one runs in a fresh
+``ScriptRunner`` (its own Executor and Snapshotter) under a per-script
+timeout, and produces one JSON record with per-cell results, timings and
+the final memory snapshot. A worker that overruns the timeout anyway is
+killed and replaced.
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import signal
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict
+from multiprocessing.connection import Connection, wait
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from types import FrameType
+
+from dsa_visualizer.core.budget import ExecutionBudget
+from dsa_visualizer.core.script import ScriptRunner, split_cells
+from dsa_visualizer.core.snapshotter import Snapshot
+from dsa_visualizer.render.memory_view import render_object
+
+DEFAULT_TIMEOUT = 30.0
+"""Seconds a whole script may run before its remaining cells are skipped."""
+
+HARD_TIMEOUT_GRACE = 5.0
+"""Seconds past the timeout after which a script's worker is killed."""
+
+
+class ScriptTimeout(BaseException):
+    """Raised inside a script that runs past its timeout."""
+
+
+def find_scripts(directory: Path, pattern: str = "*.py") -> list[Path]:
+    """Scripts under ``directory`` matching ``pattern``, in a stable order."""
+    return sorted(path for path in directory.rglob(pattern) if path.is_file())
+
+
+def grade_script(
+    path: str | Path,
+    timeout: float | None = DEFAULT_TIMEOUT,
+    budget: ExecutionBudget | None = None,
+) -> dict[str, object]:
+    """Run one script and return its JSON-ready grading record."""
+    path = Path(path)
+    record: dict[str, object] = {
+        "script": str(path),
+        "ok": False,
+        "timed_out": False,
+        "error": None,
+        "wall_time": 0.0,
+        "cells": [],
+        "snapshot": None,
+    }
+    start = time.perf_counter()
+    try:
+        source = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as exc:
+        record["error"] = str(exc)
+        return record
+
+    runner = ScriptRunner(budget)
+    cells: list[dict[str, object]] = []
+    index = line = 0
+    try:
+        with _alarm(timeout):
+            for index, (line, code) in enumerate(split_cells(source), start=1):
+                cell = runner.run_cell(code, index=index, line=line)
+                cells.append(
+                    {
+                        "index": cell.index,
+                        "line": cell.line,
+                        "ok": cell.ok,
+                        "error": cell.error,
+                        "usage": asdict(cell.usage) if cell.usage else None,
+                    }
+                )
+    except ScriptTimeout:
+        record["timed_out"] = True
+        record["error"] = f"Script timed out after {timeout}s"
+    except KeyboardInterrupt:
+        raise
+    except BaseException as exc:  # noqa: BLE001 - e.g. sys.exit() in a script
+        # The Executor only catches Exception, so SystemExit and friends end
+        # the script here; the cell that raised them fails.
+        error = f"{type(exc).__name__}: {exc}" if str(exc) else type(exc).__name__
+        cells.append(
+            {"index": index, "line": line, "ok": False, "error": error, "usage": None}
+        )
+        record["error"] = f"Script stopped by {type(exc).__name__}"
+
+    record["wall_time"] = time.perf_counter() - start
+    record["cells"] = cells
+    record["ok"] = not record["timed_out"] and all(cell["ok"] for cell in cells)
+    record["snapshot"] = snapshot_to_json(runner.last_snapshot)
+    return record
+
+
+def grade_scripts(
+    paths: Iterable[Path],
+    *,
+    workers: int | None = None,
+    timeout: float | None = DEFAULT_TIMEOUT,
+    budget: ExecutionBudget | None = None,
+) -> Iterator[dict[str, object]]:
+    """Grade scripts in parallel, yielding records as they complete.
+
+    A script still running ``HARD_TIMEOUT_GRACE`` seconds past its timeout
+    (say, stuck in C code where the alarm cannot reach it) has its worker
+    process killed and replaced.
+    """
+    pending = deque(paths)
+    if not pending:
+        return
+    context = multiprocessing.get_context("spawn")
+    count = min(workers or os.cpu_count() or 1, len(pending))
+    idle = [_Worker(context, timeout, budget) for _ in range(count)]
+    busy: dict[Connection, _Worker] = {}
+    try:
+        while pending or busy:
+            while pending and idle:
+                worker = idle.pop()
+                worker.start_script(pending.popleft())
+                busy[worker.conn] = worker
+            ready = wait(list(busy), _until_next_deadline(busy.values()))
+            for conn in ready:
+                worker = busy.pop(conn)
+                try:
+                    yield conn.recv()
+                except (EOFError, OSError):
+                    worker.kill()
+                    yield _failed_record(
+                        worker.script,
+                        f"Worker failed: exit code {worker.process.exitcode}",
+                    )
+                    worker = _Worker(context, timeout, budget)
+                idle.append(worker)
+            now = time.monotonic()
+            for conn, worker in list(busy.items()):
+                if worker.deadline is not None and now >= worker.deadline:
+                    del busy[conn]
+                    worker.kill()
+                    record = _failed_record(
+                        worker.script,
+                        f"Script timed out after {timeout}s; worker killed",
+                    )
+                    record["timed_out"] = True
+                    yield record
+                    idle.append(_Worker(context, timeout, budget))
+    finally:
+        for worker in idle:
+            worker.close()
+        for worker in busy.values():
+            worker.kill()
+
+
+def grade_directory(
+    directory: Path,
+    output: Path,
+    *,
+    pattern: str = "*.py",
+    workers: int | None = None,
+    timeout: float | None = DEFAULT_TIMEOUT,
+    budget: ExecutionBudget | None = None,
+) -> int:
+    """Grade every script in ``directory`` into one JSONL file.
+
+    Records are written sorted by script path. Returns the number of
+    scripts that did not pass cleanly.
+    """
+    records = sorted(
+        grade_scripts(
+            find_scripts(directory, pattern),
+            workers=workers,
+            timeout=timeout,
+            budget=budget,
+        ),
+        key=lambda record: record["script"],
+    )
+    with output.open("w", encoding="utf-8") as handle:
+        for record in records:
+            handle.write(json.dumps(record, ensure_ascii=False, default=repr) + "\n")
+    return sum(1 for record in records if not record["ok"])
+
+
+def snapshot_to_json(snapshot: Snapshot) -> dict[str, object]:
+    """Bindings and objects of a snapshot, each payload as its rendered text."""
+    return {
+        "names": dict(snapshot.names),
+        "objects": {
+            obj_id: {
+                "py_type": record.py_type,
+                "dsa_type": record.dsa_type,
+                "summary": record.summary,
+                "content": render_object(record),
+            }
+            for obj_id, record in snapshot.objects.items()
+        },
+    }
+
+
+@contextmanager
+def _alarm(seconds: float | None) -> Iterator[None]:
+    """Raise ScriptTimeout in the main thread after ``seconds``."""
+    if not seconds or not hasattr(signal, "setitimer"):
+        yield
+        return
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _raise_timeout(signum: int, frame: FrameType | None) -> None:
+    raise ScriptTimeout
+
+
+class _Worker:
+    """A grading process fed one script path at a time over a pipe."""
+
+    def __init__(
+        self,
+        context: BaseContext,
+        timeout: float | None,
+        budget: ExecutionBudget | None,
+    ) -> None:
+        self.conn, child = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child, timeout, budget), daemon=True
+        )
+        self.process.start()
+        child.close()
+        self.timeout = timeout
+        self.script: Path | None = None
+        self.deadline: float | None = None
+
+    def start_script(self, path: Path) -> None:
+        self.script = path
+        if self.timeout:
+            self.deadline = time.monotonic() + self.timeout + HARD_TIMEOUT_GRACE
+        self.conn.send(str(path))
+
+    def close(self) -> None:
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+def _worker_main(
+    conn: Connection, timeout: float | None, budget: ExecutionBudget | None
+) -> None:
+    while (path := conn.recv()) is not None:
+        try:
+            record = grade_script(path, timeout, budget)
+        except Exception as exc:  # noqa: BLE001 - a crash fails one script
+            record = _failed_record(path, f"Worker failed: {exc}")
+        conn.send(record)
+
+
+def _failed_record(script: object, error: str) -> dict[str, object]:
+    return {
+        "script": str(script),
+        "ok": False,
+        "timed_out": False,
+        "error": error,
+        "wall_time": None,
+        "cells": [],
+        "snapshot": None,
+    }
+
+
+def _until_next_deadline(workers: Iterable[_Worker]) -> float | None:
+    deadlines = [worker.deadline for worker in workers if worker.deadline is not None]
+    if not deadlines:
+        return None
+    return max(0.0, min(deadlines) - time.monotonic())
@@ -0,0 +1,361 @@
+"""Out-of-process execution kernel.
+
+The kernel is a child process that owns a ``Session`` (and with it the
+Executor globals and the Snapshotter). Cells are sent over a pipe and
+rendered ``MemoryBlock``/``AlgorithmFrame`` data comes back, so a runaway
+cell never blocks the UI. The UI can interrupt the running cell or
+restart the kernel with a fresh namespace.
+
+A cell's memory blocks are rendered by a thread in the kernel after the
+cell's outcome was sent. They are fetched over a second pipe, so waiting
+for them does not keep the kernel busy, and the next cell abandons them.
+A running algorithm's frames are likewise prepared ahead on a thread, so
+an animation tick only picks up the next one.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from multiprocessing.connection import Connection
+
+from dsa_visualizer.algorithms.types import AlgorithmFrame, AlgorithmStep
+from dsa_visualizer.core.budget import ExecutionBudget
+from dsa_visualizer.core.executor import ExecutionResult
+from dsa_visualizer.core.frame_prefetcher import PREFETCH_DEPTH
+from dsa_visualizer.core.render_pipeline import RenderPipeline
+from dsa_visualizer.core.session import (
+    BatchOutcome,
+    CellOutcome,
+    PageView,
+    RerunOutcome,
+    Session,
+    TimelineView,
+)
+from dsa_visualizer.core.types import MemoryBlock
+
+INTERRUPTED_MESSAGE = "Interrupted"
+STOPPED_MESSAGE = "Kernel stopped; state was reset"
+
+
+class KernelError(Exception):
+    """A request the kernel could not serve; the kernel keeps running."""
+
+
+class Kernel:
+    """Client handle for a kernel process.
+
+    Calls are serialized: only one request can be in flight at a time.
+    ``interrupt`` and ``restart`` may be called from any thread while a
+    request is in flight. ``memory_blocks`` has a channel of its own and
+    may wait alongside any other request.
+    """
+
+    def __init__(self, budget: ExecutionBudget | None = None) -> None:
+        self.budget = budget
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._render_lock = threading.Lock()
+        self._process: multiprocessing.process.BaseProcess | None = None
+        self._conn: Connection | None = None
+        self._render_conn: Connection | None = None
+        self._start()
+
+    @property
+    def busy(self) -> bool:
+        """Whether a request is currently in flight."""
+        return self._lock.locked()
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def execute(self, source: str, cell_id: int | None = None) -> CellOutcome:
+        """Run a cell in the kernel and return its outcome."""
+        try:
+            return self._request("execute", source, cell_id)
+        except EOFError:
+            return CellOutcome(ExecutionResult(False, STOPPED_MESSAGE))
+
+    def run_batch(self, statements: list[str], first_cell_id: int) -> BatchOutcome:
+        """Run pasted statements as consecutive cells with one snapshot."""
+        try:
+            return self._request("run_batch", statements, first_cell_id)
+        except EOFError:
+            return BatchOutcome({first_cell_id: ExecutionResult(False, STOPPED_MESSAGE)})
+
+    def memory_blocks(self, render_id: int) -> list[MemoryBlock] | None:
+        """Wait for the memory blocks of an outcome's ``render_id``.
+
+        Returns None if a later cell abandoned them or the kernel stopped.
+        """
+        with self._render_lock:
+            conn = self._render_conn
+            if conn is None or not self.alive:
+                return None
+            try:
+                conn.send(render_id)
+                return conn.recv()
+            except (EOFError, OSError):
+                return None
+
+    def statement_delta(self, cell_id: int) -> str | None:
+        """Render the deferred delta of a statement from a batch."""
+        try:
+            return self._request("statement_delta", cell_id)
+        except EOFError:
+            return None
+
+    def timeline_view(self, position: int) -> TimelineView | None:
+        """Fetch the memory view at one point of the session's timeline."""
+        try:
+            return self._request("timeline_view", position)
+        except EOFError:
+            return None
+
+    def page(self, target: str, start: int, stop: int) -> PageView | None:
+        """Render another run of elements of a large container."""
+        try:
+            return self._request("page", target, start, stop)
+        except EOFError:
+            return None
+
+    def rerun_cell(self, cell_id: int, source: str) -> RerunOutcome:
+        """Re-run an edited cell and the cells that depend on it."""
+        try:
+            return self._request("rerun_cell", cell_id, source)
+        except EOFError:
+            return RerunOutcome({cell_id: ExecutionResult(False, STOPPED_MESSAGE)})
+
+    def advance_algorithm(self) -> AlgorithmFrame | None:
+        """Advance the kernel's running algorithm by one step."""
+        try:
+            return self._request("advance_algorithm")
+        except EOFError:
+            return None
+
+    def seek_algorithm(self, index: int) -> AlgorithmFrame | None:
+        """Jump the kernel's running algorithm to step ``index``."""
+        try:
+            return self._request("seek_algorithm", index)
+        except EOFError:
+            return None
+
+    def fast_forward_algorithm(
+        self, predicate: Callable[[AlgorithmStep], bool] | None = None
+    ) -> AlgorithmFrame | None:
+        """Run the kernel's algorithm ahead to a matching step or its end.
+
+        ``predicate`` is sent to the kernel process, so it must pickle.
+        """
+        try:
+            return self._request("fast_forward_algorithm", predicate)
+        except EOFError:
+            return None
+
+    def stop_algorithm(self) -> None:
+        try:
+            self._request("stop_algorithm")
+        except EOFError:
+            pass
+
+    def interrupt(self) -> None:
+        """Raise KeyboardInterrupt in the cell currently running."""
+        if self.alive and self.busy:
+            assert self._process is not None
+            os.kill(self._process.pid, signal.SIGINT)
+
+    def restart(self) -> None:
+        """Kill the kernel process and start a fresh one."""
+        self._stop_process()
+        with self._lock:
+            self._start()
+
+    def close(self) -> None:
+        self._stop_process()
+
+    def _request(self, command: str, *args: object):
+        with self._lock:
+            if not self.alive:
+                self._start()
+            assert self._conn is not None
+            try:
+                self._conn.send((command, args))
+                reply = self._conn.recv()
+            except (EOFError, OSError) as exc:
+                self._stop_process()
+                raise EOFError(str(exc)) from exc
+        if isinstance(reply, KernelError):
+            raise reply
+        return reply
+
+    def _start(self) -> None:
+        parent_conn, child_conn = self._context.Pipe()
+        render_parent, render_child = self._context.Pipe()
+        process = self._context.Process(
+            target=_kernel_main,
+            args=(child_conn, render_child, self.budget),
+            name="dsa-kernel",
+            daemon=True,
+        )
+        with _real_stderr():
+            process.start()
+        child_conn.close()
+        render_child.close()
+        self._process = process
+        self._conn = parent_conn
+        self._render_conn = render_parent
+
+    def _stop_process(self) -> None:
+        process = self._process
+        conn = self._conn
+        render_conn = self._render_conn
+        if process is not None and process.is_alive():
+            process.terminate()
+            process.join(timeout=1.0)
+            if process.is_alive():
+                process.kill()
+                process.join()
+        if conn is not None:
+            conn.close()
+        if render_conn is not None:
+            render_conn.close()
+
+
+@contextmanager
+def _real_stderr() -> Iterator[None]:
+    """Expose the real stderr while spawning.
+
+    Textual swaps ``sys.stderr`` for a capture object without a usable file
+    descriptor, and multiprocessing hands ``sys.stderr.fileno()`` to the
+    resource tracker it starts alongside the first child.
+    """
+    captured = sys.stderr
+    sys.stderr = sys.__stderr__
+    try:
+        yield
+    finally:
+        sys.stderr = captured
+
+
+class _InterruptGate:
+    """SIGINT handler that only interrupts while a request is running."""
+
+    def __init__(self) -> None:
+        self._armed = False
+
+    def handle(self, signum: int, frame: object) -> None:
+        if self._armed:
+            raise KeyboardInterrupt
+
+    @contextmanager
+    def armed(self) -> Iterator[None]:
+        self._armed = True
+        try:
+            yield
+        finally:
+            self._armed = False
+
+
+def _kernel_main(
+    conn: Connection, render_conn: Connection, budget: ExecutionBudget | None
+) -> None:
+    gate = _InterruptGate()
+    signal.signal(signal.SIGINT, gate.handle)
+    pipeline = RenderPipeline()
+    session = Session(budget, pipeline, PREFETCH_DEPTH)
+    threading.Thread(
+        target=_serve_renders, args=(render_conn, pipeline), daemon=True
+    ).start()
+    while True:
+        try:
+            command, args = conn.recv()
+        except EOFError:
+            return
+        try:
+            reply = _dispatch(session, gate, command, args)
+        except Exception as exc:  # noqa: BLE001 - keep the kernel alive
+            reply = KernelError(f"{command}: {exc}")
+        conn.send(reply)
+
+
+def _serve_renders(conn: Connection, pipeline: RenderPipeline) -> None:
+    while True:
+        try:
+            render_id = conn.recv()
+        except EOFError:
+            return
+        conn.send(pipeline.wait(render_id))
+
+
+def _dispatch(session: Session, gate: _InterruptGate, command: str, args: tuple):
+    if command == "execute":
+        try:
+            with gate.armed():
+                return session.run_cell(*args)
+        except KeyboardInterrupt:
+            session.invalidate_snapshot()
+            return CellOutcome(ExecutionResult(False, INTERRUPTED_MESSAGE))
+        except Exception as exc:  # noqa: BLE001 - keep the kernel alive
+            session.invalidate_snapshot()
+            return CellOutcome(ExecutionResult(False, str(exc)))
+    if command == "run_batch":
+        first_cell_id = args[1]
+        try:
+            with gate.armed():
+                return session.run_batch(*args)
+        except KeyboardInterrupt:
+            session.invalidate_snapshot()
+            return BatchOutcome(
+                {first_cell_id: ExecutionResult(False, INTERRUPTED_MESSAGE)}
+            )
+        except Exception as exc:  # noqa: BLE001 - keep the kernel alive
+            session.invalidate_snapshot()
+            return BatchOutcome({first_cell_id: ExecutionResult(False, str(exc))})
+    if command == "statement_delta":
+        return session.statement_delta(*args)
+    if command == "timeline_view":
+        return session.timeline_view(*args)
+    if command == "page":
+        return session.page(*args)
+    if command == "rerun_cell":
+        cell_id = args[0]
+        try:
+            with gate.armed():
+                return session.rerun_cell(*args)
+        except KeyboardInterrupt:
+            session.invalidate_snapshot()
+            return RerunOutcome({cell_id: ExecutionResult(False, INTERRUPTED_MESSAGE)})
+        except Exception as exc:  # noqa: BLE001 - keep the kernel alive
+            session.invalidate_snapshot()
+            return RerunOutcome({cell_id: ExecutionResult(False, str(exc))})
+    if command == "advance_algorithm":
+        try:
+            with gate.armed():
+                return session.advance_algorithm()
+        except KeyboardInterrupt:
+            session.stop_algorithm()
+            return None
+    if command == "seek_algorithm":
+        try:
+            with gate.armed():
+                return session.seek_algorithm(*args)
+        except KeyboardInterrupt:
+            session.stop_algorithm()
+            return None
+    if command == "fast_forward_algorithm":
+        try:
+            with gate.armed():
+                return session.fast_forward_algorithm(*args)
+        except KeyboardInterrupt:
+            session.stop_algorithm()
+            return None
+    if command == "stop_algorithm":
+        session.stop_algorithm()
+        return None
+    raise ValueError(f"Unknown kernel command: {command!r}")
@@ -0,0 +1,123 @@
+"""Lazily imported registries of algorithms and renderers.
+
+Each registry maps a name to a ``"module:attribute"`` reference and only
+imports the module the first time the name is looked up. Built-in entries
+are listed in code; other packages add their own through entry points::
+
+    [project.entry-points."dsa_visualizer.search"]
+    ternary = "my_algorithms.ternary:ternary_search"
+
+Entry points are discovered on first use, not at startup. A plugin name
+never replaces a built-in one.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterator, Mapping
+from importlib.metadata import EntryPoint, entry_points
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+SEARCH_GROUP = "dsa_visualizer.search"
+"""Entry point group for array search generators ``(arr, target)``."""
+
+TREE_SEARCH_GROUP = "dsa_visualizer.tree_search"
+"""Entry point group for tree search generators ``(root, target)``."""
+
+TREE_TRAVERSAL_GROUP = "dsa_visualizer.tree_traversal"
+"""Entry point group for tree traversal generators ``(root)``."""
+
+RENDERER_GROUP = "dsa_visualizer.renderers"
+"""Entry point group for memory view renderers ``(payload) -> str``,
+keyed by the snapshot's DSA type name."""
+
+TYPE_GROUP = "dsa_visualizer.types"
+"""Entry point group for classes shown as a DSA type, keyed by the type
+name. The object itself is the payload its renderer gets."""
+
+
+class LazyRegistry(Mapping[str, T], Generic[T]):
+    """Read-only mapping of names to objects imported on first access."""
+
+    def __init__(self, group: str, builtins: Mapping[str, str]) -> None:
+        self.group = group
+        self._targets: dict[str, str | EntryPoint | T] = dict(builtins)
+        self._loaded: dict[str, T] = {}
+        self._discovered = False
+
+    def register(self, name: str, target: str | T) -> None:
+        """Add an entry, given as ``"module:attribute"`` or the object."""
+        self._targets[name] = target
+        self._loaded.pop(name, None)
+
+    def __getitem__(self, name: str) -> T:
+        try:
+            return self._loaded[name]
+        except KeyError:
+            pass
+        if name not in self._targets:
+            self._discover()
+        target = self._targets[name]
+        if isinstance(target, EntryPoint):
+            value = target.load()
+        elif isinstance(target, str):
+            value = _import_target(target)
+        else:
+            value = target
+        self._loaded[name] = value
+        return value
+
+    def __contains__(self, name: object) -> bool:
+        if name not in self._targets:
+            self._discover()
+        return name in self._targets
+
+    def __iter__(self) -> Iterator[str]:
+        self._discover()
+        return iter(self._targets)
+
+    def __len__(self) -> int:
+        self._discover()
+        return len(self._targets)
+
+    def match_class(self, kind: type) -> str | None:
+        """Name of the entry whose target is ``kind`` or its nearest base.
+
+        Targets not loaded yet are compared by their ``"module:attribute"``
+        reference, so matching imports nothing.
+        """
+        self._discover()
+        references: dict[str, str] = {}
+        objects: dict[int, str] = {}
+        for name, target in self._targets.items():
+            if isinstance(target, EntryPoint):
+                references.setdefault(target.value, name)
+            elif isinstance(target, str):
+                references.setdefault(target, name)
+            else:
+                objects.setdefault(id(target), name)
+        for base in kind.__mro__:
+            name = objects.get(id(base)) or references.get(
+                f"{base.__module__}:{base.__qualname__}"
+            )
+            if name is not None:
+                return name
+        return None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.group!r}, {sorted(self._targets)!r})"
+
+    def _discover(self) -> None:
+        if self._discovered:
+            return
+        self._discovered = True
+        for entry_point in entry_points(group=self.group):
+            self._targets.setdefault(entry_point.name, entry_point)
+
+
+def _import_target(target: str) -> object:
+    module_name, _, attribute = target.partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, attribute)
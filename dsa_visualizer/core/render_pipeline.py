@@ -0,0 +1,111 @@
+"""Render the memory view of a snapshot on a background thread.
+
+The Snapshotter copies list and dict payloads, so the blocks for those
+records can be rendered while the next cell already runs. Records whose
+payload is a live node (a linked list head, a tree root) are rendered on
+the submitting thread before it returns, since a later cell may rewire
+those nodes.
+
+Only the latest snapshot matters: submitting another one, or cancelling,
+abandons the render in progress at the next block boundary. A render that
+fails ends with an error block, and the worker goes on to the next one.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from dsa_visualizer.core.budget import BudgetExceeded
+from dsa_visualizer.core.snapshotter import (
+    ObjectRecord,
+    PayloadWindow,
+    RenderedPayload,
+    Snapshot,
+)
+from dsa_visualizer.core.types import MemoryBlock
+from dsa_visualizer.render.memory_view import iter_memory_blocks, render_object
+
+
+class RenderPipeline:
+    """Renders one snapshot at a time on a worker thread.
+
+    ``submit`` returns a render id; ``wait`` blocks until that render is
+    done and returns its blocks, or None once a newer submit or ``cancel``
+    superseded it.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._generation = 0
+        self._pending: Snapshot | None = None
+        self._blocks: list[MemoryBlock] | None = None
+        self._thread: threading.Thread | None = None
+
+    def submit(self, snapshot: Snapshot) -> int:
+        """Queue ``snapshot`` for rendering and return its render id."""
+        for record in snapshot.objects.values():
+            if not _is_copied(record):
+                render_object(record)  # Warms the content cache.
+        with self._condition:
+            self._generation += 1
+            self._pending = snapshot
+            self._blocks = None
+            self._condition.notify_all()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="dsa-render", daemon=True
+                )
+                self._thread.start()
+            return self._generation
+
+    def cancel(self) -> None:
+        """Abandon the render in progress; its waiters get None."""
+        with self._condition:
+            self._generation += 1
+            self._pending = None
+            self._blocks = None
+            self._condition.notify_all()
+
+    def wait(self, render_id: int) -> list[MemoryBlock] | None:
+        """Blocks of render ``render_id``, or None if it was superseded."""
+        with self._condition:
+            while render_id == self._generation and self._blocks is None:
+                self._condition.wait()
+            return self._blocks if render_id == self._generation else None
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                generation = self._generation
+                snapshot = self._pending
+                self._pending = None
+            blocks: list[MemoryBlock] = []
+            try:
+                for block in iter_memory_blocks(snapshot):
+                    if generation != self._generation:
+                        break
+                    blocks.append(block)
+            except (Exception, BudgetExceeded) as exc:  # noqa: BLE001 - keep serving renders
+                blocks.append(_error_block(exc))
+            with self._condition:
+                if generation == self._generation:
+                    self._blocks = blocks
+                    self._condition.notify_all()
+
+
+def _error_block(exc: BaseException) -> MemoryBlock:
+    message = f"{type(exc).__name__}: {exc}"
+    return MemoryBlock(
+        block_id="render_error",
+        header="Memory view ──▶ error",
+        summary=message,
+        content=f"Rendering the rest of the memory view failed.\n{message}",
+    )
+
+
+def _is_copied(record: ObjectRecord) -> bool:
+    return record.payload is None or isinstance(
+        record.payload, (list, dict, PayloadWindow, RenderedPayload)
+    )
@@ -0,0 +1,137 @@
+"""Headless execution of whole scripts.
+
+A script is split into cells, either on ``# %%`` markers or, when it has
+none, one cell per top-level statement. Each cell runs through the same
+Session (Executor, Snapshotter and render_memory) as the notebook, without
+importing the UI.
+"""
+
+from __future__ import annotations
+
+import ast
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from dsa_visualizer.core.budget import ExecutionBudget, ResourceUsage
+from dsa_visualizer.core.session import Session
+from dsa_visualizer.core.snapshotter import Snapshot
+from dsa_visualizer.render.memory_view import render_memory
+
+CELL_MARKER = re.compile(r"^# ?%%")
+
+
+@dataclass(frozen=True)
+class ScriptCell:
+    """Result of running one cell of a script."""
+
+    index: int
+    """1-based position of the cell in the script."""
+
+    line: int
+    """1-based line the cell starts on."""
+
+    code: str
+    ok: bool
+    error: str | None = None
+    output: str | None = None
+    """Rendered memory delta, None if the cell failed."""
+
+    usage: ResourceUsage | None = None
+
+
+def split_cells(source: str) -> list[tuple[int, str]]:
+    """Split a script into ``(line, code)`` cells.
+
+    ``# %%`` marker lines take precedence. Otherwise each top-level
+    statement is a cell, keeping the comments directly above it. A script
+    that does not parse is returned as a single cell so the syntax error
+    is reported when it runs.
+    """
+    lines = source.splitlines()
+    if any(CELL_MARKER.match(line) for line in lines):
+        return _split_on_markers(lines)
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return _non_empty([(1, source)])
+
+    cells = []
+    start = 0
+    for node in tree.body:
+        first = min(
+            [node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])]
+        )
+        end = node.end_lineno or node.lineno
+        if first - 1 < start:
+            # Several statements on one line (``a = 1; b = 2``).
+            continue
+        cells.append((start + 1, "\n".join(lines[start:end])))
+        start = end
+    return _non_empty(cells)
+
+
+def _split_on_markers(lines: list[str]) -> list[tuple[int, str]]:
+    cells = []
+    start = 0
+    current: list[str] = []
+    for number, line in enumerate(lines):
+        if CELL_MARKER.match(line):
+            cells.append((start + 1, "\n".join(current)))
+            start = number + 1
+            current = []
+        else:
+            current.append(line)
+    cells.append((start + 1, "\n".join(current)))
+    return _non_empty(cells)
+
+
+def _non_empty(cells: list[tuple[int, str]]) -> list[tuple[int, str]]:
+    """Drop blank cells and trim leading/trailing blank lines."""
+    result = []
+    for line, code in cells:
+        code_lines = code.split("\n")
+        while code_lines and not code_lines[0].strip():
+            code_lines.pop(0)
+            line += 1
+        while code_lines and not code_lines[-1].strip():
+            code_lines.pop()
+        if code_lines:
+            result.append((line, "\n".join(code_lines)))
+    return result
+
+
+class ScriptRunner:
+    """Runs cells against one Session, tracking the memory snapshot."""
+
+    def __init__(self, budget: ExecutionBudget | None = None) -> None:
+        self.session = Session(budget)
+
+    @property
+    def last_snapshot(self) -> Snapshot:
+        return self.session.last_snapshot
+
+    def run(self, source: str) -> Iterator[ScriptCell]:
+        """Run a script cell by cell, yielding each cell's rendered delta.
+
+        Execution continues after a failing cell, like in the notebook.
+        """
+        for index, (line, code) in enumerate(split_cells(source), start=1):
+            yield self.run_cell(code, index=index, line=line)
+
+    def run_cell(self, code: str, *, index: int = 1, line: int = 1) -> ScriptCell:
+        session = self.session
+        result = session.execute(code)
+        # Algorithms are only stepped through interactively.
+        session.executor.pending_algorithm = None
+        if not result.ok:
+            return ScriptCell(index, line, code, False, result.error, None, result.usage)
+        output = render_memory(session.update_snapshot()) or "(no changes)"
+        return ScriptCell(index, line, code, True, None, output, result.usage)
+
+
+def run_script(
+    source: str, budget: ExecutionBudget | None = None
+) -> Iterator[ScriptCell]:
+    """Run a script in a fresh namespace; see ``ScriptRunner.run``."""
+    return ScriptRunner(budget).run(source)
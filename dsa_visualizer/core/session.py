@@ -0,0 +1,447 @@
+from __future__ import annotations
+
+import ast
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from dsa_visualizer.algorithms.render.frames import render_frame
+from dsa_visualizer.algorithms.runner import AlgorithmRunner
+from dsa_visualizer.algorithms.types import AlgorithmFrame, AlgorithmStep
+from dsa_visualizer.core.budget import ExecutionBudget
+from dsa_visualizer.core.dependencies import DependencyGraph
+from dsa_visualizer.core.effects import CellEffects, analyze_cell
+from dsa_visualizer.core.executor import ExecutionResult, Executor
+from dsa_visualizer.core.frame_prefetcher import FramePrefetcher
+from dsa_visualizer.core.render_pipeline import RenderPipeline
+from dsa_visualizer.core.snapshotter import (
+    PayloadWindow,
+    Snapshot,
+    Snapshotter,
+    diff_snapshots,
+)
+from dsa_visualizer.core.timeline import SnapshotTimeline
+from dsa_visualizer.core.types import MemoryBlock
+from dsa_visualizer.render.memory_view import (
+    get_block_ids,
+    get_memory_blocks,
+    render_memory,
+    render_object,
+)
+
+
+@dataclass(frozen=True)
+class CellOutcome:
+    """Everything the UI needs to display after running one cell."""
+
+    result: ExecutionResult
+    snapshot_text: str | None = None
+    blocks: list[MemoryBlock] = field(default_factory=list)
+    algorithm: AlgorithmFrame | None = None
+    render_id: int | None = None
+    """Set when ``blocks`` are rendered in the background instead; fetch
+    them with ``Session.memory_blocks``. The cell's delta is then left to
+    ``Session.statement_delta`` rather than put in ``snapshot_text``."""
+
+
+@dataclass(frozen=True)
+class RerunOutcome:
+    """Result of re-running an edited cell and the cells that depend on it."""
+
+    results: dict[int, ExecutionResult]
+    """Result of every cell that ran, by cell id, in execution order."""
+
+    snapshot_text: str | None = None
+    """Rendered delta of the whole re-run."""
+
+    blocks: list[MemoryBlock] = field(default_factory=list)
+    """Memory blocks for the names the re-run touched."""
+
+    removed: frozenset[str] = frozenset()
+    """Ids of memory blocks that no longer exist."""
+
+
+@dataclass(frozen=True)
+class BatchOutcome:
+    """Result of running a pasted block of statements as one batch."""
+
+    results: dict[int, ExecutionResult]
+    """Result of every statement, by cell id, in execution order."""
+
+    blocks: list[MemoryBlock] = field(default_factory=list)
+    """The whole memory view after the batch."""
+
+    algorithm: AlgorithmFrame | None = None
+    """First frame of an algorithm started by the last statement."""
+
+    render_id: int | None = None
+    """As for ``CellOutcome``."""
+
+
+@dataclass(frozen=True)
+class TimelineView:
+    """The memory view as it was at one point of the session."""
+
+    position: int
+    """Index of the snapshot in the timeline."""
+
+    length: int
+    """Number of snapshots in the timeline; the last one is the live view."""
+
+    cell_id: int | None
+    """Cell that produced the snapshot (None for the session start)."""
+
+    blocks: list[MemoryBlock] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class PageView:
+    """A run of elements of a large container, rendered in its block."""
+
+    start: int
+    """First element in view."""
+
+    stop: int
+    """Element after the last one in view."""
+
+    length: int
+    """Number of elements in the whole container."""
+
+    text: str
+
+
+@dataclass
+class _BatchDelta:
+    """What a batch (or a cell) needs to render its deltas on demand."""
+
+    before: Snapshot
+    after: Snapshot
+    scopes: dict[int, frozenset[str] | None]
+    delta: Snapshot | None = None
+
+
+class Session:
+    """Executes cells and keeps the memory snapshot in sync.
+
+    Owns the Executor globals, the Snapshotter and any running algorithm,
+    so the same pipeline can be driven in-process or from a kernel.
+
+    With a ``render_pipeline``, cells and batches return without their
+    memory blocks; those are rendered in the background and abandoned
+    when the next cell starts. A cell's delta is then rendered on demand,
+    like a batch statement's.
+
+    With a ``prefetch_depth``, a running algorithm is stepped and rendered
+    that many frames ahead on a worker thread.
+    """
+
+    def __init__(
+        self,
+        budget: ExecutionBudget | None = None,
+        render_pipeline: RenderPipeline | None = None,
+        prefetch_depth: int = 0,
+    ) -> None:
+        self.executor = Executor(budget)
+        self.render_pipeline = render_pipeline
+        self.prefetch_depth = prefetch_depth
+        self.snapshotter = Snapshotter()
+        self.last_snapshot = self.snapshotter.snapshot(self.executor.globals)
+        self.runner: AlgorithmRunner | None = None
+        self._prefetcher: FramePrefetcher | None = None
+        # Names touched since last_snapshot was taken; None forces a full scan.
+        self._dirty: set[str] | None = set()
+        # Those of them whose objects were written to outside their methods.
+        self._written: set[str] = set()
+        self.graph = DependencyGraph()
+        self._next_cell_id = 1
+        self._last_cell_id: int | None = None
+        self.timeline = SnapshotTimeline()
+        self.timeline.append(self.last_snapshot)
+        # Batch statements whose delta has not been rendered yet, by cell id.
+        self._deferred: dict[int, _BatchDelta] = {}
+
+    def run_cell(self, source: str, cell_id: int | None = None) -> CellOutcome:
+        result = self.execute(source, cell_id)
+        if not result.ok:
+            return CellOutcome(result)
+        before = self.last_snapshot
+        delta = self.update_snapshot()
+        if self.render_pipeline is None:
+            snapshot_text = render_memory(delta) or "(no changes)"
+        else:
+            # Rendered by statement_delta when the cell is expanded.
+            snapshot_text = None
+            self._deferred[self._last_cell_id] = _BatchDelta(
+                before, self.last_snapshot, {self._last_cell_id: None}, delta
+            )
+        blocks, render_id = self._render_blocks()
+
+        frame = None
+        pending = self.executor.pop_pending_algorithm()
+        if pending is not None:
+            frame = self._start_algorithm(pending.runner)
+        return CellOutcome(result, snapshot_text, blocks, frame, render_id)
+
+    def execute(self, source: str, cell_id: int | None = None) -> ExecutionResult:
+        """Run a cell without snapshotting, recording the names it touched.
+
+        The cell is added to the dependency graph under ``cell_id`` (or the
+        next free id) so it can be edited and re-run later.
+        """
+        if cell_id is None:
+            cell_id = self._next_cell_id
+        self._next_cell_id = max(self._next_cell_id, cell_id + 1)
+        self._last_cell_id = cell_id
+        self.stop_algorithm()
+        if self.render_pipeline is not None:
+            self.render_pipeline.cancel()
+        result = self.executor.execute(source)
+        self._mark_dirty(result)
+        if result.effects is not None:
+            self.graph.record(cell_id, source, result.effects)
+        return result
+
+    def run_batch(self, statements: list[str], first_cell_id: int) -> BatchOutcome:
+        """Run statements as consecutive cells with one snapshot at the end.
+
+        Each statement is its own cell (``first_cell_id`` onwards) in the
+        dependency graph. Execution continues after a failing statement.
+        Per-statement deltas are not rendered here; ``statement_delta``
+        builds one when the UI asks for it.
+        """
+        before = self.last_snapshot
+        results: dict[int, ExecutionResult] = {}
+        scopes: dict[int, frozenset[str] | None] = {}
+        for cell_id, source in enumerate(statements, start=first_cell_id):
+            result = self.execute(source, cell_id)
+            results[cell_id] = result
+            if result.ok and result.effects is not None:
+                scopes[cell_id] = result.effects.scope
+        self.update_snapshot()
+        batch = _BatchDelta(before, self.last_snapshot, scopes)
+        for cell_id in scopes:
+            self._deferred[cell_id] = batch
+
+        frame = None
+        pending = self.executor.pop_pending_algorithm()
+        if pending is not None:
+            frame = self._start_algorithm(pending.runner)
+        blocks, render_id = self._render_blocks()
+        return BatchOutcome(results, blocks, frame, render_id)
+
+    def memory_blocks(self, render_id: int) -> list[MemoryBlock] | None:
+        """Wait for the background render ``render_id`` and return its blocks.
+
+        Returns None if a later cell abandoned the render.
+        """
+        if self.render_pipeline is None:
+            return None
+        return self.render_pipeline.wait(render_id)
+
+    def statement_delta(self, cell_id: int) -> str | None:
+        """Render the delta of one statement from a batch.
+
+        The batch only snapshots once, so this shows the state after the
+        whole batch of the names the statement touched. Cells run with a
+        render pipeline are deferred the same way. Returns None for cells
+        whose delta was not deferred (or was already rendered).
+        """
+        batch = self._deferred.pop(cell_id, None)
+        if batch is None:
+            return None
+        if batch.delta is None:
+            batch.delta = diff_snapshots(batch.before, batch.after)
+        return render_memory(batch.delta, batch.scopes[cell_id]) or "(no changes)"
+
+    def page(self, target: str, start: int, stop: int) -> PageView | None:
+        """Render the object ``target`` with ``[start:stop]`` in view.
+
+        ``target`` is a bound name or the id of a snapshotted object. Large
+        containers are snapshotted as a window; this reads another run of
+        elements from the live object, moved back to stay within it.
+        Returns None if ``target`` is not a snapshotted object.
+        """
+        obj_id = self.last_snapshot.names.get(target, target)
+        record = self.last_snapshot.objects.get(obj_id)
+        value = self.snapshotter.live(obj_id) if record is not None else None
+        if value is None:
+            return None
+        window = record.payload
+        if not isinstance(window, PayloadWindow):
+            # Captured whole: everything is already in view.
+            length = len(window) if isinstance(window, (list, dict)) else 0
+            return PageView(0, length, length, render_object(record))
+        size = min(stop - start, self.snapshotter.policy.limit)
+        start = max(0, min(start, window.length - size))
+        stop = min(start + size, window.length)
+        paged = self.snapshotter.page(value, start, stop)
+        return PageView(start, stop, window.length, render_object(paged))
+
+    def rerun_cell(self, cell_id: int, source: str) -> RerunOutcome:
+        """Replace a cell's source and re-run it with its dependents.
+
+        Only the cells in the dependency graph's plan run again, and only
+        the memory blocks for the names they touched are rebuilt.
+        """
+        try:
+            effects = analyze_cell(ast.parse(source, "<input>", "exec"))
+        except (SyntaxError, ValueError) as exc:
+            return RerunOutcome({cell_id: ExecutionResult(False, str(exc))})
+
+        plan = self.graph.plan_rerun(cell_id, effects)
+        self._unbind_dropped_names(cell_id, effects)
+        results: dict[int, ExecutionResult] = {}
+        for planned in plan:
+            self._deferred.pop(planned, None)
+            if planned == cell_id:
+                planned_source = source
+            else:
+                node = self.graph.get(planned)
+                assert node is not None
+                planned_source = node.source
+            results[planned] = self.execute(planned_source, planned)
+        self.executor.pending_algorithm = None
+
+        touched = None if self._dirty is None or self._written else set(self._dirty)
+        previous = self.last_snapshot
+        delta = self.update_snapshot()
+        removed = get_block_ids(previous) - get_block_ids(self.last_snapshot)
+        return RerunOutcome(
+            results,
+            render_memory(delta) or "(no changes)",
+            get_memory_blocks(self.last_snapshot, touched),
+            frozenset(removed),
+        )
+
+    def update_snapshot(self) -> Snapshot:
+        """Re-snapshot the names touched since the last snapshot.
+
+        Returns the delta against the previous snapshot.
+        """
+        dirty = self._dirty
+        snapshot = self.snapshotter.snapshot(
+            self.executor.globals,
+            previous=self.last_snapshot,
+            names=dirty,
+            written=self._written,
+        )
+        if self._written:
+            # Structures whose nodes were edited through an alias changed
+            # without their names being dirty; compare every name.
+            dirty = None
+        self._dirty = set()
+        self._written = set()
+        delta = diff_snapshots(self.last_snapshot, snapshot, dirty)
+        self.last_snapshot = snapshot
+        self.timeline.append(snapshot, self._last_cell_id)
+        return delta
+
+    def timeline_view(self, position: int) -> TimelineView | None:
+        """Memory blocks of the snapshot at ``position`` in the timeline.
+
+        Negative positions count back from the live view. Returns None if
+        the position is out of range.
+        """
+        length = len(self.timeline)
+        if not -length <= position < length:
+            return None
+        position %= length
+        snapshot = self.timeline.snapshot_at(position)
+        return TimelineView(
+            position, length, self.timeline.label(position), get_memory_blocks(snapshot)
+        )
+
+    def _render_blocks(self) -> tuple[list[MemoryBlock], int | None]:
+        """The whole memory view, or the id it is rendered under."""
+        if self.render_pipeline is None:
+            return get_memory_blocks(self.last_snapshot), None
+        return [], self.render_pipeline.submit(self.last_snapshot)
+
+    def _unbind_dropped_names(self, cell_id: int, effects: CellEffects) -> None:
+        """Remove names only the old version of an edited cell bound."""
+        old = self.graph.get(cell_id)
+        if old is None:
+            return
+        dropped = old.effects.binds - effects.binds
+        for node in self.graph.nodes():
+            if node.cell_id != cell_id:
+                dropped -= node.effects.binds
+        namespace = self.executor.globals
+        for name in dropped & namespace.keys():
+            del namespace[name]
+            if self._dirty is not None:
+                self._dirty.add(name)
+
+    def invalidate_snapshot(self) -> None:
+        """Force the next snapshot to rescan every global.
+
+        Needed when a cell was cut short before its effects were reported,
+        e.g. by KeyboardInterrupt.
+        """
+        self._dirty = None
+
+    def _mark_dirty(self, result: ExecutionResult) -> None:
+        if result.effects is None or self._dirty is None:
+            return
+        scope = result.effects.scope
+        if scope is None:
+            self._dirty = None
+        else:
+            self._dirty.update(scope)
+            self._written.update(result.effects.writes)
+
+    def advance_algorithm(self) -> AlgorithmFrame | None:
+        """Advance the running algorithm and render the new step."""
+        if self.runner is None:
+            return None
+        if self._prefetcher is not None:
+            return self._prefetcher.next()
+        step = self.runner.advance()
+        if step is None:
+            return None
+        return render_frame(self.runner, step)
+
+    def seek_algorithm(self, index: int) -> AlgorithmFrame | None:
+        """Jump the running algorithm to step ``index`` and render it."""
+        if self.runner is None:
+            return None
+        self._pause_prefetch()
+        step = self.runner.seek(index)
+        frame = None if step is None else render_frame(self.runner, step)
+        self._resume_prefetch()
+        return frame
+
+    def fast_forward_algorithm(
+        self, predicate: Callable[[AlgorithmStep], bool] | None = None
+    ) -> AlgorithmFrame | None:
+        """Run the algorithm ahead to a matching step (or its end) and
+        render only that step."""
+        if self.runner is None:
+            return None
+        self._pause_prefetch()
+        step = self.runner.fast_forward(predicate)
+        frame = None if step is None else render_frame(self.runner, step)
+        self._resume_prefetch()
+        return frame
+
+    def stop_algorithm(self) -> None:
+        if self._prefetcher is not None:
+            self._prefetcher.cancel()
+            self._prefetcher = None
+        self.runner = None
+
+    def _start_algorithm(self, runner: AlgorithmRunner) -> AlgorithmFrame | None:
+        """Make ``runner`` the running algorithm and return its first frame."""
+        self.stop_algorithm()
+        self.runner = runner
+        frame = self.advance_algorithm()
+        self._resume_prefetch()
+        return frame
+
+    def _pause_prefetch(self) -> None:
+        if self._prefetcher is not None:
+            self._prefetcher.pause()
+            self._prefetcher = None
+
+    def _resume_prefetch(self) -> None:
+        if self.prefetch_depth and self.runner is not None:
+            self._prefetcher = FramePrefetcher(self.runner, self.prefetch_depth)
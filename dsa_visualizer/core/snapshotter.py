@@ -1,8 +1,20 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Callable, Collection, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from hashlib import blake2b
+from itertools import islice
+import marshal
+import os
+import sys
+import sysconfig
 import types
+from typing import Generic, TypeVar
+import weakref
 
+from dsa_visualizer.core.registry import TYPE_GROUP, LazyRegistry
+from dsa_visualizer.data_structures.chain import iter_chain, measure_chain
 from dsa_visualizer.data_structures.implementations.structures import (
     BinarySearchTree,
     BinaryTree,
@@ -17,14 +29,37 @@ from dsa_visualizer.data_structures.implementations.structures import (
     Stack,
 )
 
+T = TypeVar("T")
 
 PRIMITIVE_TYPES = (int, float, bool, str, type(None))
 
+# Values shown in place inside a container rather than as their own block.
+_INLINE_TYPES = PRIMITIVE_TYPES + (
+    tuple,
+    frozenset,
+    bytes,
+    complex,
+    range,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.ModuleType,
+    type,
+)
+
+# Element types a fingerprint keeps by value; other elements by identity.
+_EXACT_TYPES = frozenset(PRIMITIVE_TYPES + (bytes, complex))
+
+# Elements serialized at a time when fingerprinting a container.
+_FINGERPRINT_CHUNK = 4096
+
 # Names that are built-in to the executor and should not be shown in memory view
 BUILTIN_NAMES = frozenset({
     "EXAMPLES",
     "search",
+    "search_many",
     "tree_search",
+    "tree_search_many",
     "tree_traverse",
     "algo_help",
     "LinkedList",
@@ -46,6 +81,87 @@ class ObjectRecord:
     dsa_type: str
     summary: str
     payload: object | None = None
+    version: tuple | None = None
+    """Mutation version of the structure when the record was built (None
+    for objects without one); an unchanged version means the record can be
+    reused as is."""
+    fingerprint: object | None = None
+    """Cheap stand-in for the payload's contents: equal fingerprints mean
+    the object did not change. None if the payload cannot be fingerprinted."""
+    children: tuple[str, ...] = ()
+    """Ids of the records the payload refers to through ``ObjectRef``."""
+    path: str | None = None
+    """Name the object is bound to, or else where the snapshot found it
+    nested in a container, e.g. ``arr[0]``."""
+
+
+@dataclass(frozen=True)
+class ObjectRef:
+    """Stands in a container payload for an element with its own record."""
+
+    obj_id: str
+    label: str
+    """Name or path of the referenced object, as shown in its block header."""
+
+    def __str__(self) -> str:
+        return f"→{self.label}"
+
+
+@dataclass(frozen=True)
+class CapturePolicy:
+    """How much of a large container a snapshot copies."""
+
+    limit: int = 256
+    """Containers with more elements than this are captured as a window."""
+
+    head: int = 16
+    """Leading elements kept in a window."""
+
+    tail: int = 16
+    """Trailing elements kept in a window."""
+
+    focus: range | None = None
+    """Extra range of indices to keep, as requested by ``Snapshotter.page``."""
+
+    depth: int = 4
+    """Levels of nested containers recorded below a bound name."""
+
+    nodes: int = 256
+    """Most nested objects recorded per snapshot; the rest are shown inline."""
+
+
+@dataclass(frozen=True)
+class PayloadWindow:
+    """Bounded capture of a container too large to copy whole.
+
+    Only a few runs of elements are copied; ``fingerprint`` still covers
+    every element, so in-place changes outside the runs are detected.
+    """
+
+    length: int
+    """Number of elements in the whole container."""
+
+    segments: tuple[tuple[int, list | dict], ...]
+    """``(start, elements)`` runs in index order, without overlaps. Hash
+    tables use dicts of their entries in insertion order."""
+
+    fingerprint: object | None = None
+
+    @property
+    def shown(self) -> int:
+        return sum(len(elements) for _, elements in self.segments)
+
+
+@dataclass(frozen=True)
+class RenderedPayload:
+    """Content rendered in place of a payload that stays live.
+
+    Node-based records (a linked list head, a tree root) keep the live node
+    as their payload; a record kept for later, like a timeline frame, holds
+    its rendering instead so later edits to the nodes do not show in it.
+    """
+
+    content: str
 
 
 @dataclass(frozen=True)
@@ -54,192 +170,992 @@ class Snapshot:
     objects: dict[str, ObjectRecord]
 
 
-def diff_snapshots(previous: Snapshot, current: Snapshot) -> Snapshot:
-    names: dict[str, object] = {}
+def diff_snapshots(
+    previous: Snapshot, current: Snapshot, names: Iterable[str] | None = None
+) -> Snapshot:
+    """Return the bindings of ``current`` that are new or changed.
+
+    A name changes when it is rebound or when its object was mutated in
+    place, as told by the records' fingerprints. Records carried over from
+    ``previous`` are skipped by identity. With ``names``, only those names
+    are compared.
+    """
+    changed: dict[str, object] = {}
     objects: dict[str, ObjectRecord] = {}
+    wanted = None if names is None else set(names)
     for name, target in current.names.items():
-        if name not in previous.names or previous.names[name] != target:
-            names[name] = target
-            if isinstance(target, str) and target in current.objects:
-                objects[target] = current.objects[target]
-    return Snapshot(names=names, objects=objects)
+        if wanted is not None and name not in wanted:
+            continue
+        if name in previous.names and previous.names[name] == target:
+            if not _object_changed(previous, current, target):
+                continue
+        changed[name] = target
+        if isinstance(target, str):
+            for obj_id in reachable_ids(current.objects, [target]):
+                objects[obj_id] = current.objects[obj_id]
+    return Snapshot(names=changed, objects=objects)
+
+
+def reachable_ids(
+    objects: Mapping[str, ObjectRecord], roots: Iterable[object]
+) -> list[str]:
+    """Ids of the records reachable from ``roots`` through their children,
+    in breadth-first order."""
+    order: list[str] = []
+    seen: set[str] = set()
+    queue = deque(root for root in roots if isinstance(root, str))
+    while queue:
+        obj_id = queue.popleft()
+        if obj_id in seen or obj_id not in objects:
+            continue
+        seen.add(obj_id)
+        order.append(obj_id)
+        queue.extend(objects[obj_id].children)
+    return order
+
+
+def _object_changed(previous: Snapshot, current: Snapshot, target: object) -> bool:
+    """Whether the object or any object nested in it changed."""
+    if not isinstance(target, str):
+        return False
+    seen: set[str] = set()
+    pending = [target]
+    while pending:
+        obj_id = pending.pop()
+        if obj_id in seen:
+            continue
+        seen.add(obj_id)
+        old = previous.objects.get(obj_id)
+        new = current.objects.get(obj_id)
+        if old is not new:
+            if old is None or new is None:
+                return True
+            if old.fingerprint is None or new.fingerprint is None:
+                # Rebuilt without a fingerprint: assume it may have changed.
+                return True
+            if old.fingerprint != new.fingerprint or old.children != new.children:
+                return True
+        if new is not None:
+            # A carried-over record can still hold rebuilt children.
+            pending.extend(new.children)
+    return False
+
+
+@dataclass
+class _Walk:
+    """One snapshot's breadth-first walk through nested containers."""
+
+    budget: int
+    """Nested objects that may still be added."""
+
+    seen: set[str] = field(default_factory=set)
+    """Records visited or queued during this snapshot."""
+
+    labels: dict[str, str] = field(default_factory=dict)
+    """Name or path shown for each object, by id."""
+
+    queue: deque[tuple[str, object, int]] = field(default_factory=deque)
+    """``(obj_id, value, depth)`` still to visit."""
+
+    relinked: bool = False
+    """Whether a record's children changed, which may orphan records."""
+
+    written: set[str] = field(default_factory=set)
+    """Records of objects written to other than through their methods, and
+    of the objects nested in them; their versions cannot be trusted."""
 
 
 class Snapshotter:
-    def __init__(self) -> None:
-        self._id_map: dict[int, str] = {}
+    def __init__(self, policy: CapturePolicy | None = None) -> None:
+        self.policy = policy or CapturePolicy()
+        # id(value) -> (obj_id, weak reference, pinned value). Exactly one of
+        # the last two is set; both keep a dead object's id from being
+        # handed to a new object that reuses its address.
+        self._id_map: dict[
+            int, tuple[str, weakref.ref | None, object | None]
+        ] = {}
+        # obj_id -> id(value), the reverse of _id_map.
+        self._keys: dict[str, int] = {}
+        # Objects that cannot be weakly referenced (list, dict, ...). They
+        # stay pinned while a snapshot shows them.
+        self._pinned: set[str] = set()
+        # Snapshots in which a structure was written to directly, by id.
+        self._writes: dict[str, int] = {}
         self._counter = 0
 
-    def snapshot(self, globals_dict: dict[str, object]) -> Snapshot:
+    def snapshot(
+        self,
+        globals_dict: dict[str, object],
+        *,
+        previous: Snapshot | None = None,
+        names: Iterable[str] | None = None,
+        written: Collection[str] = (),
+    ) -> Snapshot:
+        """Snapshot the visible bindings in ``globals_dict``.
+
+        Objects nested in containers get records of their own, reached by a
+        breadth-first walk bounded by ``policy.depth`` and ``policy.nodes``;
+        an object reached twice is recorded once.
+
+        With ``previous`` and ``names``, only those names (and what they
+        contain) are re-read and every other binding and record is carried
+        over from ``previous``. Records of structures reached from a name in
+        ``written`` are rebuilt even when their version is unchanged, since
+        their nodes may have been edited directly (``ll.head.data = 5``).
+        After any such write, every bound node-based structure is checked
+        again too, in case the edit went through an alias of one of its
+        nodes (``n = ll.head; n.data = 5``).
+        """
+        if previous is None or names is None:
+            return self._full_snapshot(globals_dict)
+
+        bindings = dict(previous.names)
+        objects = dict(previous.objects)
+        walk = _Walk(self.policy.nodes)
+        stale = False
+        for name in names:
+            if name in bindings:
+                stale = True
+            # Assign in place so rebound names keep their display order.
+            if name not in globals_dict or not self._add_binding(
+                name, globals_dict[name], bindings, walk
+            ):
+                bindings.pop(name, None)
+            elif name in written and _is_obj_id(bindings[name]):
+                walk.written.add(bindings[name])
+        if written:
+            self._recheck_node_structures(bindings, walk)
+        self._walk(bindings, objects, walk)
+        if stale or walk.relinked:
+            # Drop records no longer reachable from any name.
+            reachable = set(reachable_ids(objects, bindings.values()))
+            for obj_id in [obj_id for obj_id in objects if obj_id not in reachable]:
+                del objects[obj_id]
+                self._unpin(obj_id)
+        return Snapshot(names=bindings, objects=objects)
+
+    def _recheck_node_structures(
+        self, bindings: dict[str, object], walk: _Walk
+    ) -> None:
+        for target in bindings.values():
+            if not _is_obj_id(target) or target in walk.seen:
+                continue
+            value = self.live(target)
+            if type(value) in _NODE_FIELDS:
+                walk.seen.add(target)
+                walk.queue.append((target, value, 0))
+
+    def _full_snapshot(self, globals_dict: dict[str, object]) -> Snapshot:
         names: dict[str, object] = {}
         objects: dict[str, ObjectRecord] = {}
+        walk = _Walk(self.policy.nodes)
         for name, value in globals_dict.items():
-            if name.startswith("__"):
-                continue
-            if name in BUILTIN_NAMES:
-                continue
-            if isinstance(value, PRIMITIVE_TYPES):
-                names[name] = value
-            elif isinstance(value, (types.FunctionType, type)):
-                continue
-            else:
-                obj_id = self._get_or_create_id(value)
-                names[name] = obj_id
-                if obj_id not in objects:
-                    objects[obj_id] = self._build_object_record(obj_id, value)
+            self._add_binding(name, value, names, walk)
+        self._walk(names, objects, walk)
+        for obj_id in [obj_id for obj_id in self._pinned if obj_id not in objects]:
+            self._unpin(obj_id)
         return Snapshot(names=names, objects=objects)
 
+    def _add_binding(
+        self, name: str, value: object, names: dict[str, object], walk: _Walk
+    ) -> bool:
+        """Record ``name`` if it is visible; return whether it was.
+
+        Objects are queued on ``walk`` to be recorded by ``_walk``.
+        """
+        if name.startswith("__"):
+            return False
+        if name in BUILTIN_NAMES:
+            return False
+        if isinstance(value, PRIMITIVE_TYPES):
+            names[name] = value
+        elif isinstance(value, (types.FunctionType, type, types.ModuleType)):
+            return False
+        else:
+            obj_id = self._get_or_create_id(value)
+            names[name] = obj_id
+            if obj_id not in walk.seen:
+                walk.seen.add(obj_id)
+                walk.queue.append((obj_id, value, 0))
+        return True
+
+    def _walk(
+        self,
+        names: dict[str, object],
+        objects: dict[str, ObjectRecord],
+        walk: _Walk,
+    ) -> None:
+        """Record every queued object, then the objects nested in them.
+
+        Each record is rebuilt once, unless its structure's version shows
+        it has not changed; the objects nested in it are visited anyway.
+        """
+        for name, target in names.items():
+            if _is_obj_id(target):
+                walk.labels.setdefault(target, name)
+        while walk.queue:
+            obj_id, value, depth = walk.queue.popleft()
+            record = objects.get(obj_id)
+            version = _mutation_version(value)
+            if version is not None:
+                # Count the direct writes too, so that a rebuild they
+                # forced gets a fingerprint of its own.
+                if obj_id in walk.written:
+                    self._writes[obj_id] = self._writes.get(obj_id, 0) + 1
+                version += (self._writes.get(obj_id, 0),)
+            if record is None or version is None or record.version != version:
+                rebuilt = self._build_record(obj_id, value, version, depth, walk)
+                if obj_id in walk.written:
+                    walk.written.update(rebuilt.children)
+                if record is None or rebuilt.children != record.children:
+                    walk.relinked = True
+                objects[obj_id] = rebuilt
+                continue
+            for child_id in record.children:
+                child = self.live(child_id)
+                if child_id not in walk.seen and child is not None:
+                    walk.seen.add(child_id)
+                    walk.queue.append((child_id, child, depth + 1))
+
+    def _build_record(
+        self,
+        obj_id: str,
+        value: object,
+        version: tuple | None,
+        depth: int = 0,
+        walk: _Walk | None = None,
+    ) -> ObjectRecord:
+        record = self._build_object_record(obj_id, value)
+        if walk is not None:
+            record = self._link_children(record, depth, walk)
+        if version is not None:
+            return replace(record, version=version, fingerprint=version)
+        return replace(record, fingerprint=_payload_fingerprint(record))
+
+    def _link_children(
+        self, record: ObjectRecord, depth: int, walk: _Walk
+    ) -> ObjectRecord:
+        """Replace the objects in a container payload with ``ObjectRef``."""
+        label = walk.labels.get(record.obj_id, record.obj_id)
+        linker = _LINKERS.get(record.dsa_type)
+        if linker is None:
+            return replace(record, path=label)
+        children: dict[str, None] = {}
+
+        def link(value: object, suffix: str) -> object:
+            if isinstance(value, _INLINE_TYPES):
+                return value
+            child_id = self._visit_child(value, depth + 1, f"{label}{suffix}", walk)
+            if child_id is None:
+                return value
+            children[child_id] = None
+            return ObjectRef(child_id, walk.labels[child_id])
+
+        payload = record.payload
+        if isinstance(payload, PayloadWindow):
+            payload = replace(
+                payload,
+                segments=tuple(
+                    (start, linker(elements, link, start))
+                    for start, elements in payload.segments
+                ),
+            )
+        elif payload is not None:
+            payload = linker(payload, link, 0)
+        return replace(record, payload=payload, children=tuple(children), path=label)
+
+    def _visit_child(
+        self, value: object, depth: int, path: str, walk: _Walk
+    ) -> str | None:
+        """Queue a nested object and return its id, or None to show it inline.
+
+        Objects already part of this snapshot are always linked; new ones
+        only within the depth and node budgets.
+        """
+        known = self._known_id(value)
+        if known is not None and known in walk.seen:
+            return known
+        if depth > self.policy.depth or walk.budget <= 0:
+            return None
+        obj_id = known or self._get_or_create_id(value)
+        walk.budget -= 1
+        walk.seen.add(obj_id)
+        walk.labels.setdefault(obj_id, path)
+        walk.queue.append((obj_id, value, depth))
+        return obj_id
+
+    def _known_id(self, value: object) -> str | None:
+        entry = self._id_map.get(id(value))
+        if entry is None:
+            return None
+        obj_id, ref, pinned = entry
+        return obj_id if (pinned if ref is None else ref()) is value else None
+
+    def live(self, obj_id: str) -> object | None:
+        """The object behind ``obj_id``, if it is still alive."""
+        key = self._keys.get(obj_id)
+        entry = self._id_map.get(key) if key is not None else None
+        if entry is None or entry[0] != obj_id:
+            return None
+        return entry[2] if entry[1] is None else entry[1]()
+
     def _get_or_create_id(self, value: object) -> str:
+        known = self._known_id(value)
+        if known is not None:
+            return known
         key = id(value)
-        if key not in self._id_map:
-            self._counter += 1
-            self._id_map[key] = f"obj#{self._counter}"
-        return self._id_map[key]
-
-    def _build_object_record(self, obj_id: str, value: object) -> ObjectRecord:
-        py_type = type(value).__name__
-        address = hex(id(value))
-        if isinstance(value, list):
-            return ObjectRecord(
-                obj_id,
-                address,
-                py_type,
-                "Array",
-                f"len={len(value)}",
-                list(value),
-            )
-        if isinstance(value, dict):
-            return ObjectRecord(
-                obj_id,
-                address,
-                py_type,
-                "Hash Table",
-                f"size={len(value)}",
-                dict(value),
-            )
-        if isinstance(value, Stack):
-            items = value.items()
-            return ObjectRecord(
-                obj_id,
-                address,
-                py_type,
-                "Stack",
-                f"size={len(items)}",
-                items,
-            )
-        if isinstance(value, Queue):
-            items = value.items()
-            return ObjectRecord(
-                obj_id,
-                address,
-                py_type,
-                "Queue",
-                f"size={len(items)}",
-                items,
-            )
-        if isinstance(value, MinHeap):
-            items = value.items()
-            return ObjectRecord(
-                obj_id,
-                address,
-                py_type,
-                "Min Heap",
-                f"size={len(items)}",
-                items,
-            )
-        if isinstance(value, Graph):
-            adjacency = value.adjacency()
-            return ObjectRecord(
-                obj_id,
-                address,
-                py_type,
-                "Directed Graph" if value.directed else "Undirected Graph",
-                f"nodes={len(adjacency)}",
-                adjacency,
-            )
-        if _is_heap_like(value):
-            items = _heap_items(value)
-            return ObjectRecord(
-                obj_id,
-                address,
-                py_type,
-                "Min Heap",
-                f"size={len(items)}",
-                items,
-            )
-        if _is_graph_like(value):
-            adjacency, directed = _graph_payload(value)
-            return ObjectRecord(
-                obj_id,
-                address,
-                py_type,
-                "Directed Graph" if directed else "Undirected Graph",
-                f"nodes={len(adjacency)}",
-                adjacency,
-            )
-        if _is_stack_like(value):
-            items = _stack_items(value)
-            return ObjectRecord(
-                obj_id,
-                address,
-                py_type,
-                "Stack",
-                f"size={len(items)}",
-                items,
-            )
-        if _is_queue_like(value):
-            items = _queue_items(value)
-            return ObjectRecord(
-                obj_id,
-                address,
-                py_type,
-                "Queue",
-                f"size={len(items)}",
-                items,
-            )
-        if isinstance(value, BinarySearchTree):
-            return ObjectRecord(
-                obj_id,
-                address,
-                py_type,
-                "Binary Search Tree",
-                "rooted",
-                value.root,
-            )
-        is_tree, tree_root = _binary_tree_payload(value)
-        if is_tree:
-            return ObjectRecord(
-                obj_id,
-                address,
-                py_type,
-                "Binary Tree",
-                "rooted",
-                tree_root,
-            )
-        is_doubly, doubly_head = _doubly_linked_list_payload(value)
-        if is_doubly:
-            doubly_len = _linked_list_length(doubly_head)
-            return ObjectRecord(
-                obj_id,
-                address,
-                py_type,
-                "Doubly Linked List",
-                f"len={doubly_len}",
-                doubly_head,
-            )
+        self._counter += 1
+        obj_id = f"obj#{self._counter}"
+        try:
+            ref = weakref.ref(value, self._forget_callback(key, obj_id))
+        except TypeError:
+            self._id_map[key] = (obj_id, None, value)
+            self._pinned.add(obj_id)
+        else:
+            self._id_map[key] = (obj_id, ref, None)
+        self._keys[obj_id] = key
+        return obj_id
+
+    def _forget_callback(self, key: int, obj_id: str):
+        id_map = self._id_map
+        keys = self._keys
+        writes = self._writes
+
+        def forget(ref: weakref.ref) -> None:
+            # The address may already belong to a newer object's entry.
+            entry = id_map.get(key)
+            if entry is not None and entry[1] is ref:
+                del id_map[key]
+            keys.pop(obj_id, None)
+            writes.pop(obj_id, None)
+
+        return forget
+
+    def _unpin(self, obj_id: str) -> None:
+        """Release a pinned object once no snapshot shows it any more."""
+        if obj_id in self._pinned:
+            self._pinned.discard(obj_id)
+            self._id_map.pop(self._keys.pop(obj_id), None)
+
+    def page(self, value: object, start: int, stop: int) -> ObjectRecord:
+        """Record ``value`` with its elements ``[start:stop]`` captured too.
+
+        For containers captured as a window, this reads another run of the
+        live object (at most ``policy.limit`` elements); smaller objects
+        get their usual record.
+        """
+        stop = min(stop, start + self.policy.limit)
+        policy = replace(self.policy, focus=range(max(start, 0), max(stop, 0)))
+        return self._build_object_record(self._get_or_create_id(value), value, policy)
+
+    def _build_object_record(
+        self, obj_id: str, value: object, policy: CapturePolicy | None = None
+    ) -> ObjectRecord:
+        dsa_type, summary, payload = _describe(value, policy or self.policy)
+        return ObjectRecord(
+            obj_id, hex(id(value)), type(value).__name__, dsa_type, summary, payload
+        )
+
+
+_Description = tuple[str, str, object]
+"""``(dsa_type, summary, payload)`` of an object record."""
+
+_Describer = Callable[[object, CapturePolicy], _Description | None]
+
+
+def _describe(value: object, policy: CapturePolicy) -> _Description:
+    """Classify ``value`` and extract its record fields.
+
+    The first object of each class runs the full probe chain; the matching
+    describer is then cached for the class and later objects only run
+    that one. A cached describer that no longer fits (say, a ``head``
+    that stopped being a node) falls back to the full chain.
+    """
+    kind = type(value)
+    describer = _CLASS_DESCRIBERS.lookup(kind)
+    if describer is not None:
+        description = describer(value, policy)
+        if description is not None:
+            return description
+    describer = _classify(value)
+    description = describer(value, policy) if describer is not None else None
+    if description is None:
+        # Empty trees and lists: what they are depends on the node they
+        # hold later, so they are described without caching.
+        return _describe_empty(value)
+    _CLASS_DESCRIBERS.store(kind, describer)
+    return description
+
+
+class _ClassCache(Generic[T]):
+    """Per-class cache of derived values, invalidated when the class changes.
+
+    A class counts as changed when an attribute is added to or removed from
+    it or any of its bases, or when its bases are reassigned; redefining a
+    class in a cell creates a new class and so a new entry. Instances of a
+    class are assumed to share the attributes the probes look at.
+    """
+
+    def __init__(self) -> None:
+        self._entries: weakref.WeakKeyDictionary[type, tuple[tuple, T]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def lookup(self, kind: type) -> T | None:
+        try:
+            signature, value = self._entries[kind]
+        except (KeyError, TypeError):
+            return None
+        return value if signature == _class_signature(kind) else None
+
+    def store(self, kind: type, value: T) -> None:
+        try:
+            self._entries[kind] = (_class_signature(kind), value)
+        except TypeError:
+            pass
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _class_signature(kind: type) -> tuple:
+    # Ids rather than the classes themselves, so the cache entry does not
+    # keep its (weakly held) class alive.
+    return tuple((id(base), len(vars(base))) for base in kind.__mro__)
+
+
+_CLASS_DESCRIBERS: _ClassCache[_Describer] = _ClassCache()
+
+# Classes plugins show as a DSA type of their own, by type name; plugins add
+# them through the "dsa_visualizer.types" entry point group. A class is
+# classified once, so register it before its first object is snapshotted.
+DSA_TYPES: LazyRegistry[type] = LazyRegistry(TYPE_GROUP, {})
+
+_FIELD_SCHEMAS: _ClassCache[tuple[tuple[str, ...], bool]] = _ClassCache()
+"""Slot names and whether instances have a ``__dict__``, by class."""
+
+
+def _classify(value: object) -> _Describer | None:
+    """Run the full probe chain and return the matching describer."""
+    dsa_type = DSA_TYPES.match_class(type(value))
+    if dsa_type is not None:
+        return _registered_describer(dsa_type)
+    if isinstance(value, list):
+        return _describe_array
+    if isinstance(value, dict):
+        return _describe_hash_table
+    if isinstance(value, Stack):
+        return _describe_stack
+    if isinstance(value, Queue):
+        return _describe_queue
+    if isinstance(value, MinHeap):
+        return _describe_heap
+    if isinstance(value, Graph):
+        return _describe_graph
+    if _is_heap_like(value):
+        return _describe_heap_like
+    if _is_graph_like(value):
+        return _describe_graph_like
+    if _is_stack_like(value):
+        return _describe_stack_like
+    if _is_queue_like(value):
+        return _describe_queue_like
+    if isinstance(value, BinarySearchTree):
+        return _describe_search_tree
+    is_tree, tree_root = _binary_tree_payload(value)
+    if is_tree:
+        return _describe_binary_tree if tree_root is not None else None
+    is_doubly, doubly_head = _doubly_linked_list_payload(value)
+    if is_doubly:
+        return _describe_doubly_linked_list if doubly_head is not None else None
+    is_linked_list, linked_head = _linked_list_payload(value)
+    if is_linked_list:
+        return _describe_linked_list if linked_head is not None else None
+    return _describe_object
+
+
+def _registered_describer(dsa_type: str) -> _Describer:
+    """Describe objects of a registered class; the object is the payload."""
+
+    def describe(value: object, policy: CapturePolicy) -> _Description:
+        try:
+            summary = f"len={len(value)}"
+        except TypeError:
+            summary = ""
+        return dsa_type, summary, value
 
-        is_linked_list, linked_head = _linked_list_payload(value)
-        if is_linked_list:
-            linked_len = _linked_list_length(linked_head)
-            return ObjectRecord(
-                obj_id,
-                address,
-                py_type,
-                "Linked List",
-                f"len={linked_len}",
-                linked_head,
+    return describe
+
+
+def _describe_empty(value: object) -> _Description:
+    """Describe an object whose ``root`` or ``head`` is None."""
+    if _binary_tree_payload(value)[0]:
+        return "Binary Tree", "rooted", None
+    if _doubly_linked_list_payload(value)[0]:
+        return "Doubly Linked List", "len=0", None
+    return "Linked List", "len=0", None
+
+
+def _describe_array(value: object, policy: CapturePolicy) -> _Description:
+    summary = f"len={len(value)}"
+    if len(value) <= policy.limit:
+        return "Array", summary, list(value)
+    window = _sequence_window(
+        value, policy, policy.head, policy.tail, _sequence_fingerprint(value)
+    )
+    return "Array", summary, window
+
+
+def _describe_hash_table(value: object, policy: CapturePolicy) -> _Description:
+    summary = f"size={len(value)}"
+    if len(value) <= policy.limit:
+        return "Hash Table", summary, dict(value)
+    return "Hash Table", summary, _mapping_window(value, policy)
+
+
+def _describe_stack(value: object, policy: CapturePolicy) -> _Description:
+    # The library structures are read in place; their version stands in
+    # for a fingerprint. The top of a stack is its tail.
+    items = value._items
+    return "Stack", f"size={len(items)}", _capture(items, policy, 0, policy.tail)
+
+
+def _describe_queue(value: object, policy: CapturePolicy) -> _Description:
+    items = value._items
+    return (
+        "Queue",
+        f"size={len(items)}",
+        _capture(items, policy, policy.head, policy.tail),
+    )
+
+
+def _describe_heap(value: object, policy: CapturePolicy) -> _Description:
+    # Leading elements are the top levels of the tree; trailing ones would
+    # not form a drawable tree on their own.
+    items = value._items
+    return "Min Heap", f"size={len(items)}", _capture(items, policy, policy.head, 0)
+
+
+def _describe_graph(value: object, policy: CapturePolicy) -> _Description:
+    adjacency = value.adjacency()
+    return (
+        "Directed Graph" if value.directed else "Undirected Graph",
+        f"nodes={len(adjacency)}",
+        adjacency,
+    )
+
+
+def _describe_heap_like(value: object, policy: CapturePolicy) -> _Description:
+    items = _heap_items(value)
+    return (
+        "Min Heap",
+        f"size={len(items)}",
+        _capture(items, policy, policy.head, 0, fingerprint=True),
+    )
+
+
+def _describe_graph_like(value: object, policy: CapturePolicy) -> _Description:
+    adjacency, directed = _graph_payload(value)
+    return (
+        "Directed Graph" if directed else "Undirected Graph",
+        f"nodes={len(adjacency)}",
+        adjacency,
+    )
+
+
+def _describe_stack_like(value: object, policy: CapturePolicy) -> _Description:
+    items = _stack_items(value)
+    return (
+        "Stack",
+        f"size={len(items)}",
+        _capture(items, policy, 0, policy.tail, fingerprint=True),
+    )
+
+
+def _describe_queue_like(value: object, policy: CapturePolicy) -> _Description:
+    items = _queue_items(value)
+    return (
+        "Queue",
+        f"size={len(items)}",
+        _capture(items, policy, policy.head, policy.tail, fingerprint=True),
+    )
+
+
+def _describe_search_tree(value: object, policy: CapturePolicy) -> _Description:
+    return "Binary Search Tree", "rooted", value.root
+
+
+def _describe_binary_tree(value: object, policy: CapturePolicy) -> _Description | None:
+    is_tree, tree_root = _binary_tree_payload(value)
+    if not is_tree:
+        return None
+    return "Binary Tree", "rooted", tree_root
+
+
+def _describe_doubly_linked_list(
+    value: object, policy: CapturePolicy
+) -> _Description | None:
+    is_doubly, doubly_head = _doubly_linked_list_payload(value)
+    if not is_doubly or doubly_head is None:
+        return None
+    return "Doubly Linked List", _chain_summary(doubly_head), doubly_head
+
+
+def _describe_linked_list(
+    value: object, policy: CapturePolicy
+) -> _Description | None:
+    is_linked_list, linked_head = _linked_list_payload(value)
+    if not is_linked_list or linked_head is None:
+        return None
+    return "Linked List", _chain_summary(linked_head), linked_head
+
+
+def _describe_object(value: object, policy: CapturePolicy) -> _Description:
+    fields = _object_fields(value, policy.limit)
+    if fields is None:
+        return "Object", "unrendered", None
+    return "Object", f"fields={len(fields)}", fields
+
+
+def _object_fields(value: object, limit: int) -> dict[str, object] | None:
+    """Read up to ``limit`` fields of a plain object, or None if it has none.
+
+    Only instances of user-defined classes are read; library and builtin
+    objects come back as None. Slot names come from the class's cached
+    schema; ``__dict__`` entries are read per instance.
+    """
+    kind = type(value)
+    schema = _FIELD_SCHEMAS.lookup(kind)
+    if schema is None:
+        schema = _field_schema(kind)
+        _FIELD_SCHEMAS.store(kind, schema)
+    slots, has_dict = schema
+    if not slots and not has_dict:
+        return None
+    fields: dict[str, object] = {}
+    for name in slots:
+        try:
+            fields[name] = getattr(value, name)
+        except AttributeError:
+            continue  # Declared but never assigned.
+    if has_dict:
+        try:
+            namespace = object.__getattribute__(value, "__dict__")
+        except AttributeError:
+            namespace = {}
+        for name, field in namespace.items():
+            if not name.startswith("__"):
+                fields.setdefault(name, field)
+            if len(fields) >= limit:
+                break
+    return dict(islice(fields.items(), limit))
+
+
+def _field_schema(kind: type) -> tuple[tuple[str, ...], bool]:
+    if not _is_user_class(kind):
+        return (), False
+    slots: list[str] = []
+    for base in reversed(kind.__mro__):
+        declared = vars(base).get("__slots__", ())
+        if isinstance(declared, str):
+            declared = (declared,)
+        for name in declared:
+            if name in ("__dict__", "__weakref__"):
+                continue
+            if name.startswith("__") and not name.endswith("__"):
+                name = f"_{base.__name__.lstrip('_')}{name}"
+            if name not in slots:
+                slots.append(name)
+    return tuple(slots), getattr(kind, "__dictoffset__", 0) != 0
+
+
+_HEAP_TYPE = 1 << 9  # Py_TPFLAGS_HEAPTYPE: the class was built at runtime.
+_LIBRARY_PATHS = tuple(
+    {os.path.join(path, "") for path in sysconfig.get_paths().values()}
+)
+
+
+def _is_user_class(kind: type) -> bool:
+    """Whether ``kind`` was defined in a cell or in the user's own files.
+
+    Cells run without a ``__name__``, so their classes report the
+    ``builtins`` module; the real builtins are static types.
+    """
+    module_name = getattr(kind, "__module__", None)
+    if module_name in ("builtins", "__main__"):
+        return bool(kind.__flags__ & _HEAP_TYPE)
+    module = sys.modules.get(module_name) if module_name else None
+    path = getattr(module, "__file__", None)
+    if not path:
+        return False
+    return not os.path.abspath(path).startswith(_LIBRARY_PATHS)
+
+
+def _capture(
+    items: Sequence[object],
+    policy: CapturePolicy,
+    head: int,
+    tail: int,
+    *,
+    fingerprint: bool = False,
+) -> list[object] | PayloadWindow:
+    """Copy ``items`` whole, or as a window when longer than the limit."""
+    if len(items) <= policy.limit:
+        return list(items)
+    return _sequence_window(
+        items, policy, head, tail, _sequence_fingerprint(items) if fingerprint else None
+    )
+
+
+def _window_ranges(
+    length: int, policy: CapturePolicy, head: int, tail: int
+) -> list[tuple[int, int]]:
+    """Merged, sorted ``[start, stop)`` runs to copy out of ``length``."""
+    ranges = [(0, min(head, length)), (max(length - tail, 0), length)]
+    if policy.focus is not None:
+        focus = policy.focus
+        ranges.append((min(focus.start, length), min(focus.stop, length)))
+    merged: list[tuple[int, int]] = []
+    for start, stop in sorted(ranges):
+        if start >= stop:
+            continue
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+        else:
+            merged.append((start, stop))
+    return merged
+
+
+def _sequence_window(
+    items: Sequence[object],
+    policy: CapturePolicy,
+    head: int,
+    tail: int,
+    fingerprint: object | None,
+) -> PayloadWindow:
+    length = len(items)
+    segments = tuple(
+        (start, list(items[start:stop]))
+        for start, stop in _window_ranges(length, policy, head, tail)
+    )
+    return PayloadWindow(length, segments, fingerprint)
+
+
+def _mapping_window(
+    mapping: Mapping[object, object], policy: CapturePolicy
+) -> PayloadWindow:
+    length = len(mapping)
+    segments = []
+    for start, stop in _window_ranges(length, policy, policy.head, policy.tail):
+        if stop == length:
+            # Read the tail from the end instead of skipping to it.
+            entries = list(islice(reversed(mapping.items()), stop - start))
+            entries.reverse()
+        else:
+            entries = list(islice(mapping.items(), start, stop))
+        segments.append((start, dict(entries)))
+    return PayloadWindow(length, tuple(segments), _mapping_fingerprint(mapping))
+
+
+def _sequence_fingerprint(items: Iterable[object]) -> bytes:
+    """Digest every element without keeping a copy of the container.
+
+    Elements are read one chunk at a time, so only a chunk is ever copied.
+    """
+    digest = blake2b(digest_size=16)
+    iterator = iter(items)
+    while chunk := list(islice(iterator, _FINGERPRINT_CHUNK)):
+        digest.update(_chunk_bytes(chunk, _element_key))
+    return digest.digest()
+
+
+def _mapping_fingerprint(mapping: Mapping[object, object]) -> bytes:
+    digest = blake2b(digest_size=16)
+    iterator = iter(mapping.items())
+    while chunk := list(islice(iterator, _FINGERPRINT_CHUNK)):
+        digest.update(_chunk_bytes(chunk, _entry_key))
+    return digest.digest()
+
+
+def _chunk_bytes(chunk: list[object], key: Callable[[object], object]) -> bytes:
+    """Serialize a chunk by its elements' exact values.
+
+    Hashes cannot stand in for values, since ``hash(-1) == hash(-2)``.
+    Chunks holding anything marshal cannot write are serialized through
+    ``key`` instead.
+    """
+    try:
+        # Version 2 writes shared objects out in full, so equal chunks
+        # always give equal bytes.
+        return marshal.dumps(chunk, 2)
+    except ValueError:
+        return marshal.dumps([key(item) for item in chunk], 2)
+
+
+def _is_obj_id(target: object) -> bool:
+    return isinstance(target, str) and target.startswith("obj#")
+
+
+_Link = Callable[[object, str], object]
+
+
+def _link_sequence(items: list[object], link: _Link, start: int) -> list[object]:
+    return [link(item, f"[{index}]") for index, item in enumerate(items, start)]
+
+
+def _link_mapping(
+    mapping: dict[object, object], link: _Link, start: int
+) -> dict[object, object]:
+    return {key: link(value, f"[{key!r}]") for key, value in mapping.items()}
+
+
+def _link_fields(
+    fields: dict[str, object], link: _Link, start: int
+) -> dict[str, object]:
+    return {name: link(value, f".{name}") for name, value in fields.items()}
+
+
+def _link_adjacency(
+    adjacency: dict[object, list[object]], link: _Link, start: int
+) -> dict[object, list[object]]:
+    nodes = {
+        node: link(node, f".nodes[{index}]") for index, node in enumerate(adjacency)
+    }
+    return {
+        nodes[node]: [
+            link(neighbor, f".nodes[{index}][{position}]")
+            for position, neighbor in enumerate(neighbors)
+        ]
+        for index, (node, neighbors) in enumerate(adjacency.items())
+    }
+
+
+# How each kind of container payload refers to the objects it holds.
+_LINKERS: dict[str, Callable[[object, _Link, int], object]] = {
+    "Array": _link_sequence,
+    "Stack": _link_sequence,
+    "Queue": _link_sequence,
+    "Min Heap": _link_sequence,
+    "Hash Table": _link_mapping,
+    "Undirected Graph": _link_adjacency,
+    "Directed Graph": _link_adjacency,
+    "Object": _link_fields,
+}
+
+
+_VERSIONED_TYPES = frozenset({
+    LinkedList,
+    DoublyLinkedList,
+    Stack,
+    Queue,
+    BinaryTree,
+    BinarySearchTree,
+    MinHeap,
+    Graph,
+})
+
+
+# The value field and the links of each node-based structure's nodes.
+# Nodes are public, so an alias can edit one without the structure's
+# version changing; their contents are fingerprinted as well.
+_NODE_FIELDS: dict[type, tuple[str, tuple[str, ...]]] = {
+    LinkedList: ("data", ("next",)),
+    DoublyLinkedList: ("data", ("prev", "next")),
+    BinaryTree: ("value", ("left", "right")),
+    BinarySearchTree: ("value", ("left", "right")),
+}
+
+
+def _mutation_version(value: object) -> tuple | None:
+    """Cheap stand-in for a structure's contents, or None if it has none.
+
+    Subclasses are excluded since their methods may not bump the counter.
+    Node-based structures also depend on the nodes reachable from their
+    public head/root attribute.
+    """
+    kind = type(value)
+    if kind not in _VERSIONED_TYPES:
+        return None
+    if kind is LinkedList or kind is DoublyLinkedList:
+        return (value.version, _nodes_fingerprint(value.head, *_NODE_FIELDS[kind]))
+    if kind is BinaryTree or kind is BinarySearchTree:
+        return (value.version, _nodes_fingerprint(value.root, *_NODE_FIELDS[kind]))
+    if kind is Graph:
+        return (value.version, value.directed)
+    return (value.version,)
+
+
+def _nodes_fingerprint(
+    start: object | None, value_field: str, links: tuple[str, ...]
+) -> bytes:
+    """Digest the value and links of every node reachable from ``start``.
+
+    Nodes are visited once each by identity, so cycles terminate.
+    """
+    seen: set[int] = set()
+    pending = [start]
+
+    def entries() -> Iterable[object]:
+        while pending:
+            node = pending.pop()
+            if node is None or id(node) in seen:
+                continue
+            seen.add(id(node))
+            targets = [getattr(node, link, None) for link in links]
+            pending.extend(reversed(targets))
+            yield (
+                id(node),
+                _leaf_key(getattr(node, value_field, None)),
+                *map(id, targets),
             )
-        return ObjectRecord(obj_id, address, py_type, "Object", "unrendered", None)
+
+    return _sequence_fingerprint(entries())
+
+
+def _payload_fingerprint(record: ObjectRecord) -> object | None:
+    """Fingerprint a copied payload (list or dict); None for live node graphs."""
+    payload = record.payload
+    if isinstance(payload, PayloadWindow):
+        if payload.fingerprint is None:
+            return None
+        return (record.dsa_type, payload.fingerprint)
+    if isinstance(payload, list):
+        return (record.dsa_type, _sequence_fingerprint(payload))
+    if isinstance(payload, dict):
+        return (record.dsa_type, _mapping_fingerprint(payload))
+    return None
+
+
+def _element_key(value: object) -> object:
+    if type(value) is list:
+        # Graph adjacency lists are fresh copies; fold in their contents
+        # (one level only, so self-referencing lists cannot recurse).
+        return ("list", *map(_leaf_key, value))
+    return _leaf_key(value)
+
+
+def _entry_key(entry: tuple[object, object]) -> object:
+    key, value = entry
+    return (_element_key(key), _element_key(value))
+
+
+def _leaf_key(value: object) -> object:
+    """A marshallable key equal for equal primitives and the same object.
+
+    Other objects are keyed by identity: an object nested in a container
+    has a record, and so a fingerprint, of its own.
+    """
+    kind = type(value)
+    if kind in _EXACT_TYPES:
+        return value
+    if kind is ObjectRef:
+        return ("ref", value.obj_id, value.label)
+    if kind is tuple:
+        return ("tuple", *map(_leaf_key, value))
+    return (kind.__qualname__, id(value))
 
 
 def _linked_list_payload(value: object) -> tuple[bool, LinkedListNode | None]:
@@ -432,34 +1348,22 @@ def _graph_payload(value: object) -> tuple[dict[object, list[object]], bool]:
 
 
 def _node_chain_values(head: object) -> list[object]:
-    values: list[object] = []
-    seen: set[int] = set()
-    current = head
-    while _is_node_like(current):
-        node_id = id(current)
-        if node_id in seen:
-            break
-        seen.add(node_id)
-        if hasattr(current, "value"):
-            values.append(getattr(current, "value"))
-        else:
-            values.append(getattr(current, "data"))
-        current = getattr(current, "next", None)
-    return values
+    return [
+        getattr(node, "value") if hasattr(node, "value") else getattr(node, "data")
+        for node in iter_chain(head, _next_node_like)
+    ]
 
 
-def _linked_list_length(head: LinkedListNode | DoublyLinkedListNode | None) -> int:
-    seen: set[int] = set()
-    count = 0
-    current = head
-    while current is not None:
-        node_id = id(current)
-        if node_id in seen:
-            break
-        seen.add(node_id)
-        count += 1
-        current = current.next
-    return count
+def _next_node_like(node: object) -> object | None:
+    following = getattr(node, "next", None)
+    return following if _is_node_like(following) else None
+
+
+def _chain_summary(head: LinkedListNode | DoublyLinkedListNode) -> str:
+    shape = measure_chain(head)
+    if shape.cycle_start is None:
+        return f"len={shape.length}"
+    return f"len={shape.length}, cycle to [{shape.cycle_start}]"
 
 
 def _binary_tree_payload(value: object) -> tuple[bool, BinaryTreeNode | None]:
@@ -0,0 +1,205 @@
+"""History of a session's memory snapshots, for scrubbing back through it.
+
+Every snapshot is appended as a frame. Most frames only hold the bindings
+and records that changed since the previous snapshot; every
+``KEYFRAME_INTERVAL`` frames a keyframe holds them all, so rebuilding a
+snapshot replays a bounded number of frames. Records the Snapshotter
+carried over unchanged are shared between frames as is.
+
+List and dict payloads are stored in fixed-size chunks. A new version of
+a container reuses every chunk of the previous version whose elements are
+the same objects, so appending to a list stores one new chunk rather than
+another copy of the list. Payloads that stay live, like the head node of
+a linked list, are stored rendered.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+
+from dsa_visualizer.core.snapshotter import (
+    ObjectRecord,
+    ObjectRef,
+    PayloadWindow,
+    RenderedPayload,
+    Snapshot,
+    reachable_ids,
+)
+from dsa_visualizer.render.memory_view import render_object
+
+CHUNK_SIZE = 32
+"""Elements per stored payload chunk."""
+
+KEYFRAME_INTERVAL = 16
+"""Frames between two full copies of the bindings."""
+
+
+@dataclass(frozen=True)
+class _ChunkedList:
+    chunks: tuple[tuple[object, ...], ...]
+
+    @classmethod
+    def build(cls, values: list[object], base: _ChunkedList | None) -> _ChunkedList:
+        base_chunks = base.chunks if base is not None else ()
+        chunks = []
+        for index, start in enumerate(range(0, len(values), CHUNK_SIZE)):
+            chunk = tuple(values[start:start + CHUNK_SIZE])
+            if index < len(base_chunks) and _same_elements(base_chunks[index], chunk):
+                chunk = base_chunks[index]
+            chunks.append(chunk)
+        return cls(tuple(chunks))
+
+    def to_list(self) -> list[object]:
+        return [value for chunk in self.chunks for value in chunk]
+
+
+@dataclass(frozen=True)
+class _ChunkedDict:
+    keys: _ChunkedList
+    values: _ChunkedList
+
+    @classmethod
+    def build(
+        cls, mapping: dict[object, object], base: _ChunkedDict | None
+    ) -> _ChunkedDict:
+        return cls(
+            _ChunkedList.build(list(mapping), base.keys if base else None),
+            _ChunkedList.build(list(mapping.values()), base.values if base else None),
+        )
+
+    def to_dict(self) -> dict[object, object]:
+        return dict(zip(self.keys.to_list(), self.values.to_list()))
+
+
+@dataclass(frozen=True)
+class _Frame:
+    label: int | None
+    keyframe: bool
+    names: dict[str, object]
+    """All bindings (keyframe), or those new or rebound since the last frame."""
+    removed: frozenset[str]
+    objects: dict[str, ObjectRecord]
+    """All records (keyframe), or those rebuilt since the last frame."""
+
+
+class SnapshotTimeline:
+    """Every snapshot of a session, in order, with shared storage."""
+
+    def __init__(self, keyframe_interval: int = KEYFRAME_INTERVAL) -> None:
+        self.keyframe_interval = keyframe_interval
+        self._frames: list[_Frame] = []
+        self._last: Snapshot | None = None
+        # Stored (chunked) form of each record of the last snapshot.
+        self._stored: dict[str, ObjectRecord] = {}
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def label(self, index: int) -> int | None:
+        """Label the snapshot at ``index`` was appended with (a cell id)."""
+        return self._frames[index].label
+
+    def append(self, snapshot: Snapshot, label: int | None = None) -> None:
+        """Add ``snapshot`` after the last one, tagged with ``label``."""
+        previous = self._last
+        stored: dict[str, ObjectRecord] = {}
+        rebuilt: dict[str, ObjectRecord] = {}
+        for obj_id, record in snapshot.objects.items():
+            if previous is not None and previous.objects.get(obj_id) is record:
+                stored[obj_id] = self._stored[obj_id]
+            else:
+                stored[obj_id] = rebuilt[obj_id] = self._store(record)
+        self._stored = stored
+        self._last = snapshot
+
+        if previous is None or self._needs_keyframe(previous, snapshot):
+            self._frames.append(
+                _Frame(label, True, dict(snapshot.names), frozenset(), stored)
+            )
+            return
+        changed = {
+            name: target
+            for name, target in snapshot.names.items()
+            if name not in previous.names
+            or not _same_binding(previous.names[name], target)
+        }
+        removed = frozenset(previous.names.keys() - snapshot.names.keys())
+        self._frames.append(_Frame(label, False, changed, removed, rebuilt))
+
+    def snapshot_at(self, index: int) -> Snapshot:
+        """Rebuild the snapshot at ``index`` (negative counts from the end)."""
+        index = range(len(self._frames))[index]
+        start = index
+        while not self._frames[start].keyframe:
+            start -= 1
+        names: dict[str, object] = {}
+        objects: dict[str, ObjectRecord] = {}
+        for frame in self._frames[start:index + 1]:
+            for name in frame.removed:
+                del names[name]
+            names.update(frame.names)
+            objects.update(frame.objects)
+        return Snapshot(
+            names=names,
+            objects={
+                obj_id: _materialize(objects[obj_id])
+                for obj_id in reachable_ids(objects, names.values())
+            },
+        )
+
+    def _needs_keyframe(self, previous: Snapshot, snapshot: Snapshot) -> bool:
+        if len(self._frames) % self.keyframe_interval == 0:
+            return True
+        # Replaying a frame keeps surviving names in place and appends new
+        # ones; a snapshot ordered any other way is stored whole.
+        replayed = [name for name in previous.names if name in snapshot.names]
+        replayed.extend(name for name in snapshot.names if name not in previous.names)
+        return replayed != list(snapshot.names)
+
+    def _store(self, record: ObjectRecord) -> ObjectRecord:
+        base = self._stored.get(record.obj_id)
+        base_payload = base.payload if base is not None else None
+        payload = record.payload
+        if type(payload) is list:
+            if not isinstance(base_payload, _ChunkedList):
+                base_payload = None
+            shared = _ChunkedList.build(payload, base_payload)
+        elif type(payload) is dict:
+            if not isinstance(base_payload, _ChunkedDict):
+                base_payload = None
+            shared = _ChunkedDict.build(payload, base_payload)
+        elif _is_live(payload):
+            # Later cells may rewire the nodes; keep what they look like now.
+            shared = RenderedPayload(render_object(record))
+        else:
+            return record
+        return replace(record, payload=shared)
+
+
+def _materialize(record: ObjectRecord) -> ObjectRecord:
+    payload = record.payload
+    if isinstance(payload, _ChunkedList):
+        return replace(record, payload=payload.to_list())
+    if isinstance(payload, _ChunkedDict):
+        return replace(record, payload=payload.to_dict())
+    return record
+
+
+def _is_live(payload: object) -> bool:
+    return payload is not None and not isinstance(
+        payload, (list, dict, PayloadWindow, RenderedPayload)
+    )
+
+
+def _same_elements(left: tuple[object, ...], right: tuple[object, ...]) -> bool:
+    return len(left) == len(right) and all(map(_same_element, left, right))
+
+
+def _same_element(left: object, right: object) -> bool:
+    # References are rebuilt with every record but equal when they agree.
+    return left is right or (type(left) is ObjectRef and left == right)
+
+
+def _same_binding(left: object, right: object) -> bool:
+    # 1 == True, but they are displayed differently.
+    return left is right or (type(left) is type(right) and left == right)
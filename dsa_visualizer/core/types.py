@@ -10,6 +10,7 @@ class Cell:
     ok: bool = True
     error: str | None = None
     snapshot_text: str | None = None
+    deferred_snapshot: bool = False  # snapshot_text is fetched on first expand
 
 
 @dataclass(frozen=True)
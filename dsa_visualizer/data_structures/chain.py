@@ -0,0 +1,87 @@
+"""Walk chains of nodes linked through ``next``, cycles included.
+
+A chain may loop back on itself (``tail.next = head``). Rather than keep
+a set of every node visited, the walkers here use Brent's cycle detection,
+which needs only a couple of node references however long the chain is.
+Walking a chain therefore costs two passes over it: one to measure its
+shape, one to yield its nodes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ChainShape:
+    """How many distinct nodes a chain has and whether it loops."""
+
+    length: int
+    """Number of distinct nodes from the head."""
+
+    cycle_start: int | None = None
+    """Index of the node the last node links back to, or None if the
+    chain ends."""
+
+
+def next_node(node: object) -> object | None:
+    """The node after ``node``, or None at the end of the chain."""
+    return getattr(node, "next", None)
+
+
+def measure_chain(
+    head: object | None,
+    successor: Callable[[object], object | None] = next_node,
+) -> ChainShape:
+    """Measure the chain starting at ``head`` in O(1) extra memory.
+
+    ``successor`` returns the node after its argument, or None where the
+    chain ends. Nodes are compared by identity.
+    """
+    if head is None:
+        return ChainShape(0)
+    # Brent: the tortoise teleports to the hare at every power of two, so
+    # the hare meets it within one lap once both are inside the cycle.
+    power = cycle_length = 1
+    tortoise = head
+    hare = successor(head)
+    passed = 1
+    while hare is not tortoise:
+        if hare is None:
+            return ChainShape(passed)
+        if power == cycle_length:
+            tortoise = hare
+            power *= 2
+            cycle_length = 0
+        hare = successor(hare)
+        cycle_length += 1
+        passed += 1
+    # Walk two references ``cycle_length`` apart from the head; they meet
+    # where the cycle starts.
+    tortoise = hare = head
+    for _ in range(cycle_length):
+        hare = successor(hare)
+    start = 0
+    while tortoise is not hare:
+        tortoise = successor(tortoise)
+        hare = successor(hare)
+        start += 1
+    return ChainShape(start + cycle_length, start)
+
+
+def iter_chain(
+    head: object | None,
+    successor: Callable[[object], object | None] = next_node,
+    shape: ChainShape | None = None,
+) -> Iterator[object]:
+    """Yield each distinct node of the chain at ``head`` once, in order.
+
+    Pass the chain's ``shape`` when it was already measured.
+    """
+    if shape is None:
+        shape = measure_chain(head, successor)
+    current = head
+    for _ in range(shape.length):
+        yield current
+        current = successor(current)
@@ -3,6 +3,22 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterable, Iterator
 
+from dsa_visualizer.data_structures.chain import iter_chain
+
+
+class Versioned:
+    """Mixin for structures with a mutation version counter."""
+
+    _version = 0
+
+    @property
+    def version(self) -> int:
+        """Incremented by every method call that changes the structure."""
+        return self._version
+
+    def _changed(self) -> None:
+        self._version += 1
+
 
 @dataclass
 class LinkedListNode:
@@ -11,7 +27,7 @@ class LinkedListNode:
     address: int = 0
 
 
-class LinkedList:
+class LinkedList(Versioned):
     _address_counter = 0
     _address_step = 4
     _address_base = 0x1000
@@ -35,20 +51,14 @@ class LinkedList:
             self.tail.next = node
             self.tail = node
         self._length += 1
+        self._changed()
         return node
 
     def __len__(self) -> int:
         return self._length
 
     def nodes(self) -> Iterator[LinkedListNode]:
-        seen: set[int] = set()
-        current = self.head
-        while current is not None:
-            if id(current) in seen:
-                break
-            seen.add(id(current))
-            yield current
-            current = current.next
+        yield from iter_chain(self.head)
 
     @classmethod
     def _next_address(cls) -> int:
@@ -67,7 +77,7 @@ class DoublyLinkedListNode:
     next: DoublyLinkedListNode | None = None
 
 
-class DoublyLinkedList:
+class DoublyLinkedList(Versioned):
     def __init__(self, values: Iterable[object] | None = None) -> None:
         self.head: DoublyLinkedListNode | None = None
         self.tail: DoublyLinkedListNode | None = None
@@ -87,6 +97,7 @@ class DoublyLinkedList:
             self.tail.next = node
             self.tail = node
         self._length += 1
+        self._changed()
         return node
 
     def delete(self, value: object) -> bool:
@@ -102,6 +113,7 @@ class DoublyLinkedList:
                 else:
                     self.tail = current.prev
                 self._length -= 1
+                self._changed()
                 return True
             current = current.next
         return False
@@ -110,7 +122,7 @@ class DoublyLinkedList:
         return self._length
 
 
-class Stack:
+class Stack(Versioned):
     def __init__(self, values: Iterable[object] | None = None) -> None:
         self._items: list[object] = []
         if values is not None:
@@ -119,10 +131,12 @@ class Stack:
 
     def push(self, value: object) -> None:
         self._items.append(value)
+        self._changed()
 
     def pop(self) -> object | None:
         if not self._items:
             return None
+        self._changed()
         return self._items.pop()
 
     def peek(self) -> object | None:
@@ -137,7 +151,7 @@ class Stack:
         return list(self._items)
 
 
-class Queue:
+class Queue(Versioned):
     def __init__(self, values: Iterable[object] | None = None) -> None:
         self._items: list[object] = []
         if values is not None:
@@ -146,10 +160,12 @@ class Queue:
 
     def enqueue(self, value: object) -> None:
         self._items.append(value)
+        self._changed()
 
     def dequeue(self) -> object | None:
         if not self._items:
             return None
+        self._changed()
         return self._items.pop(0)
 
     def peek(self) -> object | None:
@@ -171,7 +187,7 @@ class BinaryTreeNode:
     right: BinaryTreeNode | None = None
 
 
-class BinaryTree:
+class BinaryTree(Versioned):
     def __init__(self, values: Iterable[object] | None = None) -> None:
         self.root: BinaryTreeNode | None = None
         if values is not None:
@@ -179,6 +195,7 @@ class BinaryTree:
                 self.insert(value)
 
     def insert(self, value: object) -> BinaryTreeNode:
+        self._changed()
         node = BinaryTreeNode(value=value)
         if self.root is None:
             self.root = node
@@ -216,6 +233,7 @@ class BinaryTree:
         if self.root.left is None and self.root.right is None:
             if self.root.value == value:
                 self.root = None
+                self._changed()
                 return True
             return False
 
@@ -237,6 +255,7 @@ class BinaryTree:
         if node_to_delete is None or last_node is None:
             return False
 
+        self._changed()
         node_to_delete.value = last_node.value
         if parent_of_last is not None:
             if parent_of_last.left is last_node:
@@ -255,7 +274,7 @@ class BSTNode:
     right: BSTNode | None = None
 
 
-class BinarySearchTree:
+class BinarySearchTree(Versioned):
     def __init__(self, values: Iterable[object] | None = None) -> None:
         self.root: BSTNode | None = None
         if values is not None:
@@ -263,6 +282,7 @@ class BinarySearchTree:
                 self.insert(value)
 
     def insert(self, value: object) -> BSTNode:
+        self._changed()
         node = BSTNode(value=value)
         if self.root is None:
             self.root = node
@@ -293,6 +313,8 @@ class BinarySearchTree:
 
     def delete(self, value: object) -> bool:
         self.root, deleted = self._delete_node(self.root, value)
+        if deleted:
+            self._changed()
         return deleted
 
     def _delete_node(
@@ -327,7 +349,7 @@ class BinarySearchTree:
         return node, True
 
 
-class MinHeap:
+class MinHeap(Versioned):
     def __init__(self, values: Iterable[object] | None = None) -> None:
         self._items: list[object] = []
         if values is not None:
@@ -337,10 +359,12 @@ class MinHeap:
     def insert(self, value: object) -> None:
         self._items.append(value)
         self._bubble_up(len(self._items) - 1)
+        self._changed()
 
     def pop_min(self) -> object | None:
         if not self._items:
             return None
+        self._changed()
         if len(self._items) == 1:
             return self._items.pop()
         root = self._items[0]
@@ -390,7 +414,7 @@ class MinHeap:
             index = smallest
 
 
-class Graph:
+class Graph(Versioned):
     def __init__(self, *, directed: bool = False) -> None:
         self.directed = directed
         self._adjacency: dict[object, list[object]] = {}
@@ -398,6 +422,7 @@ class Graph:
     def add_node(self, node: object) -> None:
         if node not in self._adjacency:
             self._adjacency[node] = []
+            self._changed()
 
     def add_edge(self, source: object, target: object) -> None:
         self.add_node(source)
@@ -405,6 +430,7 @@ class Graph:
         self._adjacency[source].append(target)
         if not self.directed:
             self._adjacency[target].append(source)
+        self._changed()
 
     def adjacency(self) -> dict[object, list[object]]:
         return {node: list(neighbors) for node, neighbors in self._adjacency.items()}
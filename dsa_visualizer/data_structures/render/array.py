@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from dsa_visualizer.algorithms.types import HighlightContext
 from dsa_visualizer.algorithms.render.highlights import (
     get_index_marker,
@@ -9,24 +11,27 @@ from dsa_visualizer.algorithms.render.highlights import (
 
 
 def render_array(
-    values: list[object],
+    values: Sequence[object],
     highlights: HighlightContext | None = None,
+    offset: int = 0,
 ) -> str:
     """Render an array as an ASCII table.
 
     Args:
         values: The array values to render.
         highlights: Optional highlight context for algorithm visualization.
+        offset: Index of ``values[0]`` when rendering a window of a larger
+            sequence. Labels and highlights use the full sequence's indices.
 
     Returns:
         ASCII string representation of the array.
     """
-    if not values:
+    if len(values) == 0:
         return "(empty)"
 
     # Calculate cell width, accounting for possible markers
     max_len = 1
-    for index, value in enumerate(values):
+    for index, value in enumerate(values, start=offset):
         index_str = str(index)
         # Add space for marker if highlights provided
         if highlights is not None:
@@ -56,10 +61,10 @@ def render_array(
     # Build top border with optional boundary markers
     if highlights is not None and highlights.boundaries is not None:
         top = _build_boundary_border(
-            "┌", "┬", "┐", cell_width, len(values), highlights
+            "┌", "┬", "┐", cell_width, len(values), highlights, offset
         )
         bottom = _build_boundary_border(
-            "└", "┴", "┘", cell_width, len(values), highlights
+            "└", "┴", "┘", cell_width, len(values), highlights, offset
         )
     else:
         top = border("┌", "┬", "┐")
@@ -69,7 +74,7 @@ def render_array(
 
     # Build index cells with markers
     index_cells = []
-    for index in range(len(values)):
+    for index in range(offset, offset + len(values)):
         if highlights is not None:
             marker = get_index_marker(index, highlights)
             if marker:
@@ -98,6 +103,7 @@ def _build_boundary_border(
     cell_width: int,
     count: int,
     highlights: HighlightContext,
+    offset: int = 0,
 ) -> str:
     """Build border with boundary markers.
 
@@ -106,14 +112,15 @@ def _build_boundary_border(
     segments = []
 
     for i in range(count):
+        index = offset + i
         # Left edge of cell
         if i == 0:
-            if is_at_left_boundary(i, highlights):
+            if is_at_left_boundary(index, highlights):
                 segments.append("[")
             else:
                 segments.append(left)
         else:
-            if is_at_left_boundary(i, highlights):
+            if is_at_left_boundary(index, highlights):
                 segments.append("[")
             else:
                 segments.append(mid)
@@ -122,13 +129,13 @@ def _build_boundary_border(
         segments.append("─" * cell_width)
 
         # Check if this cell is the right boundary (add ] after it)
-        if is_at_right_boundary(i, highlights) and i < count - 1:
+        if is_at_right_boundary(index, highlights) and i < count - 1:
             segments.append("]")
             # Skip the next separator since we added ]
             continue
 
     # Right edge of last cell
-    if is_at_right_boundary(count - 1, highlights):
+    if is_at_right_boundary(offset + count - 1, highlights):
         segments.append("]")
     else:
         segments.append(right)
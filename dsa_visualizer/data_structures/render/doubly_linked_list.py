@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+from dsa_visualizer.data_structures.chain import iter_chain, measure_chain
 from dsa_visualizer.data_structures.implementations.structures import DoublyLinkedList
 
 
 def render_doubly_linked_list(target: object) -> str:
     head = _resolve_head(target)
-    nodes = _iter_nodes(head)
+    shape = measure_chain(head)
+    nodes = list(iter_chain(head, shape=shape))
     lines = _render_chain(nodes)
+    if shape.cycle_start is not None:
+        lines.extend(_render_cycle(nodes, shape.cycle_start))
     lines.append("")
     lines.append("Node Structure")
     lines.extend(_render_node_structure(nodes))
@@ -16,9 +20,7 @@ def render_doubly_linked_list(target: object) -> str:
 def _render_chain(nodes: list[object]) -> list[str]:
     if not nodes:
         return ["Head ──▶ NULL"]
-    data_texts = [str(_node_value(node)) for node in nodes]
-    data_width = max(4, max(len(text) for text in data_texts))
-    pointer_width = max(5, len("NULL"))
+    data_width, pointer_width = _cell_widths(nodes)
     boxes = [_render_node_box(node, data_width, pointer_width) for node in nodes]
     connector = " ⇄ "
     indent = " " * len("Head ──▶ ")
@@ -29,6 +31,30 @@ def _render_chain(nodes: list[object]) -> list[str]:
     return [f"Head ──▶ {top}", f"{indent}{mid}", f"{indent}{bottom}"]
 
 
+def _cell_widths(nodes: list[object]) -> tuple[int, int]:
+    data_width = max(4, max(len(str(_node_value(node))) for node in nodes))
+    return data_width, max(5, len("NULL"))
+
+
+def _render_cycle(nodes: list[object], cycle_start: int) -> list[str]:
+    data_width, pointer_width = _cell_widths(nodes)
+    box_width = data_width + 2 * pointer_width + 4
+    step = box_width + len(" ⇄ ")
+    # From the last node's next cell back up to the start node's data cell.
+    target = (
+        len("Head ──▶ ") + cycle_start * step
+        + pointer_width + 2 + (data_width - 1) // 2
+    )
+    source = (
+        len("Head ──▶ ") + (len(nodes) - 1) * step
+        + pointer_width + data_width + 3 + pointer_width // 2
+    )
+    return [
+        f"{' ' * target}▲{' ' * (source - target - 1)}│",
+        f"{' ' * target}└{'─' * (source - target - 1)}┘",
+    ]
+
+
 def _render_node_box(node: object, data_width: int, pointer_width: int) -> list[str]:
     data_text = str(_node_value(node))
     prev_text = "NULL" if getattr(node, "prev", None) is None else "•"
@@ -114,17 +140,3 @@ def _is_doubly_node_like(value: object) -> bool:
     except AttributeError:
         return False
     return hasattr(value, "value") or hasattr(value, "data")
-
-
-def _iter_nodes(head: object | None) -> list[object]:
-    nodes: list[object] = []
-    seen: set[int] = set()
-    current = head
-    while current is not None:
-        node_id = id(current)
-        if node_id in seen:
-            break
-        seen.add(node_id)
-        nodes.append(current)
-        current = getattr(current, "next", None)
-    return nodes
@@ -21,6 +21,14 @@ def render_graph(adjacency: dict[object, list[object]], *, directed: bool) -> st
     return "\n".join(lines)
 
 
+def render_undirected_graph(adjacency: dict[object, list[object]]) -> str:
+    return render_graph(adjacency, directed=False)
+
+
+def render_directed_graph(adjacency: dict[object, list[object]]) -> str:
+    return render_graph(adjacency, directed=True)
+
+
 def _collect_edges(
     adjacency: dict[object, list[object]], *, directed: bool
 ) -> list[str]:
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+
+def render_object_fields(fields: dict[str, object]) -> str:
+    if not fields:
+        return "(no fields)"
+
+    rows = [(name, str(value)) for name, value in fields.items()]
+    name_width = max(len("field"), max(len(name) for name, _ in rows)) + 2
+    value_width = max(len("value"), max(len(text) for _, text in rows)) + 2
+
+    def row(name: str, value: str) -> str:
+        return f"│ {name.ljust(name_width - 1)}│ {value.ljust(value_width - 1)}│"
+
+    lines = [
+        f"┌{'─' * name_width}┬{'─' * value_width}┐",
+        row("field", "value"),
+        f"├{'─' * name_width}┼{'─' * value_width}┤",
+    ]
+    lines.extend(row(name, text) for name, text in rows)
+    lines.append(f"└{'─' * name_width}┴{'─' * value_width}┘")
+    return "\n".join(lines)
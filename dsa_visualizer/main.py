@@ -1,17 +1,26 @@
+import threading
+from collections.abc import Collection
+from dataclasses import replace
+
 from textual import events
 from textual.app import App, ComposeResult
 from rich.text import Text
 from textual.containers import Horizontal, VerticalScroll
 from textual.widgets import TextArea
 
-from dsa_visualizer.algorithms.runner import AlgorithmRunner
-from dsa_visualizer.algorithms.types import AlgorithmStep
-from dsa_visualizer.core.executor import Executor
+from dsa_visualizer.algorithms.types import AlgorithmFrame
+from dsa_visualizer.core.budget import ExecutionBudget
 from dsa_visualizer.core.input_accumulator import classify_buffer
-from dsa_visualizer.core.snapshotter import Snapshot, Snapshotter, diff_snapshots
+from dsa_visualizer.core.kernel import Kernel
+from dsa_visualizer.core.script import split_cells
+from dsa_visualizer.core.session import (
+    BatchOutcome,
+    CellOutcome,
+    PageView,
+    RerunOutcome,
+    TimelineView,
+)
 from dsa_visualizer.core.types import Cell, MemoryBlock
-from dsa_visualizer.data_structures.render.array import render_array
-from dsa_visualizer.render.memory_view import get_memory_blocks, render_memory
 from dsa_visualizer.ui.cell_render import render_cell_text
 from dsa_visualizer.ui.input_area import InputArea
 from dsa_visualizer.ui.input_utils import clamp_input_height
@@ -22,6 +31,8 @@ from dsa_visualizer.ui.text_constants import BANNER, INPUT_PLACEHOLDER
 
 MIN_INPUT_LINES = 5
 MAX_INPUT_LINES = 10
+# Elements shown per Alt+Up/Alt+Down page of a large container
+MEMORY_PAGE_SIZE = 64
 
 
 def _safe_block_id(block_id: str) -> str:
@@ -151,6 +162,10 @@ class DSAApp(App):
 
     """
 
+    def __init__(self, budget: ExecutionBudget | None = None) -> None:
+        super().__init__()
+        self._budget = budget
+
     def compose(self) -> ComposeResult:
         yield NoSelectStatic(BANNER, id="banner")
         with VerticalScroll(id="content"):
@@ -177,6 +192,8 @@ class DSAApp(App):
     def on_text_area_changed(self, event: TextArea.Changed) -> None:
         text_area = event.text_area
         text = text_area.text
+        if text == "" and isinstance(text_area, InputArea):
+            text_area.pasted = False
         if text.strip() == "" and text != "":
             text_area.text = ""
             return
@@ -185,29 +202,81 @@ class DSAApp(App):
 
     def on_mount(self) -> None:
         self._cells: list[Cell] = []
-        self._executor = Executor()
-        self._snapshotter = Snapshotter()
-        self._last_snapshot = self._snapshotter.snapshot(self._executor.globals)
+        # Held by a worker from numbering its cells until they are added, so
+        # cells submitted in quick succession get ids of their own
+        self._cell_lock = threading.Lock()
+        self._kernel = Kernel(self._budget)
         self._cell_widgets: dict[int, SafeStatic] = {}
         self._cell_expanded: dict[int, bool] = {}
+        self._selected_cell_id: int | None = None
+        self._editing_cell_id: int | None = None
         self._overview_collapsed = False
         self._algorithm_overview_collapsed = True  # Collapsed by default
         # Memory cell tracking
         self._memory_blocks: dict[str, MemoryBlock] = {}
         self._memory_widgets: dict[str, SafeStatic] = {}
         self._memory_expanded: dict[str, bool] = {}
+        # Memory block last clicked, and where paging left each block
+        self._selected_block_id: str | None = None
+        self._page_starts: dict[str, int] = {}
+        # Timeline position shown in the memory view (None: live view)
+        self._timeline_position: int | None = None
+        # Background render the memory view is waiting for, and the
+        # algorithm to start once its blocks are shown
+        self._render_id: int | None = None
+        self._pending_algorithm: AlgorithmFrame | None = None
         # Algorithm mode state
         self._algorithm_mode: bool = False
-        self._algorithm_runner: AlgorithmRunner | None = None
-        self._algorithm_data: list | None = None
+        self._algorithm_frame: AlgorithmFrame | None = None
         self._algorithm_timer: object | None = None
         self._algorithm_speed: float = 0.7  # seconds between steps
         self._algorithm_run_id: int = 0
         self._algorithm_block_id: str | None = None
+        # A step or skip request is on its way to the kernel, and End was
+        # pressed while it was
+        self._algorithm_request_pending: bool = False
+        self._skip_pending: bool = False
+        # The kernel's algorithm is to be stopped, unless a cell run (which
+        # stops it anyway) gets to the kernel first
+        self._algorithm_stop_pending: bool = False
         self._render_overview_panel()
         self._render_algorithm_overview_panel()
 
+    def on_unmount(self) -> None:
+        self._kernel.close()
+
+    @property
+    def _cell_running(self) -> bool:
+        """Whether the kernel is busy with more than an animation step."""
+        return self._kernel.busy and not self._algorithm_request_pending
+
     def on_key(self, event) -> None:
+        # Kernel control keys
+        if event.key == "escape" and self._kernel.busy:
+            self._kernel.interrupt()
+            event.prevent_default()
+            return
+        if event.key == "ctrl+r":
+            self._restart_kernel()
+            event.prevent_default()
+            return
+        if event.key == "ctrl+e":
+            self._edit_cell()
+            event.prevent_default()
+            return
+        if event.key == "escape" and self._editing_cell_id is not None:
+            self._cancel_edit()
+            event.prevent_default()
+            return
+        if event.key in ("alt+left", "alt+right") and not self._algorithm_mode:
+            self._scrub_timeline(-1 if event.key == "alt+left" else 1)
+            event.prevent_default()
+            return
+        if event.key in ("alt+up", "alt+down") and not self._algorithm_mode:
+            self._page_memory_block(-1 if event.key == "alt+up" else 1)
+            event.prevent_default()
+            return
+
         # Handle algorithm mode keys first
         if self._algorithm_mode:
             if event.key in ("escape", "q"):
@@ -226,6 +295,10 @@ class DSAApp(App):
                 self._restart_algorithm_timer()
                 event.prevent_default()
                 return
+            elif event.key == "end":
+                self._skip_algorithm()
+                event.prevent_default()
+                return
 
         # Normal mode keys
         if event.character == "?":
@@ -259,6 +332,11 @@ class DSAApp(App):
             except ValueError:
                 return
             cell = next((item for item in self._cells if item.cell_id == cell_id), None)
+            if cell is not None:
+                self._selected_cell_id = cell_id
+            if cell is not None and cell.deferred_snapshot:
+                self._load_deferred_snapshot(cell_id)
+                return
             if cell is None or not cell.snapshot_text:
                 return
             expanded = not self._cell_expanded.get(cell_id, False)
@@ -274,6 +352,7 @@ class DSAApp(App):
             block = self._memory_blocks.get(block_id)
             if block is None:
                 return
+            self._selected_block_id = block_id
             expanded = not self._memory_expanded.get(block_id, True)
             self._memory_expanded[block_id] = expanded
             widget = self._memory_widgets.get(block_id)
@@ -282,35 +361,367 @@ class DSAApp(App):
 
     def handle_code_enter(self, *, force_submit: bool) -> bool:
         text_area = self.query_one("#input-cell", InputArea)
+        if text_area.pasted and self._editing_cell_id is None:
+            return self._submit_paste(text_area)
         result = classify_buffer(text_area.text, force_submit=force_submit)
         if result.status == "incomplete":
             return False
+        if self._cell_running:
+            self.notify("A cell is still running. Press Esc to interrupt it.")
+            return True
+        editing = self._editing_cell_id
+        if result.status == "error" and editing is not None:
+            self.notify(result.error or "Invalid code", severity="error")
+            return True
         if result.status == "error":
-            self._append_cell(text_area.text, ok=False, error=result.error)
-        else:
-            execution = self._executor.execute(text_area.text)
-            snapshot_text = None
-            if execution.ok:
-                snapshot = self._snapshotter.snapshot(self._executor.globals)
-                delta = diff_snapshots(self._last_snapshot, snapshot)
-                self._update_memory(snapshot)
-                snapshot_text = render_memory(delta) or "(no changes)"
-                self._last_snapshot = snapshot
-
-                # Check for pending algorithm
-                pending = self._executor.pop_pending_algorithm()
-                if pending is not None:
-                    self._enter_algorithm_mode(pending.runner, pending.data)
-            self._append_cell(
-                text_area.text,
-                ok=execution.ok,
-                error=execution.error,
-                snapshot_text=snapshot_text,
+            code, error = text_area.text, result.error
+            self.run_worker(
+                lambda: self._add_invalid_cell(code, error),
+                thread=True,
+                exit_on_error=False,
             )
+        else:
+            code = text_area.text
+            if self._algorithm_mode:
+                self._exit_algorithm_mode(stop_kernel=False)
+            if editing is not None:
+                self._editing_cell_id = None
+                self.run_worker(
+                    lambda: self._rerun_cell_in_kernel(editing, code),
+                    thread=True,
+                    exit_on_error=False,
+                )
+            else:
+                self.run_worker(
+                    lambda: self._run_cell_in_kernel(code),
+                    thread=True,
+                    exit_on_error=False,
+                )
+        text_area.text = ""
+        text_area.scroll_visible()
+        return True
+
+    def _submit_paste(self, text_area: InputArea) -> bool:
+        """Run a pasted buffer as a batch of top-level statements.
+
+        The buffer is parsed once here instead of being re-classified on
+        every Enter; a buffer with a syntax error becomes a single cell
+        that reports it.
+        """
+        if self._cell_running:
+            self.notify("A cell is still running. Press Esc to interrupt it.")
+            return True
+        statements = [code for _line, code in split_cells(text_area.text)]
+        if not statements:
+            return True
+        if self._algorithm_mode:
+            self._exit_algorithm_mode(stop_kernel=False)
+        self.run_worker(
+            lambda: self._run_batch_in_kernel(statements),
+            thread=True,
+            exit_on_error=False,
+        )
         text_area.text = ""
+        text_area.pasted = False
         text_area.scroll_visible()
         return True
 
+    def _run_cell_in_kernel(self, code: str) -> None:
+        """Worker thread: run a cell in the kernel and hand the outcome to the UI."""
+        with self._cell_lock:
+            self._algorithm_stop_pending = False
+            cell_id = len(self._cells) + 1
+            outcome = self._kernel.execute(code, cell_id)
+            self.call_from_thread(self._finish_cell, code, outcome)
+
+    def _run_batch_in_kernel(self, statements: list[str]) -> None:
+        """Worker thread: run pasted statements in the kernel as one batch."""
+        with self._cell_lock:
+            self._algorithm_stop_pending = False
+            first_cell_id = len(self._cells) + 1
+            outcome = self._kernel.run_batch(statements, first_cell_id)
+            self.call_from_thread(
+                self._finish_batch, first_cell_id, statements, outcome
+            )
+
+    def _add_invalid_cell(self, code: str, error: str | None) -> None:
+        """Worker thread: add a cell that did not parse after those before it."""
+        with self._cell_lock:
+            self.call_from_thread(self._append_cell, code, ok=False, error=error)
+
+    def _load_deferred_snapshot(self, cell_id: int) -> None:
+        """Fetch a batch statement's delta from the kernel and expand it."""
+        if self._cell_running:
+            self.notify("A cell is still running. Press Esc to interrupt it.")
+            return
+        self.run_worker(
+            lambda: self.call_from_thread(
+                self._show_deferred_snapshot,
+                cell_id,
+                self._kernel.statement_delta(cell_id),
+            ),
+            thread=True,
+            exit_on_error=False,
+        )
+
+    def _scrub_timeline(self, step: int) -> None:
+        """Show the memory view one snapshot earlier or later."""
+        if self._cell_running:
+            self.notify("A cell is still running. Press Esc to interrupt it.")
+            return
+        if self._timeline_position is None:
+            if step > 0:
+                return
+            position = -2
+        else:
+            position = self._timeline_position + step
+            if position < 0:
+                return
+        self._load_timeline_view(position)
+
+    def _load_timeline_view(self, position: int) -> None:
+        self.run_worker(
+            lambda: self.call_from_thread(
+                self._show_timeline_view, self._kernel.timeline_view(position)
+            ),
+            thread=True,
+            exit_on_error=False,
+        )
+
+    def _show_timeline_view(self, view: TimelineView | None) -> None:
+        if view is None:
+            return
+        live = view.position == view.length - 1
+        self._timeline_position = None if live else view.position
+        self._update_memory(view.blocks)
+        if live:
+            self.notify("Back to the live memory view.")
+        elif view.cell_id is None:
+            self.notify(f"Snapshot {view.position + 1}/{view.length}: session start")
+        else:
+            self.notify(
+                f"Snapshot {view.position + 1}/{view.length}: after cell {view.cell_id}"
+            )
+
+    def _page_memory_block(self, step: int) -> None:
+        """Show the next or previous run of the selected large container."""
+        block_id = self._selected_block_id
+        if block_id is None or block_id not in self._memory_blocks:
+            self.notify("Click a memory block first to page through it.")
+            return
+        if self._timeline_position is not None:
+            self.notify("Paging shows live objects; scrub back to the live view.")
+            return
+        if self._cell_running:
+            self.notify("A cell is still running. Press Esc to interrupt it.")
+            return
+        start = max(0, self._page_starts.get(block_id, 0) + step * MEMORY_PAGE_SIZE)
+        self.run_worker(
+            lambda: self.call_from_thread(
+                self._show_page,
+                block_id,
+                self._kernel.page(block_id, start, start + MEMORY_PAGE_SIZE),
+            ),
+            thread=True,
+            exit_on_error=False,
+        )
+
+    def _show_page(self, block_id: str, page: PageView | None) -> None:
+        block = self._memory_blocks.get(block_id)
+        if page is None or block is None:
+            self.notify("Only objects can be paged through.")
+            return
+        if page.length <= page.stop - page.start:
+            self.notify("All of it is already shown.")
+            return
+        block = replace(block, content=page.text)
+        self._memory_blocks[block_id] = block
+        self._page_starts[block_id] = page.start
+        self._memory_expanded[block_id] = True
+        widget = self._memory_widgets.get(block_id)
+        if widget is not None:
+            widget.update(render_memory_block_text(block, expanded=True))
+        self.notify(f"Elements [{page.start}:{page.stop}] of {page.length}")
+
+    def _rerun_cell_in_kernel(self, cell_id: int, code: str) -> None:
+        """Worker thread: re-run an edited cell and its dependents."""
+        with self._cell_lock:
+            self._algorithm_stop_pending = False
+            outcome = self._kernel.rerun_cell(cell_id, code)
+        self.call_from_thread(self._finish_rerun, cell_id, code, outcome)
+
+    def _stop_algorithm_in_kernel(self) -> None:
+        """Worker thread: stop the kernel's algorithm unless a cell did."""
+        with self._cell_lock:
+            if self._algorithm_stop_pending:
+                self._algorithm_stop_pending = False
+                self._kernel.stop_algorithm()
+
+    def _finish_cell(self, code: str, outcome: CellOutcome) -> None:
+        execution = outcome.result
+        self._timeline_position = None
+        if execution.ok:
+            self._show_memory(outcome.blocks, outcome.render_id, outcome.algorithm)
+        self._append_cell(
+            code,
+            ok=execution.ok,
+            error=execution.error,
+            snapshot_text=outcome.snapshot_text,
+            deferred_snapshot=execution.ok and outcome.snapshot_text is None,
+        )
+
+    def _finish_batch(
+        self, first_cell_id: int, statements: list[str], outcome: BatchOutcome
+    ) -> None:
+        """Add one cell per statement and render memory once."""
+        self._timeline_position = None
+        widgets = []
+        for cell_id, code in enumerate(statements, start=first_cell_id):
+            execution = outcome.results.get(cell_id)
+            if execution is None:
+                widgets.append(self._build_cell(code, ok=False, error="Not run"))
+                continue
+            widgets.append(
+                self._build_cell(
+                    code,
+                    ok=execution.ok,
+                    error=execution.error,
+                    deferred_snapshot=execution.ok,
+                )
+            )
+        self._mount_cells(widgets)
+        if outcome.blocks or outcome.render_id is not None:
+            self._show_memory(outcome.blocks, outcome.render_id, outcome.algorithm)
+        elif outcome.algorithm is not None:
+            self._enter_algorithm_mode(outcome.algorithm)
+
+    def _show_memory(
+        self,
+        blocks: list[MemoryBlock],
+        render_id: int | None,
+        algorithm: AlgorithmFrame | None,
+    ) -> None:
+        """Show a cell's memory view, fetching it first if still rendering.
+
+        An algorithm the cell started is entered once its blocks are shown.
+        """
+        self._render_id = render_id
+        if render_id is None:
+            self._update_memory(blocks)
+            if algorithm is not None:
+                self._enter_algorithm_mode(algorithm)
+            return
+        self._pending_algorithm = algorithm
+        self.run_worker(
+            lambda: self.call_from_thread(
+                self._apply_rendered_memory,
+                render_id,
+                self._kernel.memory_blocks(render_id),
+            ),
+            thread=True,
+            exit_on_error=False,
+        )
+
+    def _apply_rendered_memory(
+        self, render_id: int, blocks: list[MemoryBlock] | None
+    ) -> None:
+        """Apply finished background blocks unless a newer cell replaced them."""
+        if render_id != self._render_id:
+            return
+        self._render_id = None
+        algorithm, self._pending_algorithm = self._pending_algorithm, None
+        if blocks is None or self._timeline_position is not None:
+            return
+        self._update_memory(blocks)
+        if algorithm is not None:
+            self._enter_algorithm_mode(algorithm)
+
+    def _show_deferred_snapshot(self, cell_id: int, snapshot_text: str | None) -> None:
+        index = cell_id - 1
+        if not 0 <= index < len(self._cells):
+            return
+        cell = replace(
+            self._cells[index],
+            snapshot_text=snapshot_text or "(no changes)",
+            deferred_snapshot=False,
+        )
+        self._cells[index] = cell
+        self._cell_expanded[cell_id] = True
+        widget = self._cell_widgets.get(cell_id)
+        if widget is not None:
+            widget.update(render_cell_text(cell, expanded=True))
+
+    def _finish_rerun(self, cell_id: int, code: str, outcome: RerunOutcome) -> None:
+        """Update the re-run cells and the memory blocks they touched."""
+        self._render_id = None  # The re-run abandoned any background render.
+        for rerun_id, execution in outcome.results.items():
+            index = rerun_id - 1
+            if not 0 <= index < len(self._cells):
+                continue
+            cell = self._cells[index]
+            if rerun_id == cell_id:
+                cell = replace(
+                    cell,
+                    code=code,
+                    ok=execution.ok,
+                    error=execution.error,
+                    snapshot_text=outcome.snapshot_text if execution.ok else None,
+                    deferred_snapshot=False,
+                )
+            else:
+                cell = replace(
+                    cell,
+                    ok=execution.ok,
+                    error=execution.error,
+                    deferred_snapshot=False,
+                )
+            self._cells[index] = cell
+            widget = self._cell_widgets.get(rerun_id)
+            if widget is not None:
+                expanded = self._cell_expanded.get(rerun_id, False)
+                widget.update(render_cell_text(cell, expanded=expanded))
+        if self._timeline_position is None:
+            self._update_memory(outcome.blocks, removed=outcome.removed)
+        else:
+            # The memory view shows an older snapshot: replace all of it.
+            self._load_timeline_view(-1)
+        count = len(outcome.results)
+        self.notify(f"Re-ran {count} cell{'s' if count != 1 else ''}")
+
+    def _edit_cell(self) -> None:
+        """Load the selected (or latest) cell into the input for editing."""
+        if not self._cells:
+            self.notify("No cells to edit yet.")
+            return
+        if self._cell_running:
+            self.notify("A cell is still running. Press Esc to interrupt it.")
+            return
+        cell_id = self._selected_cell_id or self._cells[-1].cell_id
+        cell = self._cells[cell_id - 1]
+        self._editing_cell_id = cell_id
+        text_area = self.query_one("#input-cell", InputArea)
+        text_area.text = cell.code
+        text_area.focus()
+        self.notify(
+            f"Editing cell {cell_id}. Enter re-runs it and the cells that depend "
+            "on it; Esc cancels."
+        )
+
+    def _cancel_edit(self) -> None:
+        self._editing_cell_id = None
+        self.query_one("#input-cell", InputArea).text = ""
+
+    def _restart_kernel(self) -> None:
+        """Restart the kernel with a fresh namespace and clear the memory view."""
+        if self._algorithm_mode:
+            self._exit_algorithm_mode(stop_kernel=False)
+        self._editing_cell_id = None
+        self._render_id = None
+        self._pending_algorithm = None
+        self._kernel.restart()
+        self._update_memory([])
+        self.notify("Kernel restarted")
+
     def _append_cell(
         self,
         code: str,
@@ -318,24 +729,48 @@ class DSAApp(App):
         ok: bool,
         error: str | None,
         snapshot_text: str | None = None,
+        deferred_snapshot: bool = False,
     ) -> None:
+        widget = self._build_cell(
+            code,
+            ok=ok,
+            error=error,
+            snapshot_text=snapshot_text,
+            deferred_snapshot=deferred_snapshot,
+        )
+        self._mount_cells([widget])
+
+    def _build_cell(
+        self,
+        code: str,
+        *,
+        ok: bool,
+        error: str | None,
+        snapshot_text: str | None = None,
+        deferred_snapshot: bool = False,
+    ) -> SafeStatic:
+        """Record a new cell and create (but not mount) its widget."""
         cell = Cell(
             cell_id=len(self._cells) + 1,
             code=code,
             ok=ok,
             error=error,
             snapshot_text=snapshot_text,
+            deferred_snapshot=deferred_snapshot,
         )
         self._cells.append(cell)
-        notebook = self.query_one("#notebook-history", VerticalScroll)
         widget = SafeStatic(
             render_cell_text(cell, expanded=False),
             classes="cell-output",
             id=f"cell-{cell.cell_id}",
         )
-        notebook.mount(widget)
         self._cell_widgets[cell.cell_id] = widget
         self._cell_expanded[cell.cell_id] = False
+        return widget
+
+    def _mount_cells(self, widgets: list[SafeStatic]) -> None:
+        notebook = self.query_one("#notebook-history", VerticalScroll)
+        notebook.mount_all(widgets)
         self.call_after_refresh(notebook.scroll_end, animate=False)
         content = self.query_one("#content", VerticalScroll)
         self.call_after_refresh(content.scroll_end, animate=False)
@@ -349,18 +784,23 @@ class DSAApp(App):
             text.append(subtitle, style="dim")
         return text
 
-    def _update_memory(self, snapshot: Snapshot) -> None:
-        """Update memory view with individual expandable cells."""
+    def _update_memory(
+        self, blocks: list[MemoryBlock], *, removed: Collection[str] | None = None
+    ) -> None:
+        """Update memory view with individual expandable cells.
+
+        By default ``blocks`` is the whole memory view. With ``removed``,
+        only ``blocks`` are updated and the ``removed`` ids are dropped.
+        """
         memory_history = self.query_one("#memory-history", VerticalScroll)
 
-        # Get current blocks
-        blocks = get_memory_blocks(snapshot)
         new_block_ids = {block.block_id for block in blocks}
         old_block_ids = set(self._memory_blocks.keys())
         newly_added = [block.block_id for block in blocks if block.block_id not in old_block_ids]
 
         # Remove widgets for blocks that no longer exist
-        for block_id in old_block_ids - new_block_ids:
+        stale_ids = old_block_ids - new_block_ids if removed is None else set(removed)
+        for block_id in stale_ids:
             if block_id.startswith("algorithm_viz_"):
                 continue
             widget = self._memory_widgets.pop(block_id, None)
@@ -368,10 +808,12 @@ class DSAApp(App):
                 widget.remove()
             self._memory_blocks.pop(block_id, None)
             self._memory_expanded.pop(block_id, None)
+            self._page_starts.pop(block_id, None)
 
         # Update or add widgets for current blocks
         for block in blocks:
             self._memory_blocks[block.block_id] = block
+            self._page_starts.pop(block.block_id, None)
 
             # Default to expanded for new blocks
             if block.block_id not in self._memory_expanded:
@@ -446,6 +888,12 @@ class DSAApp(App):
         text.append("KEYBOARD SHORTCUTS\n", style="bold")
         text.append("  Enter       Run code (when complete)\n")
         text.append("  Ctrl+Enter  Force run\n")
+        text.append("  Paste+Enter Run pasted code one statement per cell\n")
+        text.append("  Esc         Interrupt a running cell\n")
+        text.append("  Ctrl+R      Restart the kernel (clears all variables)\n")
+        text.append("  Ctrl+E      Edit the selected cell and re-run its dependents\n")
+        text.append("  Alt+←/→     Step the memory view through earlier snapshots\n")
+        text.append("  Alt+↑/↓     Page through the clicked memory block\n")
         text.append("  ?           Toggle this help\n")
         text.append("  Ctrl+Q      Quit\n")
         text.append("  Shift+Drag  Select text, then Ctrl+C to copy\n\n")
@@ -454,6 +902,7 @@ class DSAApp(App):
         text.append("(during visualization)\n", style="dim")
         text.append("  +           Speed up animation\n")
         text.append("  -           Slow down animation\n")
+        text.append("  End         Skip to the result\n")
         text.append("  Esc         Stop and exit\n")
 
         return text
@@ -498,33 +947,38 @@ class DSAApp(App):
 
     # Algorithm mode methods
 
-    def _enter_algorithm_mode(
-        self, runner: AlgorithmRunner, data: list
-    ) -> None:
+    def _enter_algorithm_mode(self, frame: AlgorithmFrame) -> None:
         """Enter algorithm visualization mode with auto-animation."""
         self._algorithm_mode = True
-        self._algorithm_runner = runner
-        self._algorithm_data = data
+        self._algorithm_frame = frame
         self._algorithm_run_id += 1
         self._algorithm_block_id = f"algorithm_viz_{self._algorithm_run_id}"
-        # Advance to first step and render
-        self._algorithm_runner.advance()
+        # The kernel has already advanced to the first step
         self._render_algorithm_step()
         # Start animation timer
         self._algorithm_timer = self.set_interval(
             self._algorithm_speed, self._auto_step
         )
 
-    def _exit_algorithm_mode(self) -> None:
-        """Exit algorithm visualization mode."""
+    def _exit_algorithm_mode(self, *, stop_kernel: bool = True) -> None:
+        """Exit algorithm visualization mode.
+
+        Pass ``stop_kernel=False`` when a cell run or a restart follows,
+        which ends the kernel's algorithm anyway.
+        """
         # Stop animation timer
         if self._algorithm_timer is not None:
             self._algorithm_timer.stop()
             self._algorithm_timer = None
         self._algorithm_mode = False
-        self._algorithm_runner = None
-        self._algorithm_data = None
+        self._algorithm_frame = None
         self._algorithm_block_id = None
+        self._skip_pending = False
+        if stop_kernel:
+            self._algorithm_stop_pending = True
+            self.run_worker(
+                self._stop_algorithm_in_kernel, thread=True, exit_on_error=False
+            )
         # Clear algorithm panel if it exists
         try:
             panel = self.query_one("#algorithm-panel", SafeStatic)
@@ -535,36 +989,29 @@ class DSAApp(App):
 
     def _render_algorithm_step(self) -> None:
         """Render the current algorithm step."""
-        if self._algorithm_runner is None:
-            return
-
-        step = self._algorithm_runner.current()
-        if step is None:
+        frame = self._algorithm_frame
+        if frame is None:
             return
 
         # Render the algorithm panel (step info)
-        self._render_algorithm_panel(step)
+        self._render_algorithm_panel(frame)
 
         # Render the data structure with highlights
-        self._render_algorithm_visualization(step)
+        self._render_algorithm_visualization(frame)
 
-    def _render_algorithm_panel(self, step: AlgorithmStep) -> None:
+    def _render_algorithm_panel(self, frame: AlgorithmFrame) -> None:
         """Render the algorithm info panel."""
-        runner = self._algorithm_runner
-        if runner is None:
-            return
-
         text = Text()
-        text.append(f"Algorithm: {runner.name}\n", style="bold #f6c64a")
+        text.append(f"Algorithm: {frame.name}\n", style="bold #f6c64a")
 
         # Step counter
-        if runner.total_steps is not None:
-            text.append(f"Step {runner.step_number} of {runner.total_steps}\n")
+        if frame.total_steps is not None:
+            text.append(f"Step {frame.step_number} of {frame.total_steps}\n")
         else:
-            text.append(f"Step {runner.step_number}\n")
+            text.append(f"Step {frame.step_number}\n")
 
         # Current action
-        text.append(f"\n{step.action}\n", style="bold")
+        text.append(f"\n{frame.action}\n", style="bold")
 
         # Controls hint
         text.append("\nControls: ", style="dim")
@@ -572,6 +1019,8 @@ class DSAApp(App):
         text.append("=Faster  ", style="dim")
         text.append("-", style="bold")
         text.append("=Slower  ", style="dim")
+        text.append("End", style="bold")
+        text.append("=Skip  ", style="dim")
         text.append("Esc", style="bold")
         text.append("=Stop", style="dim")
 
@@ -584,21 +1033,18 @@ class DSAApp(App):
             # Panel doesn't exist yet, that's ok for now
             pass
 
-    def _render_algorithm_visualization(self, step: AlgorithmStep) -> None:
+    def _render_algorithm_visualization(self, frame: AlgorithmFrame) -> None:
         """Render the data structure with algorithm highlights."""
-        if not isinstance(step.data, list):
+        if frame.content is None:
             return
 
-        # Render array with highlights
-        content = render_array(step.data, highlights=step.highlights)
-
         block_id = self._algorithm_block_id or "algorithm_viz"
         # Create a memory block for display
         block = MemoryBlock(
             block_id=block_id,
             header="Array ──▶ searching",
-            summary=f"Step {step.step_number}",
-            content=content,
+            summary=f"Step {frame.step_number}",
+            content=frame.content,
         )
 
         # Update memory view to show this
@@ -634,22 +1080,42 @@ class DSAApp(App):
 
     def _auto_step(self) -> None:
         """Automatically advance to the next step (called by timer)."""
-        if self._algorithm_runner is None:
+        if self._algorithm_frame is None or self._algorithm_request_pending:
+            return
+        # Don't queue ticks behind a running cell
+        if self._kernel.busy:
             return
 
         # Check if current step is complete
-        current = self._algorithm_runner.current()
-        if current is not None and current.is_complete:
+        if self._algorithm_frame.is_complete:
             # Algorithm finished, stop animation after a brief pause
             self._exit_algorithm_mode()
             return
 
         # Advance to next step
-        step = self._algorithm_runner.advance()
-        if step is not None:
+        self._algorithm_request_pending = True
+        run_id = self._algorithm_run_id
+        self.run_worker(
+            lambda: self.call_from_thread(
+                self._finish_auto_step, run_id, self._kernel.advance_algorithm()
+            ),
+            thread=True,
+            exit_on_error=False,
+        )
+
+    def _finish_auto_step(self, run_id: int, frame: AlgorithmFrame | None) -> None:
+        self._algorithm_request_pending = False
+        if not self._algorithm_mode or run_id != self._algorithm_run_id:
+            return
+        if self._skip_pending:
+            self._skip_pending = False
+            self._skip_algorithm()
+            return
+        if frame is not None:
+            self._algorithm_frame = frame
             self._render_algorithm_step()
             # Check if this step completes the algorithm
-            if step.is_complete:
+            if frame.is_complete:
                 # Keep showing for a moment, then exit
                 if self._algorithm_timer is not None:
                     self._algorithm_timer.stop()
@@ -658,6 +1124,34 @@ class DSAApp(App):
             # No more steps, exit
             self._exit_algorithm_mode()
 
+    def _skip_algorithm(self) -> None:
+        """Jump to the algorithm's last step without animating the rest."""
+        if self._algorithm_frame is None or self._cell_running:
+            return
+        if self._algorithm_request_pending:
+            self._skip_pending = True
+            return
+        if self._algorithm_timer is not None:
+            self._algorithm_timer.stop()
+        self._algorithm_request_pending = True
+        run_id = self._algorithm_run_id
+        self.run_worker(
+            lambda: self.call_from_thread(
+                self._finish_skip, run_id, self._kernel.fast_forward_algorithm()
+            ),
+            thread=True,
+            exit_on_error=False,
+        )
+
+    def _finish_skip(self, run_id: int, frame: AlgorithmFrame | None) -> None:
+        self._algorithm_request_pending = False
+        if not self._algorithm_mode or run_id != self._algorithm_run_id:
+            return
+        if frame is not None:
+            self._algorithm_frame = frame
+            self._render_algorithm_step()
+        self.set_timer(1.5, self._exit_algorithm_mode)
+
     def _restart_algorithm_timer(self) -> None:
         """Restart the animation timer with current speed."""
         if self._algorithm_timer is not None:
@@ -1,61 +1,158 @@
 from __future__ import annotations
 
-from dsa_visualizer.core.snapshotter import ObjectRecord, Snapshot
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Iterator
+
+from dsa_visualizer.core.registry import RENDERER_GROUP, LazyRegistry
+from dsa_visualizer.core.snapshotter import (
+    ObjectRecord,
+    PayloadWindow,
+    RenderedPayload,
+    Snapshot,
+    reachable_ids,
+)
 from dsa_visualizer.core.types import MemoryBlock
-from dsa_visualizer.data_structures.render.array import render_array
-from dsa_visualizer.data_structures.render.binary_search_tree import render_binary_search_tree
-from dsa_visualizer.data_structures.render.binary_tree import render_binary_tree
-from dsa_visualizer.data_structures.render.doubly_linked_list import render_doubly_linked_list
-from dsa_visualizer.data_structures.render.graph import render_graph
-from dsa_visualizer.data_structures.render.hashmap import render_hashmap
-from dsa_visualizer.data_structures.render.linked_list import render_linked_list
-from dsa_visualizer.data_structures.render.min_heap import render_min_heap
 from dsa_visualizer.data_structures.render.primitive import render_primitive
-from dsa_visualizer.data_structures.render.queue import render_queue
-from dsa_visualizer.data_structures.render.stack import render_stack
 
+_RENDER = "dsa_visualizer.data_structures.render"
+
+# Renderers by DSA type name, imported on first use; plugins add more through
+# the "dsa_visualizer.renderers" entry point group.
+RENDERERS: LazyRegistry[Callable[[object], str]] = LazyRegistry(RENDERER_GROUP, {
+    "Array": f"{_RENDER}.array:render_array",
+    "Hash Table": f"{_RENDER}.hashmap:render_hashmap",
+    "Doubly Linked List": f"{_RENDER}.doubly_linked_list:render_doubly_linked_list",
+    "Linked List": f"{_RENDER}.linked_list:render_linked_list",
+    "Stack": f"{_RENDER}.stack:render_stack",
+    "Queue": f"{_RENDER}.queue:render_queue",
+    "Binary Search Tree": f"{_RENDER}.binary_search_tree:render_binary_search_tree",
+    "Binary Tree": f"{_RENDER}.binary_tree:render_binary_tree",
+    "Min Heap": f"{_RENDER}.min_heap:render_min_heap",
+    "Undirected Graph": f"{_RENDER}.graph:render_undirected_graph",
+    "Directed Graph": f"{_RENDER}.graph:render_directed_graph",
+    "Object": f"{_RENDER}.object_fields:render_object_fields",
+})
+
+# Payload type each built-in renderer expects; other payloads fall back to
+# the record summary.
+_PAYLOAD_TYPES: dict[str, type] = {
+    "Array": list,
+    "Hash Table": dict,
+    "Stack": list,
+    "Queue": list,
+    "Min Heap": list,
+    "Undirected Graph": dict,
+    "Directed Graph": dict,
+    "Object": dict,
+}
+
+CONTENT_CACHE_SIZE = 256
+"""Rendered object contents kept for reuse, keyed by record identity."""
+
+# id(record) -> (record, content). Holding the record keeps its id unique.
+_content_cache: OrderedDict[int, tuple[ObjectRecord, str]] = OrderedDict()
+# Blocks may be rendered on a background thread (see RenderPipeline).
+_content_cache_lock = threading.Lock()
+
+
+def get_memory_blocks(
+    snapshot: Snapshot, names: Collection[str] | None = None
+) -> list[MemoryBlock]:
+    """Return a list of MemoryBlocks for each variable/object in the snapshot.
+
+    With ``names``, only the blocks showing one of those names are built
+    (an object block still lists all of its aliases).
 
-def get_memory_blocks(snapshot: Snapshot) -> list[MemoryBlock]:
-    """Return a list of MemoryBlocks for each variable/object in the snapshot."""
-    blocks: list[MemoryBlock] = []
+    Objects nested in containers that no name is bound to get blocks of
+    their own after the named ones, headed by the path they were found at.
+    """
+    return list(iter_memory_blocks(snapshot, names))
+
+
+def iter_memory_blocks(
+    snapshot: Snapshot, names: Collection[str] | None = None
+) -> Iterator[MemoryBlock]:
+    """Build the blocks of ``get_memory_blocks`` one at a time."""
     object_names: dict[str, list[str]] = {}
+    wanted: set[str] | None = None
+    if names is not None:
+        wanted = {
+            target
+            for name, target in snapshot.names.items()
+            if name in names and _is_object_id(target)
+        }
 
     for name, target in snapshot.names.items():
-        if isinstance(target, str) and target.startswith("obj#"):
-            object_names.setdefault(target, []).append(name)
+        if _is_object_id(target):
+            if wanted is None or target in wanted:
+                object_names.setdefault(target, []).append(name)
+        elif names is not None and name not in names:
+            continue
         else:
             # Primitive value
             content = render_primitive(name, target)
             type_name = type(target).__name__ if target is not None else "None"
             header = f"{name} ──▶ {type_name}"
             summary = repr(target) if target is not None else "None"
-            blocks.append(MemoryBlock(
+            yield MemoryBlock(
                 block_id=f"var_{name}",
                 header=header,
                 summary=summary,
                 content=content,
-            ))
+            )
 
-    for obj_id, names in object_names.items():
+    for obj_id, aliases in object_names.items():
         record = snapshot.objects.get(obj_id)
         if record is None:
             continue
-        header_lines, content = _render_object_block(record, sorted(names))
+        header_lines, content = _render_object_block(record, sorted(aliases))
         header = header_lines[0] if len(header_lines) == 1 else header_lines[-1]
         full_header = "\n".join(header_lines)
-        blocks.append(MemoryBlock(
+        yield MemoryBlock(
             block_id=obj_id,
             header=full_header,
             summary=record.summary,
             content=content,
-        ))
+        )
+
+    bound = {target for target in snapshot.names.values() if _is_object_id(target)}
+    roots = bound if wanted is None else wanted
+    for obj_id in reachable_ids(snapshot.objects, roots):
+        if obj_id in bound:
+            continue
+        record = snapshot.objects[obj_id]
+        yield MemoryBlock(
+            block_id=obj_id,
+            header=_render_names_header([record.path or obj_id], record.dsa_type)[0],
+            summary=record.summary,
+            content=_render_object_content(record),
+        )
+
 
-    return blocks
+def get_block_ids(snapshot: Snapshot) -> set[str]:
+    """Ids of the blocks ``get_memory_blocks`` would return."""
+    ids = {
+        f"var_{name}"
+        for name, target in snapshot.names.items()
+        if not _is_object_id(target)
+    }
+    ids.update(snapshot.objects)
+    return ids
 
 
-def render_memory(snapshot: Snapshot) -> str:
-    """Render all memory blocks as a single string (legacy compatibility)."""
-    blocks = get_memory_blocks(snapshot)
+def _is_object_id(target: object) -> bool:
+    return isinstance(target, str) and target.startswith("obj#")
+
+
+def render_memory(
+    snapshot: Snapshot, names: Collection[str] | None = None
+) -> str:
+    """Render all memory blocks as a single string (legacy compatibility).
+
+    ``names`` restricts the output as in ``get_memory_blocks``.
+    """
+    blocks = get_memory_blocks(snapshot, names)
     if not blocks:
         return ""
     parts: list[str] = []
@@ -78,32 +175,68 @@ def _render_object_block(
 
 
 def _render_object_content(record: ObjectRecord) -> str:
-    """Render just the content part of an object (no header)."""
-    if record.dsa_type == "Array" and isinstance(record.payload, list):
-        return render_array(record.payload)
-    if record.dsa_type == "Hash Table" and isinstance(record.payload, dict):
-        return render_hashmap(record.payload)
-    if record.dsa_type == "Doubly Linked List":
-        return render_doubly_linked_list(record.payload)
-    if record.dsa_type == "Linked List":
-        return render_linked_list(record.payload)
-    if record.dsa_type == "Stack" and isinstance(record.payload, list):
-        return render_stack(record.payload)
-    if record.dsa_type == "Queue" and isinstance(record.payload, list):
-        return render_queue(record.payload)
-    if record.dsa_type == "Binary Search Tree":
-        return render_binary_search_tree(record.payload)
-    if record.dsa_type == "Binary Tree":
-        return render_binary_tree(record.payload)
-    if record.dsa_type == "Min Heap" and isinstance(record.payload, list):
-        return render_min_heap(record.payload)
-    if record.dsa_type == "Undirected Graph" and isinstance(record.payload, dict):
-        return render_graph(record.payload, directed=False)
-    if record.dsa_type == "Directed Graph" and isinstance(record.payload, dict):
-        return render_graph(record.payload, directed=True)
+    """Render just the content part of an object (no header).
+
+    A record the Snapshotter carried over unchanged is the same object, so
+    its rendered content is reused instead of walking the payload again.
+    """
+    key = id(record)
+    with _content_cache_lock:
+        cached = _content_cache.get(key)
+        if cached is not None and cached[0] is record:
+            _content_cache.move_to_end(key)
+            return cached[1]
+    content = _render_record(record)
+    with _content_cache_lock:
+        _content_cache[key] = (record, content)
+        if len(_content_cache) > CONTENT_CACHE_SIZE:
+            _content_cache.popitem(last=False)
+    return content
+
+
+def render_object(record: ObjectRecord) -> str:
+    """Render the content of one object record, without a names header."""
+    return _render_object_content(record)
+
+
+def _render_record(record: ObjectRecord) -> str:
+    if isinstance(record.payload, RenderedPayload):
+        return record.payload.content
+    if isinstance(record.payload, PayloadWindow):
+        return _render_window(record, record.payload)
+    expected = _PAYLOAD_TYPES.get(record.dsa_type)
+    if record.dsa_type in RENDERERS and (
+        expected is None or isinstance(record.payload, expected)
+    ):
+        return RENDERERS[record.dsa_type](record.payload)
     return f"{record.dsa_type} {record.summary}".strip()
 
 
+def _render_window(record: ObjectRecord, window: PayloadWindow) -> str:
+    """Render the captured runs of a large container with gaps between them."""
+    if record.dsa_type not in RENDERERS:
+        return f"{record.dsa_type} {record.summary}".strip()
+    renderer = RENDERERS[record.dsa_type]
+    parts: list[str] = []
+    position = 0
+    for start, elements in window.segments:
+        if start > position:
+            parts.append(_gap_note(position, start))
+        if record.dsa_type == "Array":
+            parts.append(renderer(elements, offset=start))
+        else:
+            parts.append(renderer(elements))
+        position = start + len(elements)
+    if position < window.length:
+        parts.append(_gap_note(position, window.length))
+    parts.append(f"Showing {window.shown} of {window.length} elements")
+    return "\n".join(parts)
+
+
+def _gap_note(start: int, stop: int) -> str:
+    return f"… {stop - start} more [{start}:{stop}] …"
+
+
 def _render_names_header(names: list[str], dsa_type: str) -> list[str]:
     if len(names) == 1:
         return [f"{names[0]} ──▶ {dsa_type}"]
@@ -12,7 +12,7 @@ def render_cell_text(cell: Cell, *, expanded: bool) -> Text:
     first_line = Text()
     first_line.append(status, style=status_style)
     first_line.append(f" {code_lines[0]}")
-    if cell.snapshot_text:
+    if cell.snapshot_text or cell.deferred_snapshot:
         marker = " ▾" if expanded else " ▸"
         first_line.append(marker, style="dim")
 
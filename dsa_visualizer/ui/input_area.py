@@ -1,3 +1,4 @@
+from textual import events
 from textual.binding import Binding
 from textual.widgets import TextArea
 
@@ -10,7 +11,28 @@ class InputArea(TextArea):
         Binding("ctrl+a", "select_all", "Select all", priority=True),
     ]
 
+    pasted = False
+    """Whether the buffer holds a multi-line paste not edited since; Enter
+    then submits it as a batch instead of inserting a newline."""
+
+    _inserting_paste = False
+
+    def on_paste(self, event: events.Paste) -> None:
+        if "\n" in event.text.strip():
+            self.pasted = True
+            self._inserting_paste = True
+
+    def on_text_area_changed(self, event: TextArea.Changed) -> None:
+        # The first change after a paste is the paste's own insertion; any
+        # later one is an edit, after which Enter runs complete code only.
+        if self._inserting_paste:
+            self._inserting_paste = False
+        else:
+            self.pasted = False
+
     def on_key(self, event) -> None:
+        if event.key not in ("enter", "ctrl+enter"):
+            self.pasted = False
         if event.character == "?":
             handler = getattr(self.app, "toggle_help", None)
             if callable(handler):
@@ -24,6 +46,12 @@ class InputArea(TextArea):
                 handler(force_submit=True)
             event.prevent_default()
             return
+        if event.key == "enter" and self.pasted:
+            handler = getattr(self.app, "handle_code_enter", None)
+            if callable(handler):
+                handler(force_submit=True)
+            event.prevent_default()
+            return
         if event.key == "enter":
             line_index, _column = self.cursor_location
             lines = self.text.split("\n")
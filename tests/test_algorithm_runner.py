@@ -1,7 +1,7 @@
 """Tests for AlgorithmRunner class."""
 
 from dsa_visualizer.algorithms.types import HighlightContext, AlgorithmStep
-from dsa_visualizer.algorithms.runner import AlgorithmRunner
+from dsa_visualizer.algorithms.runner import AlgorithmRunner, Examines
 
 
 def make_step(num: int, is_complete: bool = False) -> AlgorithmStep:
@@ -244,3 +244,243 @@ class TestAlgorithmRunnerFromGenerator:
         assert runner.advance() is not None
         assert runner.advance() is None  # Generator exhausted
         assert runner.advance() is None  # Still None
+
+
+def swap_steps(base: tuple):
+    """Helper: steps that swap neighbours of base, bubbling its head right."""
+    working = list(base)
+    yield AlgorithmStep(1, "Start", HighlightContext(), data=base)
+    for i in range(len(base) - 1):
+        working[i], working[i + 1] = working[i + 1], working[i]
+        yield AlgorithmStep(
+            i + 2,
+            f"Swap {i} and {i + 1}",
+            HighlightContext(),
+            data=base,
+            writes=((i, working[i]), (i + 1, working[i + 1])),
+        )
+
+
+class TestAlgorithmRunnerData:
+    """Tests for rebuilding step data from a shared base and writes."""
+
+    def test_steps_without_writes_share_the_base(self):
+        """data_at() returns the base itself when nothing was written."""
+        base = (3, 1, 2)
+        runner = AlgorithmRunner.from_steps(
+            "Test", [AlgorithmStep(1, "Look", HighlightContext(), data=base)]
+        )
+        runner.advance()
+        assert runner.data_at(0) is base
+
+    def test_writes_are_applied_up_to_the_step(self):
+        """data_at() replays the writes of every step up to the index."""
+        base = (9, 1, 2, 3)
+        runner = AlgorithmRunner.from_generator("Test", swap_steps(base))
+        while runner.advance() is not None:
+            pass
+
+        assert runner.data_at(0) is base
+        assert runner.data_at(1) == [1, 9, 2, 3]
+        assert runner.data_at(3) == [1, 2, 3, 9]
+        assert all(step.data is base for step in runner.steps)
+        assert base == (9, 1, 2, 3)
+
+    def test_from_steps_indexes_writes(self):
+        """Runners built from a list find the steps with writes too."""
+        runner = AlgorithmRunner.from_steps("Test", list(swap_steps((2, 1))))
+        assert runner.data_at(1) == [1, 2]
+
+    def test_search_steps_have_no_writes(self):
+        """Search generators only read their data."""
+        from dsa_visualizer.algorithms.search.binary import binary_search
+
+        steps = list(binary_search((1, 2, 3, 4), 3))
+        assert all(step.writes == () for step in steps)
+
+    def test_frames_render_the_rebuilt_data(self):
+        """Frames show the array as the current step left it."""
+        from dsa_visualizer.algorithms.render.frames import render_frame
+
+        runner = AlgorithmRunner.from_generator("Test", swap_steps((7, 5)))
+        runner.advance()
+        step = runner.advance()
+        content = render_frame(runner, step).content
+        assert content.index("5") < content.index("7")
+
+
+class TestAlgorithmRunnerSeek:
+    """Tests for seek() and the memory cap of factory runners."""
+
+    def test_seek_forward_and_back(self):
+        """seek() pulls steps as needed and can return to earlier ones."""
+        runner = AlgorithmRunner.from_generator("Test", make_generator(10))
+
+        assert runner.seek(7).step_number == 8
+        assert runner.current_index == 7
+        assert len(runner.steps) == 8
+        assert runner.seek(2).step_number == 3
+        assert runner.advance().step_number == 4
+
+    def test_seek_past_the_end_does_not_move(self):
+        """Seeking a step the run does not have returns None."""
+        runner = AlgorithmRunner.from_generator("Test", make_generator(3))
+        runner.advance()
+
+        assert runner.seek(5) is None
+        assert runner.seek(-1) is None
+        assert runner.current_index == 0
+        assert runner.total_steps == 3
+
+    def test_cap_drops_steps_between_keyframes(self):
+        """Only keyframes and the most recent steps stay in memory."""
+        runner = AlgorithmRunner.from_factory(
+            "Test", lambda: make_generator(100), max_steps=4, keyframe_interval=4
+        )
+        runner.seek(99)
+
+        kept = [i for i, step in enumerate(runner.steps) if step is not None]
+        assert kept == [i for i in range(95) if i % 4 == 0] + [95, 96, 97, 98, 99]
+
+    def test_dropped_steps_are_regenerated(self):
+        """Seeking back to a dropped step replays it from the factory."""
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return make_generator(100)
+
+        runner = AlgorithmRunner.from_factory(
+            "Test", factory, max_steps=4, keyframe_interval=4
+        )
+        runner.seek(99)
+        step = runner.seek(41)
+
+        assert step.action == "Step 42"
+        assert len(calls) == 2
+        assert [s.step_number for s in runner.steps[40:44]] == [41, 42, 43, 44]
+        assert runner.rewind().action == "Step 41"
+        assert len(calls) == 2
+
+    def test_scrubbing_back_replays_once_per_cap(self):
+        """A replay restores the dropped steps before the one asked for."""
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return make_generator(200)
+
+        runner = AlgorithmRunner.from_factory(
+            "Test", factory, max_steps=16, keyframe_interval=4
+        )
+        runner.seek(199)
+        actions = []
+        while (step := runner.rewind()) is not None:
+            actions.append(step.action)
+
+        assert actions == [f"Step {n}" for n in range(199, 0, -1)]
+        assert len(calls) <= 1 + 200 // (16 - 4) + 1
+
+    def test_replay_with_fewer_steps_fails_clearly(self):
+        """A factory that stops early cannot regenerate dropped steps."""
+        import pytest
+
+        lengths = iter([20, 5])
+        runner = AlgorithmRunner.from_factory(
+            "Test",
+            lambda: make_generator(next(lengths)),
+            max_steps=4,
+            keyframe_interval=4,
+        )
+        runner.seek(19)
+
+        with pytest.raises(RuntimeError, match="fewer steps"):
+            runner.seek(9)
+
+    def test_data_survives_dropped_steps(self):
+        """Writes of dropped steps still apply in data_at()."""
+        base = tuple(range(20, 0, -1))
+        runner = AlgorithmRunner.from_factory(
+            "Test", lambda: swap_steps(base), max_steps=2, keyframe_interval=2
+        )
+        while runner.advance() is not None:
+            pass
+
+        assert runner.steps[1] is None
+        assert runner.data_at(len(runner.steps) - 1) == list(range(19, 0, -1)) + [20]
+
+    def test_cap_needs_a_factory(self):
+        """A capped runner must be able to regenerate what it drops."""
+        import pytest
+
+        with pytest.raises(ValueError):
+            AlgorithmRunner(name="Test", max_steps=10)
+        with pytest.raises(ValueError):
+            AlgorithmRunner.from_factory(
+                "Test", lambda: make_generator(3), max_steps=2, keyframe_interval=4
+            )
+
+
+class TestAlgorithmRunnerFastForward:
+    """Tests for fast_forward()."""
+
+    def test_runs_to_the_last_step(self):
+        """Without a predicate the runner ends on the final step."""
+        runner = AlgorithmRunner.from_generator("Test", make_generator(50))
+        runner.advance()
+
+        step = runner.fast_forward()
+
+        assert step.step_number == 50
+        assert runner.is_complete
+        assert runner.total_steps == 50
+        assert runner.fast_forward() is None
+
+    def test_factory_runner_keeps_only_the_result(self):
+        """Steps passed on the way are dropped and regenerated on demand."""
+        runner = AlgorithmRunner.from_factory(
+            "Test", lambda: make_generator(50), keyframe_interval=8
+        )
+        runner.fast_forward()
+
+        kept = [i for i, step in enumerate(runner.steps) if step is not None]
+        assert kept == [0, 8, 16, 24, 32, 40, 48, 49]
+        assert runner.rewind().step_number == 49
+
+    def test_stops_at_the_first_matching_step(self):
+        """A predicate stops the run at the first later step it accepts."""
+        from dsa_visualizer.algorithms.search.linear import linear_search
+
+        arr = tuple(range(100))
+        runner = AlgorithmRunner.from_factory(
+            "Linear", lambda: linear_search(arr, 99), keyframe_interval=16
+        )
+
+        step = runner.fast_forward(Examines(42))
+
+        expected = list(linear_search(arr, 99))
+        first = next(i for i, s in enumerate(expected) if 42 in s.highlights.current)
+        assert runner.current_index == first
+        assert step.action == expected[first].action
+        assert runner.steps[first - 1] is None
+        assert runner.rewind().action == expected[first - 1].action
+
+    def test_checks_collected_steps_first(self):
+        """Steps already pulled are searched before the generator."""
+        runner = AlgorithmRunner.from_generator("Test", make_generator(10))
+        runner.seek(8)
+        runner.reset()
+
+        step = runner.fast_forward(lambda s: s.step_number == 3)
+
+        assert step.step_number == 3
+        assert runner.current_index == 2
+
+    def test_no_match_does_not_move(self):
+        """A predicate no step accepts leaves the position alone."""
+        runner = AlgorithmRunner.from_generator("Test", make_generator(10))
+        runner.advance()
+
+        assert runner.fast_forward(lambda s: False) is None
+        assert runner.current_index == 0
+        assert runner.total_steps == 10
@@ -0,0 +1,110 @@
+"""Tests for batch search runs and their cost statistics."""
+
+import pytest
+
+from dsa_visualizer.algorithms import batch
+from dsa_visualizer.algorithms.batch import search_batch, summarize
+from dsa_visualizer.algorithms.search.binary import binary_search
+from dsa_visualizer.algorithms.search.linear import linear_search
+from dsa_visualizer.core.executor import SEARCH_ALGORITHMS, Executor
+
+
+def _slow(monkeypatch, algorithm, data, targets):
+    """Run the generator path even when NumPy is installed."""
+    with monkeypatch.context() as patch:
+        patch.setattr(batch, "numpy", None)
+        return search_batch("test", algorithm, data, targets)
+
+
+class TestSummarize:
+    """Tests for cost aggregation."""
+
+    def test_mean_p95_worst(self):
+        summary = summarize(list(range(1, 101)))
+        assert summary.mean == 50.5
+        assert summary.p95 == 95
+        assert summary.worst == 100
+
+    def test_empty(self):
+        summary = summarize([])
+        assert summary.worst == 0
+
+
+class TestSearchBatch:
+    """Tests for the generator path."""
+
+    def test_matches_individual_runs(self, monkeypatch):
+        arr = [1, 3, 5, 7, 9, 11]
+        targets = [1, 7, 4, 11, 12]
+        for name, algorithm in SEARCH_ALGORITHMS.items():
+            result = _slow(monkeypatch, algorithm, arr, targets)
+            for target, got, steps in zip(targets, result.results, result.steps):
+                last = list(algorithm(arr, target))[-1]
+                assert got == last.result, name
+                assert steps == last.step_number, name
+
+    def test_binary_comparisons_are_probes(self, monkeypatch):
+        result = _slow(monkeypatch, binary_search, list(range(15)), [7, 0])
+        assert result.comparisons == (1, 4)
+
+    def test_str_reports_aggregates(self, monkeypatch):
+        result = _slow(monkeypatch, linear_search, [1, 2, 3], [1, 2, 3])
+        text = str(result)
+        assert "3 targets" in text
+        assert "worst 6" in text
+
+
+class TestNumpyFastPath:
+    """The vectorized path reproduces the generators' counts."""
+
+    @pytest.fixture(autouse=True)
+    def _require_numpy(self):
+        pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize("algorithm", [linear_search, binary_search])
+    def test_matches_generator_path(self, monkeypatch, algorithm):
+        arr = [2, 4, 4, 8, 16, 23, 42, 42, 99]
+        targets = list(range(-1, 101))
+        fast = search_batch("test", algorithm, arr, targets)
+        slow = _slow(monkeypatch, algorithm, arr, targets)
+        assert fast.results == slow.results
+        assert fast.steps == slow.steps
+        assert fast.comparisons == slow.comparisons
+
+    def test_unsorted_binary_matches_generator_path(self, monkeypatch):
+        arr = [42, 17, 8, 91, 33, 56, 24]
+        fast = search_batch("test", binary_search, arr, arr)
+        slow = _slow(monkeypatch, binary_search, arr, arr)
+        assert fast.results == slow.results
+        assert fast.steps == slow.steps
+
+
+class TestExecutorSearchMany:
+    """Tests for search_many and tree_search_many in the notebook."""
+
+    def test_search_many_in_globals(self):
+        executor = Executor()
+        result = executor.execute("r = search_many('binary', range(100), [5, 50])")
+        assert result.ok
+        stats = executor.globals["r"]
+        assert stats.results == (5, 50)
+        assert executor.pending_algorithm is None
+
+    def test_search_many_unknown_algorithm(self):
+        executor = Executor()
+        result = executor.execute("search_many('bogus', [1], [1])")
+        assert not result.ok
+        assert "Unknown algorithm" in result.error
+
+    def test_tree_search_many(self):
+        executor = Executor()
+        executor.execute(
+            "bst = BinarySearchTree()\n"
+            "for v in [50, 25, 75, 10]:\n"
+            "    bst.insert(v)\n"
+            "r = tree_search_many('bst', bst, [10, 99])"
+        )
+        stats = executor.globals["r"]
+        assert stats.results[1] is None
+        assert stats.comparisons[0] == 3
+        assert stats.comparison_summary.worst == 3
@@ -186,3 +186,18 @@ class TestBinarySearchGenerator:
 
         for step in steps:
             assert step.data == arr
+
+    def test_steps_share_the_input_sequence(self):
+        """Steps reference the input instead of copying it."""
+        arr = (10, 20, 30, 40, 50)
+        steps = list(binary_search(arr, 40))
+
+        assert all(step.data is arr for step in steps)
+
+    def test_huge_range_runs_without_materializing(self):
+        """A range of a billion elements is searched in place."""
+        steps = list(binary_search(range(10**9), 123))
+
+        assert steps[-1].result == 123
+        assert len(steps) < 100
+        assert all(step.data.__class__ is range for step in steps)
@@ -28,3 +28,14 @@ def test_bst_delete_root() -> None:
 def test_bst_delete_missing() -> None:
     tree = BinarySearchTree([8, 3, 10])
     assert tree.delete(99) is False
+
+
+def test_bst_version_tracks_mutations() -> None:
+    tree = BinarySearchTree([8, 3])
+    version = tree.version
+    tree.search(3)
+    assert tree.version == version
+    tree.delete(42)
+    assert tree.version == version
+    tree.delete(3)
+    assert tree.version > version
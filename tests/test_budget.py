@@ -0,0 +1,128 @@
+import sys
+import threading
+import time
+import tracemalloc
+
+from dsa_visualizer.core.budget import (
+    BudgetExceeded,
+    BudgetMeter,
+    ExecutionBudget,
+    ResourceUsage,
+)
+from dsa_visualizer.core.executor import Executor
+
+
+def test_execute_reports_usage_without_budget() -> None:
+    executor = Executor()
+    result = executor.execute("total = sum(range(1000))")
+    assert result.ok
+    assert isinstance(result.usage, ResourceUsage)
+    assert result.usage.wall_time >= 0
+    assert result.usage.cpu_time >= 0
+    assert result.usage.instructions is None
+
+
+def test_instruction_budget_stops_infinite_loop() -> None:
+    executor = Executor(ExecutionBudget(instructions=10_000))
+    result = executor.execute("while True:\n    pass")
+    assert not result.ok
+    assert result.error is not None
+    assert "Instruction budget" in result.error
+    assert result.usage is not None
+    assert result.usage.instructions is not None
+    assert result.usage.instructions > 10_000
+
+
+def test_instruction_budget_reports_count_for_small_cell() -> None:
+    executor = Executor(ExecutionBudget(instructions=1_000_000))
+    result = executor.execute("x = [i for i in range(100)]")
+    assert result.ok
+    assert result.usage is not None
+    assert 0 < result.usage.instructions < 1_000_000
+
+
+def test_wall_time_budget_stops_infinite_loop() -> None:
+    executor = Executor()
+    result = executor.execute(
+        "while True:\n    pass", budget=ExecutionBudget(wall_time=0.05)
+    )
+    assert not result.ok
+    assert "Wall-time budget" in result.error
+
+
+def test_cell_cannot_swallow_budget_exceeded() -> None:
+    executor = Executor(ExecutionBudget(instructions=5_000))
+    source = (
+        "while True:\n"
+        "    try:\n"
+        "        while True:\n"
+        "            pass\n"
+        "    except Exception:\n"
+        "        pass\n"
+    )
+    result = executor.execute(source)
+    assert not result.ok
+    assert "Instruction budget" in result.error
+
+
+def test_executor_state_survives_budget_failure() -> None:
+    executor = Executor(ExecutionBudget(instructions=5_000))
+    assert executor.execute("x = 1").ok
+    assert not executor.execute("while True:\n    x += 1").ok
+    assert executor.execute("y = x").ok
+    assert executor.globals["y"] == executor.globals["x"]
+
+
+def test_meter_raises_budget_exceeded() -> None:
+    meter = BudgetMeter(ExecutionBudget(instructions=100))
+    try:
+        with meter:
+            total = 0
+            for value in range(100_000):
+                total += value
+    except BudgetExceeded:
+        pass
+    else:
+        raise AssertionError("BudgetExceeded was not raised")
+    assert meter.usage is not None
+
+
+def test_settrace_fallback_counts_the_running_frame(monkeypatch) -> None:
+    monkeypatch.delattr(sys, "monitoring", raising=False)
+    previous = sys.gettrace()
+    meter = BudgetMeter(ExecutionBudget(instructions=1_000_000))
+    with meter:
+        total = 0
+        for value in range(1_000):
+            total += value
+    assert meter.usage.instructions > 1_000
+    assert sys.gettrace() is previous
+
+
+def test_other_threads_do_not_count_against_the_budget() -> None:
+    stop = threading.Event()
+
+    def spin() -> None:
+        while not stop.is_set():
+            pass
+
+    worker = threading.Thread(target=spin)
+    worker.start()
+    try:
+        meter = BudgetMeter(ExecutionBudget(instructions=10_000, wall_time=5))
+        with meter:
+            time.sleep(0.2)
+    finally:
+        stop.set()
+        worker.join()
+    assert meter.usage.instructions < 10_000
+
+
+def test_memory_budget_measures_each_cell() -> None:
+    executor = Executor(ExecutionBudget(memory=1 << 30))
+    big = executor.execute("data = bytearray(20_000_000)\ndel data")
+    small = executor.execute("x = 1")
+    assert big.usage.memory >= 20_000_000
+    # A cell after a big one is not charged for the earlier peak.
+    assert small.usage.memory < 1_000_000
+    assert not tracemalloc.is_tracing()
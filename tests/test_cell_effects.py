@@ -0,0 +1,141 @@
+import ast
+
+from dsa_visualizer.core.effects import analyze_cell
+from dsa_visualizer.core.executor import Executor
+from dsa_visualizer.core.session import Session
+
+
+def _effects(source: str):
+    return analyze_cell(ast.parse(source))
+
+
+def test_assignments_bind_names() -> None:
+    effects = _effects("a, b = 1, 2\nfor i in range(3):\n    pass\nimport os.path")
+    assert effects.binds == {"a", "b", "i", "os"}
+    assert not effects.dynamic
+
+
+def test_mutations_track_root_names() -> None:
+    effects = _effects(
+        "arr.append(1)\n"
+        "grid[0][1] = 2\n"
+        "tree.root.left = None\n"
+        "del table['k']\n"
+        "n += 1\n"
+        "heapq.heappush(heap, 3)\n"
+    )
+    assert {"arr", "grid", "tree", "table", "n", "heap"} <= effects.mutates
+    assert effects.binds == {"n"}
+
+
+def test_deletes() -> None:
+    assert _effects("del x, y").deletes == {"x", "y"}
+
+
+def test_function_bodies_only_contribute_uses() -> None:
+    effects = _effects(
+        "def grow(size=default):\n"
+        "    global total\n"
+        "    total = 1\n"
+        "    items.append(size)\n"
+    )
+    assert effects.binds == {"grow"}
+    assert effects.mutates == set()
+    assert {"default", "items"} <= effects.uses
+
+
+def test_comprehension_targets_stay_local() -> None:
+    effects = _effects("squares = [v * v for v in values]\nfound = [w := v for v in values]")
+    assert effects.binds == {"squares", "found", "w"}
+
+
+def test_dynamic_constructs() -> None:
+    assert _effects("exec('x = 1')").dynamic
+    assert _effects("globals()['x'] = 1").dynamic
+    assert _effects("from math import *").dynamic
+    assert _effects("x = 1").scope == {"x"}
+    assert _effects("eval('1')").scope is None
+
+
+def test_calling_user_function_is_dynamic() -> None:
+    executor = Executor()
+    executor.execute("def reset():\n    global arr\n    arr = []")
+    result = executor.execute("reset()")
+    assert result.effects is not None
+    assert result.effects.dynamic
+    result = executor.execute("n = len([1, 2])")
+    assert not result.effects.dynamic
+
+
+def test_using_user_class_or_instance_is_dynamic() -> None:
+    executor = Executor()
+    executor.execute(
+        "n = 0\n"
+        "class Counter:\n"
+        "    def __init__(self):\n"
+        "        global n\n"
+        "        n += 1\n"
+        "    def bump(self):\n"
+        "        global n\n"
+        "        n += 1\n"
+        "c = Counter()"
+    )
+    assert executor.execute("c.bump()").effects.dynamic
+    assert executor.execute("d = Counter()").effects.dynamic
+    assert executor.execute("bump = c.bump").effects.dynamic
+    assert not executor.execute("m = n + 1").effects.dynamic
+
+
+def test_session_shows_globals_a_method_rebinds() -> None:
+    session = Session()
+    session.run_cell(
+        "n = 0\n"
+        "class Counter:\n"
+        "    def bump(self):\n"
+        "        global n\n"
+        "        n += 1\n"
+        "c = Counter()"
+    )
+    outcome = session.run_cell("c.bump()")
+    assert outcome.snapshot_text != "(no changes)"
+    assert session.last_snapshot.names["n"] == 1
+
+
+def test_writes_exclude_own_methods_and_read_only_builtins() -> None:
+    effects = _effects("ll.append(1)\nn = len(ll)\nprint(tree)")
+    assert effects.mutates == {"ll", "tree"}
+    assert effects.writes == set()
+
+    effects = _effects(
+        "tree.root.left = None\nll.head.data.append(2)\nreverse(other)"
+    )
+    assert effects.writes == {"tree", "ll", "other"}
+
+
+def test_indirect_calls_are_dynamic() -> None:
+    executor = Executor()
+    executor.execute(
+        "import functools\n"
+        "arr = []\n"
+        "def f():\n"
+        "    arr.append(1)\n"
+        "fns = [f]\n"
+        "p = functools.partial(f)\n"
+        "gen = (arr.append(i) for i in range(3))\n"
+        "m = map(arr.append, [77])"
+    )
+    for source in ["fns[0]()", "functools.partial(f)()", "p()", "list(gen)", "list(m)"]:
+        assert executor.execute(source).effects.dynamic, source
+    assert not executor.execute("arr.append(2)\nn = len(arr)").effects.dynamic
+
+
+def test_session_shows_indirect_mutations() -> None:
+    session = Session()
+    session.run_cell("arr = []\ngen = (arr.append(i) for i in range(3))")
+    session.run_cell("list(gen)")
+    names = session.last_snapshot.names
+    assert session.last_snapshot.objects[names["arr"]].payload == [0, 1, 2]
+
+    session.run_cell("m = map(arr.append, [77])")
+    session.run_cell("done = list(m)")
+    assert session.last_snapshot.objects[names["arr"]].payload == [0, 1, 2, 77]
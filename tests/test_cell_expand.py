@@ -12,3 +12,9 @@ def test_cell_render_expanded_shows_snapshot() -> None:
     cell = Cell(cell_id=1, code="x=1", ok=True, snapshot_text="snap")
     text = render_cell_text(cell, expanded=True).plain
     assert "snap" in text
+
+
+def test_cell_render_deferred_snapshot_is_expandable() -> None:
+    cell = Cell(cell_id=1, code="x=1", ok=True, deferred_snapshot=True)
+    text = render_cell_text(cell, expanded=False).plain
+    assert "▸" in text
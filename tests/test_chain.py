@@ -0,0 +1,49 @@
+from dsa_visualizer.core.snapshotter import Snapshotter
+from dsa_visualizer.data_structures.chain import ChainShape, iter_chain, measure_chain
+from dsa_visualizer.data_structures.implementations.structures import (
+    DoublyLinkedList,
+    LinkedList,
+)
+
+
+def _looped(length: int, back_to: int) -> LinkedList:
+    linked_list = LinkedList(range(length))
+    nodes = list(linked_list.nodes())
+    nodes[-1].next = nodes[back_to]
+    return linked_list
+
+
+def test_empty_and_open_chains() -> None:
+    assert measure_chain(None) == ChainShape(0)
+    assert measure_chain(LinkedList([1]).head) == ChainShape(1)
+    assert measure_chain(LinkedList(range(100)).head) == ChainShape(100)
+
+
+def test_cycle_length_and_start() -> None:
+    for length in (1, 2, 7, 64, 65):
+        for back_to in {0, 1 % length, length // 2, length - 1}:
+            shape = measure_chain(_looped(length, back_to).head)
+            assert shape == ChainShape(length, back_to)
+
+
+def test_iter_chain_yields_each_node_once() -> None:
+    linked_list = _looped(5, 2)
+    assert [node.data for node in linked_list.nodes()] == [0, 1, 2, 3, 4]
+    assert [node.data for node in iter_chain(linked_list.head)] == [0, 1, 2, 3, 4]
+
+
+def test_custom_successor_ends_the_chain() -> None:
+    head = LinkedList([1, 2, 3]).head
+    stop_at_two = lambda node: node.next if node.next.data != 3 else None
+    assert measure_chain(head, stop_at_two) == ChainShape(2)
+
+
+def test_snapshot_summary_reports_cycle() -> None:
+    doubly = DoublyLinkedList([1, 2, 3])
+    doubly.tail.next = doubly.head
+    snapshot = Snapshotter().snapshot({"ll": _looped(4, 1), "dll": doubly})
+    summaries = {
+        name: snapshot.objects[obj_id].summary
+        for name, obj_id in snapshot.names.items()
+    }
+    assert summaries == {"ll": "len=4, cycle to [1]", "dll": "len=3, cycle to [0]"}
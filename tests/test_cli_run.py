@@ -0,0 +1,74 @@
+import json
+import subprocess
+import sys
+
+from dsa_visualizer.cli import main
+from dsa_visualizer.core.script import run_script, split_cells
+
+
+def test_split_cells_on_top_level_statements() -> None:
+    source = (
+        "arr = [1, 2, 3]\n"
+        "\n"
+        "# grow it\n"
+        "for x in range(2):\n"
+        "    arr.append(x)\n"
+        "\n"
+        "@staticmethod\n"
+        "def helper():\n"
+        "    return 1\n"
+    )
+    cells = split_cells(source)
+    assert cells == [
+        (1, "arr = [1, 2, 3]"),
+        (3, "# grow it\nfor x in range(2):\n    arr.append(x)"),
+        (7, "@staticmethod\ndef helper():\n    return 1"),
+    ]
+
+
+def test_split_cells_on_markers() -> None:
+    source = "# %%\na = 1\nb = 2\n# %% second\n\nc = 3\n"
+    assert split_cells(source) == [(2, "a = 1\nb = 2"), (6, "c = 3")]
+
+
+def test_split_cells_keeps_unparsable_script_whole() -> None:
+    assert split_cells("x = (\n") == [(1, "x = (")]
+
+
+def test_run_script_renders_deltas_and_continues_after_errors() -> None:
+    cells = list(run_script("arr = [1, 2]\n1 / 0\nn = len(arr)\n"))
+    assert [cell.ok for cell in cells] == [True, False, True]
+    assert "arr ──▶ Array" in cells[0].output
+    assert cells[1].error == "division by zero"
+    assert "arr" not in cells[2].output
+    assert "n" in cells[2].output
+
+
+def test_cli_run_jsonl(tmp_path, capsys) -> None:
+    script = tmp_path / "lesson.py"
+    script.write_text("x = 1\nstack = Stack([1, 2])\n")
+    assert main(["run", "--format", "jsonl", str(script)]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record["index"] for record in records] == [1, 2]
+    assert records[1]["script"] == str(script)
+    assert "Stack" in records[1]["output"]
+    assert records[1]["usage"]["wall_time"] >= 0
+
+
+def test_cli_run_reports_failure_status(tmp_path, capsys) -> None:
+    script = tmp_path / "broken.py"
+    script.write_text("while True:\n    pass\n")
+    assert main(["run", "--instructions", "10000", str(script)]) == 1
+    assert "Instruction budget" in capsys.readouterr().out
+
+
+def test_cli_run_does_not_import_textual(tmp_path) -> None:
+    script = tmp_path / "lesson.py"
+    script.write_text("x = [1]\n")
+    code = (
+        "import sys\n"
+        "from dsa_visualizer.cli import main\n"
+        f"main(['run', {str(script)!r}])\n"
+        "assert not any(name.startswith('textual') for name in sys.modules)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
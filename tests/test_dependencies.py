@@ -0,0 +1,55 @@
+import ast
+
+from dsa_visualizer.core.dependencies import DependencyGraph
+from dsa_visualizer.core.effects import analyze_cell
+
+
+def _graph(*sources: str) -> DependencyGraph:
+    graph = DependencyGraph()
+    for cell_id, source in enumerate(sources, start=1):
+        graph.record(cell_id, source, analyze_cell(ast.parse(source)))
+    return graph
+
+
+def _plan(graph: DependencyGraph, cell_id: int, source: str) -> list[int]:
+    return graph.plan_rerun(cell_id, analyze_cell(ast.parse(source)))
+
+
+def test_plan_follows_transitive_uses() -> None:
+    graph = _graph("a = 1", "b = a + 1", "c = 5", "d = b * 2")
+    assert _plan(graph, 1, "a = 2") == [1, 2, 4]
+
+
+def test_plan_skips_unrelated_cells() -> None:
+    graph = _graph("a = 1", "b = 2", "c = b")
+    assert _plan(graph, 1, "a = 3") == [1]
+
+
+def test_plan_includes_cells_using_old_and_new_names() -> None:
+    graph = _graph("a = 1", "x = a", "y = b")
+    assert _plan(graph, 1, "b = 1") == [1, 2, 3]
+
+
+def test_in_place_update_replays_its_producer() -> None:
+    graph = _graph("arr = [1]", "n = 0", "arr.append(2)", "size = len(arr)")
+    assert _plan(graph, 3, "arr.append(3)") == [1, 3, 4]
+
+
+def test_dependent_stateful_cell_replays_its_producer() -> None:
+    graph = _graph("arr = [1]", "n = 0", "n += len(arr)")
+    assert _plan(graph, 1, "arr = [1, 2]") == [1, 2, 3]
+
+
+def test_dynamic_cell_replays_everything_after_it() -> None:
+    graph = _graph("a = 1", "exec('b = a')", "c = 2")
+    assert _plan(graph, 1, "a = 5") == [1, 2, 3]
+
+
+def test_function_definitions_carry_dependencies() -> None:
+    graph = _graph(
+        "scale = 2",
+        "def double(v):\n    return v * scale",
+        "unrelated = 1",
+        "result = double(4)",
+    )
+    assert _plan(graph, 1, "scale = 3") == [1, 2, 4]
@@ -0,0 +1,91 @@
+import threading
+
+import pytest
+
+from dsa_visualizer.algorithms.runner import AlgorithmRunner
+from dsa_visualizer.algorithms.types import AlgorithmStep, HighlightContext
+from dsa_visualizer.core.frame_prefetcher import FramePrefetcher
+from dsa_visualizer.core.session import Session
+
+
+def steps(count: int, gate: threading.Event | None = None):
+    for number in range(1, count + 1):
+        if gate is not None and number > 1:
+            gate.wait(5)
+        yield AlgorithmStep(
+            number, f"Step {number}", HighlightContext(), data=[1, 2, 3],
+            is_complete=number == count,
+        )
+
+
+def test_frames_come_in_order_and_end_with_none() -> None:
+    prefetcher = FramePrefetcher(
+        AlgorithmRunner.from_generator("Test", steps(5)), depth=2
+    )
+    numbers = [prefetcher.next().step_number for _ in range(5)]
+    assert numbers == [1, 2, 3, 4, 5]
+    assert prefetcher.next() is None
+
+
+def test_worker_stays_at_most_depth_ahead() -> None:
+    runner = AlgorithmRunner.from_generator("Test", steps(50))
+    prefetcher = FramePrefetcher(runner, depth=3)
+    prefetcher.next()
+    for _ in range(100):
+        if len(runner.steps) == 4:
+            break
+        threading.Event().wait(0.01)
+    assert len(runner.steps) == 4
+
+    paused = prefetcher.pause()
+    assert paused is runner
+    assert runner.current_index == 0
+    assert runner.advance().step_number == 2
+
+
+def test_next_waits_for_a_slow_step() -> None:
+    gate = threading.Event()
+    prefetcher = FramePrefetcher(
+        AlgorithmRunner.from_generator("Test", steps(2, gate))
+    )
+    assert prefetcher.next().step_number == 1
+    threading.Timer(0.05, gate.set).start()
+    assert prefetcher.next().step_number == 2
+
+
+def test_algorithm_errors_reach_next() -> None:
+    def failing():
+        yield from steps(1)
+        raise RuntimeError("boom")
+
+    prefetcher = FramePrefetcher(AlgorithmRunner.from_generator("Test", failing()))
+    prefetcher.next()
+    with pytest.raises(RuntimeError, match="boom"):
+        prefetcher.next()
+
+
+def test_session_prefetches_after_the_first_frame() -> None:
+    session = Session(prefetch_depth=4)
+    outcome = session.run_cell("search('linear', [5, 3, 8], 8)")
+    assert outcome.algorithm.step_number == 1
+    frames = [outcome.algorithm]
+    while (frame := session.advance_algorithm()) is not None:
+        frames.append(frame)
+    assert [frame.step_number for frame in frames] == list(range(1, len(frames) + 1))
+    assert frames[-1].is_complete
+
+    synchronous = Session()
+    first = synchronous.run_cell("search('linear', [5, 3, 8], 8)").algorithm
+    assert first.content == frames[0].content
+    assert synchronous.seek_algorithm(3).content == session.seek_algorithm(3).content
+
+
+def test_seek_renders_before_prefetching_resumes() -> None:
+    session = Session(prefetch_depth=8)
+    session.run_cell("search('linear', list(range(200)), 199)")
+    for _ in range(20):
+        frame = session.seek_algorithm(50)
+        assert frame.step_number == 51
+        frame = session.fast_forward_algorithm(lambda step: False)
+        assert frame is None
+    assert session.advance_algorithm().step_number == 52
@@ -0,0 +1,109 @@
+import json
+
+from dsa_visualizer.cli import main
+from dsa_visualizer.core import grader
+from dsa_visualizer.core.grader import grade_directory, grade_script
+
+
+def _write_submissions(directory) -> None:
+    (directory / "alice.py").write_text("arr = [3, 1, 2]\narr.sort()\n")
+    (directory / "bob.py").write_text("x = 1\ny = x / 0\n")
+    (directory / "carol.py").write_text("n = 0\nwhile True:\n    n += 1\n")
+    nested = directory / "late"
+    nested.mkdir()
+    (nested / "dave.py").write_text("stack = Stack([1])\n")
+
+
+def test_grade_script_records_cells_and_snapshot(tmp_path) -> None:
+    script = tmp_path / "alice.py"
+    script.write_text("arr = [3, 1, 2]\narr.sort()\nlabel = 'done'\n")
+    record = grade_script(script, timeout=10)
+    assert record["ok"]
+    assert [cell["index"] for cell in record["cells"]] == [1, 2, 3]
+    assert record["cells"][0]["usage"]["wall_time"] >= 0
+    snapshot = record["snapshot"]
+    assert snapshot["names"]["label"] == "done"
+    arr_id = snapshot["names"]["arr"]
+    assert snapshot["objects"][arr_id]["dsa_type"] == "Array"
+    assert "│ 1  │ 2  │ 3  │" in snapshot["objects"][arr_id]["content"]
+
+
+def test_grade_script_times_out_runaway_loop(tmp_path) -> None:
+    script = tmp_path / "carol.py"
+    script.write_text("n = 0\nwhile True:\n    n += 1\nafter = 1\n")
+    record = grade_script(script, timeout=0.2)
+    assert not record["ok"]
+    assert record["timed_out"]
+    assert len(record["cells"]) == 1
+    assert "n" in record["snapshot"]["names"]
+
+
+def test_grade_directory_writes_sorted_jsonl(tmp_path) -> None:
+    submissions = tmp_path / "submissions"
+    submissions.mkdir()
+    _write_submissions(submissions)
+    output = tmp_path / "grades.jsonl"
+
+    failed = grade_directory(submissions, output, workers=2, timeout=1.0)
+
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [record["script"].rsplit("/", 1)[-1] for record in records] == [
+        "alice.py",
+        "bob.py",
+        "carol.py",
+        "dave.py",
+    ]
+    by_name = {record["script"].rsplit("/", 1)[-1]: record for record in records}
+    assert by_name["alice.py"]["ok"]
+    assert by_name["bob.py"]["cells"][1]["error"] == "division by zero"
+    assert by_name["carol.py"]["timed_out"]
+    assert by_name["dave.py"]["ok"]
+    assert failed == 2
+
+
+def test_cli_grade(tmp_path) -> None:
+    submissions = tmp_path / "submissions"
+    submissions.mkdir()
+    (submissions / "ok.py").write_text("x = [1]\n")
+    output = tmp_path / "out.jsonl"
+    assert main(["grade", str(submissions), "-o", str(output), "-j", "1"]) == 0
+    assert json.loads(output.read_text())["ok"]
+
+
+def test_grade_script_records_sys_exit_as_failed(tmp_path) -> None:
+    script = tmp_path / "erin.py"
+    script.write_text("x = 1\nimport sys\nsys.exit(3)\nafter = 2\n")
+    record = grade_script(script, timeout=10)
+    assert not record["ok"]
+    assert record["error"] == "Script stopped by SystemExit"
+    assert record["cells"][-1]["ok"] is False
+    assert record["cells"][-1]["error"] == "SystemExit: 3"
+    assert "after" not in record["snapshot"]["names"]
+
+
+def test_cli_grade_survives_sys_exit(tmp_path) -> None:
+    submissions = tmp_path / "submissions"
+    submissions.mkdir()
+    (submissions / "quits.py").write_text("raise SystemExit(3)\n")
+    output = tmp_path / "out.jsonl"
+    assert main(["grade", str(submissions), "-o", str(output), "-j", "1"]) == 1
+    assert json.loads(output.read_text())["error"] == "Script stopped by SystemExit"
+
+
+def test_grade_scripts_kills_worker_the_alarm_cannot_stop(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(grader, "HARD_TIMEOUT_GRACE", 0.5)
+    (tmp_path / "hangs.py").write_text(
+        "import signal, time\n"
+        "signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM})\n"
+        "time.sleep(60)\n"
+    )
+    (tmp_path / "fine.py").write_text("x = 1\n")
+    records = {
+        record["script"].rsplit("/", 1)[-1]: record
+        for record in grader.grade_scripts(
+            grader.find_scripts(tmp_path), workers=1, timeout=0.5
+        )
+    }
+    assert records["hangs.py"]["timed_out"]
+    assert "worker killed" in records["hangs.py"]["error"]
+    assert records["fine.py"]["ok"]
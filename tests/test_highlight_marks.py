@@ -0,0 +1,73 @@
+"""Tests for MarkLog/MarkSet highlight sets."""
+
+import pytest
+
+from dsa_visualizer.algorithms.marks import MarkLog
+from dsa_visualizer.algorithms.render.highlights import MARKER_VISITED, get_index_marker
+from dsa_visualizer.algorithms.search.linear import linear_search
+from dsa_visualizer.algorithms.tree.dfs import dfs_search
+from dsa_visualizer.algorithms.types import HighlightContext
+from dsa_visualizer.data_structures.implementations.structures import BinarySearchTree
+
+
+def test_views_do_not_see_later_changes() -> None:
+    log = MarkLog()
+    log.add(1)
+    first = log.freeze()
+    log.add(2)
+    log.discard(1)
+    second = log.freeze()
+    assert first == frozenset({1})
+    assert second == frozenset({2})
+    assert 1 in first and 1 not in second
+    assert len(first) == len(second) == 1
+
+
+def test_views_iterate_in_marking_order() -> None:
+    log = MarkLog()
+    for member in (5, 3, 9):
+        log.add(member)
+    log.discard(3)
+    assert tuple(log.freeze()) == (5, 9)
+
+
+def test_unmarked_member_cannot_be_marked_again_after_a_view() -> None:
+    log = MarkLog()
+    log.add(1)
+    log.discard(1)
+    log.add(1)  # Nothing saw it leave.
+    log.freeze()
+    log.discard(1)
+    log.freeze()
+    with pytest.raises(ValueError):
+        log.add(1)
+
+
+def test_member_unmarked_and_marked_again_between_views() -> None:
+    log = MarkLog()
+    log.add(1)
+    first = log.freeze()
+    log.discard(1)
+    log.add(1)
+    second = log.freeze()
+    assert first == second == frozenset({1})
+    assert 1 in log
+
+
+def test_steps_share_one_record() -> None:
+    steps = list(linear_search((4, 5, 6), 6))
+    visited = [step.highlights.visited for step in steps]
+    assert visited[-1] == frozenset({0, 1, 2})
+    assert visited[0] == frozenset()
+    assert len({id(view._spans) for view in visited}) == 1
+    marker = get_index_marker(0, HighlightContext(visited=visited[-1]))
+    assert marker == MARKER_VISITED
+
+
+def test_dfs_path_is_kept_in_order() -> None:
+    tree = BinarySearchTree()
+    for value in (10, 5, 3):
+        tree.insert(value)
+    steps = list(dfs_search(tree.root, 3))
+    path = steps[-1].highlights.path_nodes
+    assert tuple(path) == (id(tree.root), id(tree.root.left), id(tree.root.left.left))
@@ -0,0 +1,108 @@
+import threading
+import time
+
+import pytest
+
+from dsa_visualizer.core.kernel import INTERRUPTED_MESSAGE, Kernel, KernelError
+
+
+@pytest.fixture
+def kernel():
+    kernel = Kernel()
+    yield kernel
+    kernel.close()
+
+
+def test_kernel_executes_and_keeps_state(kernel: Kernel) -> None:
+    first = kernel.execute("ll = LinkedList([1, 2])")
+    assert first.result.ok
+    blocks = kernel.memory_blocks(first.render_id)
+    assert any("ll ──▶ Linked List" in block.header for block in blocks)
+    second = kernel.execute("ll.append(3); n = len(ll)")
+    assert second.result.ok
+    blocks = kernel.memory_blocks(second.render_id)
+    assert any(block.block_id == "var_n" and block.summary == "3" for block in blocks)
+
+
+def test_kernel_abandons_render_when_next_cell_runs(kernel: Kernel) -> None:
+    first = kernel.execute("x = 1")
+    second = kernel.execute("y = 2")
+    assert first.render_id is not None and first.blocks == []
+    assert kernel.memory_blocks(first.render_id) is None
+    assert not kernel.busy
+    headers = {block.header for block in kernel.memory_blocks(second.render_id)}
+    assert headers == {"x ──▶ int", "y ──▶ int"}
+
+
+def test_kernel_reports_errors(kernel: Kernel) -> None:
+    outcome = kernel.execute("1 / 0")
+    assert not outcome.result.ok
+    assert "division by zero" in outcome.result.error
+
+
+def test_kernel_survives_unknown_command(kernel: Kernel) -> None:
+    kernel.execute("x = 1")
+    with pytest.raises(KernelError, match="Unknown kernel command"):
+        kernel._request("bogus")
+    assert kernel.execute("y = x + 1").result.ok
+
+
+def test_kernel_interrupts_runaway_cell(kernel: Kernel) -> None:
+    kernel.execute("x = 1")
+    outcomes = []
+    worker = threading.Thread(target=lambda: outcomes.append(kernel.execute("while True:\n    pass")))
+    worker.start()
+    while not kernel.busy:
+        time.sleep(0.01)
+    time.sleep(0.2)
+    kernel.interrupt()
+    worker.join(timeout=10)
+    assert not worker.is_alive()
+    assert outcomes[0].result.error == INTERRUPTED_MESSAGE
+    # State survives the interrupt
+    assert kernel.execute("y = x + 1").result.ok
+
+
+def test_kernel_restart_resets_namespace(kernel: Kernel) -> None:
+    kernel.execute("x = 1")
+    kernel.restart()
+    outcome = kernel.execute("y = x")
+    assert not outcome.result.ok
+    assert "x" in outcome.result.error
+
+
+def test_kernel_streams_algorithm_frames(kernel: Kernel) -> None:
+    outcome = kernel.execute("search('linear', [7, 8, 9], 8)")
+    assert outcome.algorithm is not None
+    assert outcome.algorithm.step_number == 1
+    frame = kernel.advance_algorithm()
+    assert frame is not None
+    assert frame.step_number == 2
+    kernel.stop_algorithm()
+    assert kernel.advance_algorithm() is None
+
+
+def test_kernel_runs_batch_with_deferred_deltas(kernel: Kernel) -> None:
+    outcome = kernel.run_batch(["ll = LinkedList([1])", "n = 3"], 1)
+    assert all(result.ok for result in outcome.results.values())
+    blocks = kernel.memory_blocks(outcome.render_id)
+    assert any(block.block_id == "var_n" for block in blocks)
+    delta = kernel.statement_delta(1)
+    assert delta is not None and "ll ──▶ Linked List" in delta
+
+
+def test_kernel_pages_large_containers(kernel: Kernel) -> None:
+    kernel.execute("big = list(range(1000))")
+    page = kernel.page("big", 500, 503)
+    assert page is not None
+    assert "501" in page.text
+    assert kernel.page("nothing", 0, 1) is None
+
+
+def test_kernel_scrubs_timeline(kernel: Kernel) -> None:
+    kernel.execute("x = 1", 1)
+    kernel.execute("x = 2", 2)
+    view = kernel.timeline_view(-2)
+    assert view is not None
+    assert view.cell_id == 1
+    assert [block.summary for block in view.blocks] == ["1"]
@@ -0,0 +1,172 @@
+"""Tests for the lazy algorithm and renderer registries."""
+
+import sys
+from collections import Counter, OrderedDict
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from dsa_visualizer.core import executor as executor_module
+from dsa_visualizer.core import registry, snapshotter
+from dsa_visualizer.core.executor import Executor
+from dsa_visualizer.core.registry import LazyRegistry
+from dsa_visualizer.core.snapshotter import ObjectRecord, Snapshotter
+from dsa_visualizer.render import memory_view
+
+
+@pytest.fixture
+def plugin_module(tmp_path, monkeypatch):
+    """A throwaway module that records being imported."""
+    (tmp_path / "dsa_test_plugin.py").write_text(
+        "def first_search(arr, target):\n"
+        "    yield from ()\n"
+        "\n"
+        "def render_thing(payload):\n"
+        "    return f'thing {payload}'\n"
+        "\n"
+        "class Bag:\n"
+        "    def __init__(self, *items):\n"
+        "        self.items = list(items)\n"
+        "    def __len__(self):\n"
+        "        return len(self.items)\n"
+        "\n"
+        "class Sack(Bag):\n"
+        "    pass\n"
+        "\n"
+        "def render_bag(bag):\n"
+        "    return 'bag of ' + ', '.join(map(str, bag.items))\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "dsa_test_plugin"
+    sys.modules.pop("dsa_test_plugin", None)
+
+
+def _entry_points(*points):
+    def entry_points(*, group):
+        return [point for point in points if point.group == group]
+
+    return entry_points
+
+
+class TestLazyRegistry:
+    """Tests for LazyRegistry."""
+
+    def test_imports_on_first_access(self, plugin_module):
+        reg = LazyRegistry("test.group", {"first": f"{plugin_module}:first_search"})
+        assert "first" in reg
+        assert plugin_module not in sys.modules
+
+        func = reg["first"]
+        assert func.__name__ == "first_search"
+        assert plugin_module in sys.modules
+
+    def test_unknown_name_raises_key_error(self, monkeypatch):
+        monkeypatch.setattr(registry, "entry_points", _entry_points())
+        reg = LazyRegistry("test.group", {})
+        with pytest.raises(KeyError):
+            reg["missing"]
+        assert reg.get("missing") is None
+
+    def test_discovers_entry_points(self, plugin_module, monkeypatch):
+        point = EntryPoint(
+            name="first", value=f"{plugin_module}:first_search", group="test.group"
+        )
+        monkeypatch.setattr(registry, "entry_points", _entry_points(point))
+        reg = LazyRegistry("test.group", {"builtin": "json:dumps"})
+
+        assert sorted(reg) == ["builtin", "first"]
+        assert reg["first"].__name__ == "first_search"
+
+    def test_entry_points_do_not_replace_builtins(self, monkeypatch):
+        point = EntryPoint(name="builtin", value="json:loads", group="test.group")
+        monkeypatch.setattr(registry, "entry_points", _entry_points(point))
+        reg = LazyRegistry("test.group", {"builtin": "json:dumps"})
+
+        assert reg["builtin"].__name__ == "dumps"
+
+    def test_register_object(self):
+        reg = LazyRegistry("test.group", {})
+        reg.register("fn", len)
+        assert reg["fn"] is len
+
+    def test_match_class_by_reference_or_object(self, monkeypatch):
+        monkeypatch.setattr(registry, "entry_points", _entry_points())
+        reg = LazyRegistry("test.group", {"Ordered": "collections:OrderedDict"})
+        reg.register("Counter", Counter)
+
+        class Sub(OrderedDict):
+            pass
+
+        assert reg.match_class(Sub) == "Ordered"
+        assert reg.match_class(Counter) == "Counter"
+        assert reg.match_class(dict) is None
+
+
+class TestPluginsInExecutor:
+    """Plugin entries are usable like built-in ones."""
+
+    def test_search_uses_plugin_algorithm(self, plugin_module, monkeypatch):
+        point = EntryPoint(
+            name="first",
+            value=f"{plugin_module}:first_search",
+            group=registry.SEARCH_GROUP,
+        )
+        monkeypatch.setattr(registry, "entry_points", _entry_points(point))
+        monkeypatch.setattr(
+            executor_module,
+            "SEARCH_ALGORITHMS",
+            LazyRegistry(registry.SEARCH_GROUP, {}),
+        )
+
+        executor = Executor()
+        result = executor.execute("search('first', [1, 2], 2)")
+        assert result.ok
+        assert executor.pop_pending_algorithm() is not None
+
+    def test_builtin_renderers_are_lazy(self):
+        assert "Array" in memory_view.RENDERERS
+        assert "Directed Graph" in memory_view.RENDERERS
+
+    def test_renderer_plugin(self, plugin_module, monkeypatch):
+        renderers = LazyRegistry(registry.RENDERER_GROUP, {})
+        renderers.register("Thing", f"{plugin_module}:render_thing")
+        monkeypatch.setattr(memory_view, "RENDERERS", renderers)
+        record = ObjectRecord(
+            obj_id="obj#1",
+            address="0x1",
+            py_type="Thing",
+            dsa_type="Thing",
+            summary="",
+            payload=3,
+        )
+        assert memory_view._render_object_content(record) == "thing 3"
+
+    def test_plugin_type_reaches_its_renderer(self, plugin_module, monkeypatch):
+        points = [
+            EntryPoint(
+                name="Bag", value=f"{plugin_module}:Bag", group=registry.TYPE_GROUP
+            ),
+            EntryPoint(
+                name="Bag",
+                value=f"{plugin_module}:render_bag",
+                group=registry.RENDERER_GROUP,
+            ),
+        ]
+        monkeypatch.setattr(registry, "entry_points", _entry_points(*points))
+        monkeypatch.setattr(
+            snapshotter, "DSA_TYPES", LazyRegistry(registry.TYPE_GROUP, {})
+        )
+        monkeypatch.setattr(
+            memory_view, "RENDERERS", LazyRegistry(registry.RENDERER_GROUP, {})
+        )
+        plugin = __import__(plugin_module)
+
+        snapshot = Snapshotter().snapshot(
+            {"bag": plugin.Bag(1, 2), "sack": plugin.Sack(3)}
+        )
+        blocks = {
+            block.header: block for block in memory_view.get_memory_blocks(snapshot)
+        }
+        assert blocks["bag ──▶ Bag"].content == "bag of 1, 2"
+        assert blocks["bag ──▶ Bag"].summary == "len=2"
+        assert blocks["sack ──▶ Bag"].content == "bag of 3"
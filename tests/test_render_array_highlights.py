@@ -181,3 +181,40 @@ class TestArrayHighlightCellWidth:
         # All lines should have consistent width (proper table structure)
         assert "│" in lines[1]  # Index row
         assert "│" in lines[3]  # Value row
+
+
+class TestArrayWindow:
+    """Tests for rendering a window of a longer sequence."""
+
+    def test_offset_shifts_index_labels(self):
+        """Index labels start at the window offset."""
+        result = render_array([7, 8, 9], offset=100)
+        assert "100" in result
+        assert "102" in result
+
+    def test_offset_applies_to_highlights(self):
+        """Highlights use indices of the full sequence."""
+        ctx = HighlightContext(found=frozenset({101}), boundaries=(100, 102))
+        result = render_array([7, 8, 9], highlights=ctx, offset=100)
+        assert f"{MARKER_FOUND}101" in result
+        assert "[" in result
+        assert "]" in result
+
+    def test_step_content_windows_large_sequences(self):
+        """Long step data is rendered around the focused index."""
+        from dsa_visualizer.algorithms.render.frames import (
+            ARRAY_WINDOW,
+            render_step_content,
+        )
+        from dsa_visualizer.algorithms.types import AlgorithmStep
+
+        step = AlgorithmStep(
+            step_number=1,
+            action="Check",
+            highlights=HighlightContext(current=frozenset({500_000_000})),
+            data=range(10**9),
+        )
+        content = render_step_content(step)
+        assert f"{MARKER_CURRENT}500000000" in content
+        assert f"of {10**9} elements" in content
+        assert content.count("│") < 3 * (ARRAY_WINDOW + 2)
@@ -27,3 +27,18 @@ def test_render_linked_list_three_nodes() -> None:
         f"{row}"
     )
     assert render_linked_list(linked_list) == expected
+
+
+def test_render_linked_list_draws_cycle_back_to_its_start() -> None:
+    linked_list = LinkedList(["A", "B", "C"])
+    assert linked_list.tail is not None
+    linked_list.tail.next = linked_list.head.next
+    chain = render_linked_list(linked_list).split("\n\n")[0]
+    expected = (
+        "Head ──▶ ┌────┬─────┐ ──▶ ┌────┬─────┐ ──▶ ┌────┬─────┐\n"
+        "         │ A  │  •  │     │ B  │  •  │     │ C  │  •  │\n"
+        "         └────┴─────┘     └────┴─────┘     └────┴─────┘\n"
+        "                            ▲                      │\n"
+        "                            └──────────────────────┘"
+    )
+    assert chain == expected
@@ -0,0 +1,71 @@
+import threading
+
+from dsa_visualizer.core.budget import BudgetExceeded
+from dsa_visualizer.core.render_pipeline import RenderPipeline
+from dsa_visualizer.core.session import Session
+from dsa_visualizer.render import memory_view
+
+
+def test_cell_blocks_are_rendered_in_the_background() -> None:
+    session = Session(render_pipeline=RenderPipeline())
+    outcome = session.run_cell("arr = [1, 2]")
+    assert outcome.blocks == []
+    blocks = session.memory_blocks(outcome.render_id)
+    assert [block.header for block in blocks] == ["arr ──▶ Array"]
+
+
+def test_next_cell_abandons_the_render(monkeypatch) -> None:
+    started = threading.Event()
+    release = threading.Event()
+    render_record = memory_view._render_record
+
+    def slow_render(record):
+        if record.dsa_type == "Array":
+            started.set()
+            release.wait(5)
+        return render_record(record)
+
+    monkeypatch.setattr(memory_view, "_render_record", slow_render)
+    session = Session(render_pipeline=RenderPipeline())
+    first = session.run_cell("a = [1]\nb = [2]")
+    assert started.wait(5)
+    waited = []
+    waiter = threading.Thread(
+        target=lambda: waited.append(session.memory_blocks(first.render_id))
+    )
+    waiter.start()
+    second = session.run_cell("c = 3")
+    release.set()
+    waiter.join(5)
+    assert waited == [None]
+    headers = {block.header for block in session.memory_blocks(second.render_id)}
+    assert headers == {"a ──▶ Array", "b ──▶ Array", "c ──▶ int"}
+
+
+def test_live_node_payloads_are_rendered_before_submit_returns() -> None:
+    session = Session(render_pipeline=RenderPipeline())
+    outcome = session.run_cell("ll = LinkedList([1, 2])")
+    (record,) = session.last_snapshot.objects.values()
+    cached = memory_view._content_cache.get(id(record))
+    assert cached is not None and cached[0] is record
+    assert session.memory_blocks(outcome.render_id)[0].content == cached[1]
+
+
+def test_failed_render_publishes_an_error_block(monkeypatch) -> None:
+    render_record = memory_view._render_record
+
+    def failing_render(record):
+        if record.dsa_type == "Array":
+            raise BudgetExceeded("Wall-time budget of 1s exceeded")
+        return render_record(record)
+
+    monkeypatch.setattr(memory_view, "_render_record", failing_render)
+    session = Session(render_pipeline=RenderPipeline())
+    first = session.run_cell("n = 1\narr = [1, 2]")
+    blocks = session.memory_blocks(first.render_id)
+    assert [block.block_id for block in blocks] == ["var_n", "render_error"]
+    assert "BudgetExceeded" in blocks[-1].content
+
+    second = session.run_cell("m = 2")
+    headers = [block.header for block in session.memory_blocks(second.render_id)]
+    assert "m ──▶ int" in headers
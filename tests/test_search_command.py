@@ -91,6 +91,27 @@ class TestSearchCommand:
         executor.execute('arr.append(4)')
         assert pending.data == [1, 2, 3]
 
+    def test_search_shares_read_only_sequences(self):
+        """Read-only sequences are passed through without a copy."""
+        executor = Executor()
+        executor.execute("r = range(10**9)")
+        executor.execute('search("binary", r, 123)')
+
+        pending = executor.pop_pending_algorithm()
+        assert pending.data is executor.globals["r"]
+
+    def test_search_copies_array_in_its_own_type(self):
+        """array.array inputs are snapshotted as compact arrays."""
+        executor = Executor()
+        executor.execute("import array")
+        executor.execute("a = array.array('i', [1, 2, 3])")
+        executor.execute('search("linear", a, 2)')
+
+        pending = executor.pop_pending_algorithm()
+        executor.globals["a"].append(4)
+        assert pending.data.typecode == "i"
+        assert list(pending.data) == [1, 2, 3]
+
 
 class TestSearchAlgorithmRegistry:
     """Tests for algorithm registry."""
@@ -0,0 +1,248 @@
+from dsa_visualizer.core.session import Session
+from dsa_visualizer.render.memory_view import render_object
+
+
+def test_run_cell_returns_delta_and_blocks() -> None:
+    session = Session()
+    outcome = session.run_cell("arr = [1, 2, 3]")
+    assert outcome.result.ok
+    assert outcome.snapshot_text is not None
+    assert "arr ──▶ Array" in outcome.snapshot_text
+    assert [block.header for block in outcome.blocks] == ["arr ──▶ Array"]
+
+
+def test_run_cell_reports_no_changes() -> None:
+    session = Session()
+    session.run_cell("x = 1")
+    outcome = session.run_cell("y = x")
+    assert outcome.snapshot_text is not None
+    outcome = session.run_cell("pass")
+    assert outcome.snapshot_text == "(no changes)"
+
+
+def test_run_cell_error_has_no_snapshot() -> None:
+    session = Session()
+    outcome = session.run_cell("raise ValueError('nope')")
+    assert not outcome.result.ok
+    assert outcome.snapshot_text is None
+    assert outcome.blocks == []
+
+
+def test_run_cell_starts_algorithm_at_first_frame() -> None:
+    session = Session()
+    outcome = session.run_cell("search('linear', [4, 5, 6], 6)")
+    frame = outcome.algorithm
+    assert frame is not None
+    assert frame.name == "Linear Search"
+    assert frame.step_number == 1
+    assert frame.content is not None
+    assert "→0" in frame.content
+
+
+def test_advance_algorithm_until_complete() -> None:
+    session = Session()
+    session.run_cell("search('binary', [1, 2, 3, 4, 5], 4)")
+    frames = []
+    while True:
+        frame = session.advance_algorithm()
+        if frame is None:
+            break
+        frames.append(frame)
+        if frame.is_complete:
+            break
+    assert frames[-1].is_complete
+    assert "Found 4" in frames[-1].action
+
+
+def test_new_cell_drops_running_algorithm() -> None:
+    session = Session()
+    session.run_cell("search('linear', [1, 2, 3], 3)")
+    session.run_cell("x = 1")
+    assert session.advance_algorithm() is None
+
+
+def test_scoped_snapshot_matches_full_scan() -> None:
+    session = Session()
+    cells = [
+        "a = [1, 2]",
+        "b = a",
+        "b.append(3)",
+        "s = Stack([1])",
+        "del a",
+        "x = 5",
+        "def grow():\n    global x\n    x = 6\n    s.push(2)",
+        "grow()",
+        "exec('y = 1')",
+        "1 / 0",
+        "z = b",
+    ]
+    for source in cells:
+        session.run_cell(source)
+        full = session.snapshotter.snapshot(session.executor.globals)
+        assert session.last_snapshot.names == full.names
+        assert session.last_snapshot.objects.keys() == full.objects.keys()
+        for obj_id, record in full.objects.items():
+            scoped = session.last_snapshot.objects[obj_id]
+            assert (scoped.dsa_type, scoped.summary) == (record.dsa_type, record.summary)
+
+
+def test_scoped_snapshot_reuses_untouched_records() -> None:
+    session = Session()
+    session.run_cell("big = list(range(100))\nother = [1]")
+    before = session.last_snapshot
+    session.run_cell("other.append(2)")
+    after = session.last_snapshot
+    big_id = after.names["big"]
+    other_id = after.names["other"]
+    assert after.objects[big_id] is before.objects[big_id]
+    assert after.objects[other_id] is not before.objects[other_id]
+    assert after.objects[other_id].summary == "len=2"
+
+
+def test_failed_cell_bindings_reach_next_snapshot() -> None:
+    session = Session()
+    assert not session.run_cell("partial = [1]\nraise ValueError").result.ok
+    session.run_cell("x = 1")
+    assert "partial" in session.last_snapshot.names
+
+
+def test_rerun_cell_updates_only_dependents() -> None:
+    session = Session()
+    session.run_cell("arr = [1, 2]")
+    session.run_cell("count = 0")
+    session.run_cell("total = sum(arr)")
+    session.run_cell("count += 1")
+
+    outcome = session.rerun_cell(1, "arr = [10, 20, 30]")
+
+    assert list(outcome.results) == [1, 3]
+    assert all(result.ok for result in outcome.results.values())
+    assert session.executor.globals["total"] == 60
+    assert session.executor.globals["count"] == 1
+    headers = sorted(block.header for block in outcome.blocks)
+    assert headers == ["arr ──▶ Array", "total ──▶ int"]
+    assert outcome.removed == {"obj#1"}
+
+
+def test_rerun_cell_replays_mutation_from_its_producer() -> None:
+    session = Session()
+    session.run_cell("stack = Stack([1])")
+    session.run_cell("stack.push(2)")
+    session.rerun_cell(2, "stack.push(3)")
+    assert session.executor.globals["stack"].items() == [1, 3]
+
+
+def test_rerun_cell_unbinds_dropped_names() -> None:
+    session = Session()
+    session.run_cell("old_name = [1]")
+    outcome = session.rerun_cell(1, "new_name = [1]")
+    assert "old_name" not in session.executor.globals
+    assert "old_name" not in session.last_snapshot.names
+    assert outcome.removed == {"obj#1"}
+
+
+def test_rerun_cell_reports_syntax_error() -> None:
+    session = Session()
+    session.run_cell("x = 1")
+    outcome = session.rerun_cell(1, "x = (")
+    assert not outcome.results[1].ok
+    assert session.executor.globals["x"] == 1
+
+
+def test_run_batch_snapshots_once() -> None:
+    session = Session()
+    calls = []
+    snapshot = session.snapshotter.snapshot
+
+    def counting_snapshot(*args, **kwargs):
+        calls.append(kwargs.get("names"))
+        return snapshot(*args, **kwargs)
+
+    session.snapshotter.snapshot = counting_snapshot
+    outcome = session.run_batch(["a = [1]", "b = 2", "raise ValueError('x')"], 1)
+
+    assert list(outcome.results) == [1, 2, 3]
+    assert [result.ok for result in outcome.results.values()] == [True, True, False]
+    assert len(calls) == 1
+    headers = sorted(block.header for block in outcome.blocks)
+    assert headers == ["a ──▶ Array", "b ──▶ int"]
+
+
+def test_statement_delta_is_rendered_on_demand() -> None:
+    session = Session()
+    session.run_batch(["a = [1]", "b = 2"], 1)
+
+    delta = session.statement_delta(2)
+    assert delta is not None
+    assert "b ──▶ int" in delta
+    assert "a ──▶" not in delta
+    assert session.statement_delta(2) is None
+
+
+def test_run_batch_cells_can_be_rerun() -> None:
+    session = Session()
+    session.run_batch(["arr = [1, 2]", "total = sum(arr)"], 1)
+    outcome = session.rerun_cell(1, "arr = [5]")
+    assert list(outcome.results) == [1, 2]
+    assert session.executor.globals["total"] == 5
+
+
+def test_unchanged_structure_reuses_record() -> None:
+    session = Session()
+    session.run_cell("s = Stack([1, 2])")
+    obj_id = session.last_snapshot.names["s"]
+    before = session.last_snapshot.objects[obj_id]
+
+    session.run_cell("n = len(s)")
+    assert session.last_snapshot.objects[obj_id] is before
+
+    session.run_cell("s.push(3)")
+    after = session.last_snapshot.objects[obj_id]
+    assert after is not before
+    assert after.payload == [1, 2, 3]
+
+
+def test_direct_node_edit_rebuilds_record() -> None:
+    session = Session()
+    session.run_cell("ll = LinkedList([1, 2])")
+    obj_id = session.last_snapshot.names["ll"]
+    before = session.last_snapshot.objects[obj_id]
+
+    outcome = session.run_cell("ll.head.data = 9")
+    assert session.last_snapshot.objects[obj_id] is not before
+    assert any("9" in block.content for block in outcome.blocks)
+
+
+def test_in_place_mutation_shows_in_cell_delta() -> None:
+    session = Session()
+    session.run_cell("arr = [1, 2]")
+    outcome = session.run_cell("arr.append(6)")
+    assert outcome.snapshot_text != "(no changes)"
+    assert "arr ──▶ Array" in outcome.snapshot_text
+    assert session.run_cell("n = len(arr)").snapshot_text is not None
+    assert "arr" not in session.run_cell("m = arr[0]").snapshot_text
+
+
+def test_node_edit_shows_in_delta_and_spares_other_structures() -> None:
+    session = Session()
+    session.run_cell("a = LinkedList([1, 2])\nb = LinkedList([3, 4])")
+    names = session.last_snapshot.names
+    b_before = session.last_snapshot.objects[names["b"]]
+
+    outcome = session.run_cell("a.head.data = 9\nn = len(b)")
+    assert "a ──▶ Linked List" in outcome.snapshot_text
+    assert "b ──▶" not in outcome.snapshot_text
+    assert session.last_snapshot.objects[names["b"]] is b_before
+
+    a_after = session.last_snapshot.objects[names["a"]]
+    session.run_cell("m = len(a)")
+    assert session.last_snapshot.objects[names["a"]] is a_after
+
+
+def test_node_edit_through_an_alias_updates_its_structure() -> None:
+    session = Session()
+    session.run_cell("ll = LinkedList([1, 2, 3])\nn = ll.head")
+    outcome = session.run_cell("n.data = 99")
+    assert "ll ──▶ Linked List" in outcome.snapshot_text
+    record = session.last_snapshot.objects[session.last_snapshot.names["ll"]]
+    assert "99" in render_object(record)
@@ -0,0 +1,91 @@
+from dsa_visualizer.core.session import Session
+from dsa_visualizer.core.snapshotter import (
+    CapturePolicy,
+    PayloadWindow,
+    Snapshotter,
+    diff_snapshots,
+)
+from dsa_visualizer.data_structures.implementations.structures import Stack
+from dsa_visualizer.render.memory_view import render_memory
+
+
+def test_large_list_is_captured_as_window() -> None:
+    snapshot = Snapshotter().snapshot({"big": list(range(100_000))})
+    record = snapshot.objects[snapshot.names["big"]]
+    assert record.summary == "len=100000"
+    window = record.payload
+    assert isinstance(window, PayloadWindow)
+    assert window.segments == (
+        (0, list(range(16))),
+        (99_984, list(range(99_984, 100_000))),
+    )
+    rendered = render_memory(snapshot)
+    assert "99999" in rendered
+    assert "… 99968 more [16:99984] …" in rendered
+    assert rendered.endswith("Showing 32 of 100000 elements")
+
+
+def test_window_fingerprint_covers_every_element() -> None:
+    snapshotter = Snapshotter(CapturePolicy(limit=10, head=2, tail=2))
+    values: dict[str, object] = {
+        "big": list(range(50)),
+        "table": dict.fromkeys(range(50)),
+    }
+    before = snapshotter.snapshot(values)
+    values["big"][25] = -1
+    after = snapshotter.snapshot(values, previous=before, names=["big", "table"])
+    assert list(diff_snapshots(before, after, ["big", "table"]).names) == ["big"]
+
+
+def test_large_hash_table_and_stack_windows() -> None:
+    stack = Stack()
+    for value in range(30):
+        stack.push(value)
+    policy = CapturePolicy(limit=10, head=2, tail=3)
+    snapshot = Snapshotter(policy).snapshot(
+        {"table": {key: key * 2 for key in range(30)}, "stack": stack}
+    )
+    table = snapshot.objects[snapshot.names["table"]].payload
+    assert table.segments == ((0, {0: 0, 1: 2}), (27, {27: 54, 28: 56, 29: 58}))
+    top = snapshot.objects[snapshot.names["stack"]].payload
+    assert top.segments == ((27, [27, 28, 29]),)
+
+
+def test_session_pages_into_large_container() -> None:
+    session = Session()
+    session.snapshotter.policy = CapturePolicy(limit=10, head=2, tail=2)
+    assert session.run_cell("big = list(range(100, 200))").result.ok
+    page = session.page("big", 40, 43)
+    assert page is not None
+    assert (page.start, page.stop, page.length) == (40, 43, 100)
+    assert "140" in page.text and "142" in page.text
+    assert "… 38 more [2:40] …" in page.text
+    assert page.text.endswith("Showing 7 of 100 elements")
+    assert session.page("missing", 0, 1) is None
+
+
+def test_session_page_stays_inside_the_container() -> None:
+    session = Session()
+    session.snapshotter.policy = CapturePolicy(limit=10, head=2, tail=2)
+    session.run_cell("big = list(range(100, 200))")
+    obj_id = session.last_snapshot.names["big"]
+    page = session.page(obj_id, 98, 104)
+    assert (page.start, page.stop, page.length) == (94, 100, 100)
+    assert "194" in page.text
+    assert session.page(obj_id, -5, 1).start == 0
+
+
+def test_window_fingerprint_copies_one_chunk_at_a_time() -> None:
+    import tracemalloc
+
+    big = list(range(500_000))
+    snapshotter = Snapshotter()
+    snapshotter.snapshot({"big": big})
+    tracemalloc.start()
+    try:
+        snapshotter.snapshot({"big": big})
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # A tuple of the elements alone would take 4 MB.
+    assert peak < 1_000_000
@@ -0,0 +1,74 @@
+import pytest
+
+from dsa_visualizer.core import snapshotter as snapshotter_module
+from dsa_visualizer.core.snapshotter import Snapshotter
+
+
+class Node:
+    def __init__(self, value: object) -> None:
+        self.value = value
+        self.next = None
+
+
+class Chain:
+    def __init__(self, *values: object) -> None:
+        self.head = None
+        for value in reversed(values):
+            node = Node(value)
+            node.next = self.head
+            self.head = node
+
+
+@pytest.fixture
+def classify_calls(monkeypatch: pytest.MonkeyPatch) -> list[type]:
+    monkeypatch.setattr(
+        snapshotter_module, "_CLASS_DESCRIBERS", snapshotter_module._ClassCache()
+    )
+    calls: list[type] = []
+    classify = snapshotter_module._classify
+
+    def counting(value: object):
+        calls.append(type(value))
+        return classify(value)
+
+    monkeypatch.setattr(snapshotter_module, "_classify", counting)
+    return calls
+
+
+def test_each_class_is_probed_once(classify_calls: list[type]) -> None:
+    values = {"a": Chain(1), "b": Chain(2, 3), "c": Chain(4), "d": [1], "e": [2]}
+    snapshot = Snapshotter().snapshot(values)
+    assert [snapshot.objects[snapshot.names[name]].dsa_type for name in values] == [
+        "Linked List",
+        "Linked List",
+        "Linked List",
+        "Array",
+        "Array",
+    ]
+    assert classify_calls == [Chain, list]
+
+
+def test_empty_structures_are_not_cached(classify_calls: list[type]) -> None:
+    snapshotter = Snapshotter()
+    empty = snapshotter.snapshot({"a": Chain()})
+    full = snapshotter.snapshot({"b": Chain(1, 2)})
+    assert empty.objects[empty.names["a"]].payload is None
+    record = full.objects[full.names["b"]]
+    assert (record.dsa_type, record.summary) == ("Linked List", "len=2")
+    assert classify_calls == [Chain, Chain]
+
+
+def test_cache_is_invalidated_when_class_changes(classify_calls: list[type]) -> None:
+    class Pile:
+        def __init__(self) -> None:
+            self.data = [1, 2]
+
+    snapshotter = Snapshotter()
+    before = snapshotter.snapshot({"p": Pile()})
+    Pile.push = Pile.pop = Pile.peek = lambda self: None
+    after = snapshotter.snapshot({"p": Pile()})
+    assert before.objects[before.names["p"]].dsa_type == "Object"
+    record = after.objects[after.names["p"]]
+    assert (record.dsa_type, record.payload) == ("Stack", [1, 2])
+    # Pile's data list is now snapshotted as a field too.
+    assert [kind for kind in classify_calls if kind is Pile] == [Pile, Pile]
@@ -1,4 +1,4 @@
-from dsa_visualizer.core.snapshotter import Snapshotter, diff_snapshots
+from dsa_visualizer.core.snapshotter import CapturePolicy, Snapshotter, diff_snapshots
 
 
 def test_aliasing_preserves_identity() -> None:
@@ -39,3 +39,89 @@ def test_diff_snapshots_tracks_changes() -> None:
     delta = diff_snapshots(before, after)
     assert delta.names["x"] == 2
     assert "y" in delta.names
+
+
+def test_diff_snapshots_reports_in_place_mutation() -> None:
+    snapshotter = Snapshotter()
+    values: dict[str, object] = {"arr": [1, 2], "other": [3]}
+    before = snapshotter.snapshot(values)
+    values["arr"].append(6)
+    after = snapshotter.snapshot(values, previous=before, names=["arr", "other"])
+    delta = diff_snapshots(before, after, ["arr", "other"])
+    assert list(delta.names) == ["arr"]
+    assert delta.objects[delta.names["arr"]].payload == [1, 2, 6]
+
+
+def test_diff_snapshots_tells_colliding_hashes_apart() -> None:
+    # hash(-1) == hash(-2) in CPython, so fingerprints must use values.
+    snapshotter = Snapshotter(CapturePolicy(limit=10, head=2, tail=2))
+    values: dict[str, object] = {
+        "small": [5, -1, 7],
+        "big": [0] * 20 + [-1] + [0] * 20,
+        "table": {"a": -1},
+    }
+    names = list(values)
+    before = snapshotter.snapshot(values)
+    values["small"][1] = -2
+    values["big"][20] = -2
+    values["table"]["a"] = -2
+    after = snapshotter.snapshot(values, previous=before, names=names)
+    assert sorted(diff_snapshots(before, after, names).names) == sorted(names)
+
+
+def test_session_reports_minus_one_to_minus_two() -> None:
+    from dsa_visualizer.core.session import Session
+
+    session = Session()
+    session.run_cell("arr = [5, -1, 7]")
+    outcome = session.run_cell("arr[1] = -2")
+    assert outcome.snapshot_text != "(no changes)"
+    record = session.last_snapshot.objects[session.last_snapshot.names["arr"]]
+    assert record.payload == [5, -2, 7]
+
+
+def test_diff_snapshots_uses_structure_versions() -> None:
+    from dsa_visualizer.data_structures.implementations.structures import MinHeap
+
+    snapshotter = Snapshotter()
+    values: dict[str, object] = {"heap": MinHeap([3])}
+    before = snapshotter.snapshot(values)
+    values["heap"].insert(1)
+    after = snapshotter.snapshot(values, previous=before, names=["heap"])
+    assert "heap" in diff_snapshots(before, after).names
+
+
+def test_self_referencing_list_fingerprint() -> None:
+    snapshotter = Snapshotter()
+    values: dict[str, object] = {"a": []}
+    values["a"].append(values["a"])
+    snapshot = snapshotter.snapshot(values)
+    assert snapshot.objects[snapshot.names["a"]].fingerprint is not None
+
+
+def test_dead_object_id_is_not_reused() -> None:
+    class Box:
+        pass
+
+    snapshotter = Snapshotter()
+    values: dict[str, object] = {"a": Box()}
+    first = snapshotter.snapshot(values)
+    del values["a"]
+    # A new object of the same type usually lands at the freed address.
+    values["b"] = Box()
+    second = snapshotter.snapshot(values)
+    assert second.names["b"] != first.names["a"]
+    assert len(snapshotter._id_map) == 1
+
+
+def test_unbound_containers_are_released() -> None:
+    snapshotter = Snapshotter()
+    values: dict[str, object] = {"a": [1], "b": {"k": 1}}
+    snapshot = snapshotter.snapshot(values)
+    for _ in range(5):
+        values["a"] = [1]
+        snapshot = snapshotter.snapshot(values, previous=snapshot, names=["a"])
+    del values["b"]
+    snapshotter.snapshot(values)
+    assert len(snapshotter._id_map) == 1
+    assert list(snapshotter._pinned) == [snapshot.names["a"]]
@@ -0,0 +1,95 @@
+from dsa_visualizer.core.snapshotter import (
+    CapturePolicy,
+    ObjectRef,
+    Snapshotter,
+    diff_snapshots,
+)
+from dsa_visualizer.data_structures.implementations.structures import Graph, LinkedList
+from dsa_visualizer.render.memory_view import get_memory_blocks
+
+
+def test_shared_inner_list_is_recorded_once() -> None:
+    inner = [1, 2]
+    snapshot = Snapshotter().snapshot({"grid": [inner, [3], inner]})
+    grid = snapshot.objects[snapshot.names["grid"]]
+    first, middle, last = grid.payload
+    assert isinstance(first, ObjectRef)
+    assert first == last
+    assert first.obj_id != middle.obj_id
+    assert grid.children == (first.obj_id, middle.obj_id)
+    assert snapshot.objects[first.obj_id].payload == [1, 2]
+    assert snapshot.objects[middle.obj_id].path == "grid[1]"
+
+
+def test_bound_names_label_references() -> None:
+    inner = [1]
+    snapshot = Snapshotter().snapshot({"grid": [inner], "inner": inner})
+    (ref,) = snapshot.objects[snapshot.names["grid"]].payload
+    assert ref == ObjectRef(snapshot.names["inner"], "inner")
+    assert str(ref) == "→inner"
+
+
+def test_cycles_terminate() -> None:
+    loop: list[object] = [1]
+    loop.append(loop)
+    snapshot = Snapshotter().snapshot({"loop": loop})
+    record = snapshot.objects[snapshot.names["loop"]]
+    assert record.children == (record.obj_id,)
+    assert record.payload[1] == ObjectRef(record.obj_id, "loop")
+
+
+def test_dict_of_linked_lists_and_object_graph_nodes() -> None:
+    class City:
+        pass
+
+    graph = Graph()
+    paris, rome = City(), City()
+    graph.add_edge(paris, rome)
+    snapshot = Snapshotter().snapshot(
+        {"table": {"a": LinkedList([1, 2]), "b": 3}, "graph": graph}
+    )
+    table = snapshot.objects[snapshot.names["table"]]
+    assert table.payload["b"] == 3
+    linked = snapshot.objects[table.payload["a"].obj_id]
+    assert (linked.dsa_type, linked.path) == ("Linked List", "table['a']")
+    adjacency = snapshot.objects[snapshot.names["graph"]].payload
+    assert [str(node) for node in adjacency] == ["→graph.nodes[0]", "→graph.nodes[1]"]
+    assert all(isinstance(node, ObjectRef) for node in adjacency)
+
+
+def test_depth_and_node_budgets() -> None:
+    deep: list[object] = []
+    level = deep
+    for _ in range(6):
+        level.append([])
+        level = level[0]
+    snapshotter = Snapshotter(CapturePolicy(depth=2))
+    assert len(snapshotter.snapshot({"deep": deep}).objects) == 3
+
+    wide = [[index] for index in range(20)]
+    snapshot = Snapshotter(CapturePolicy(nodes=5)).snapshot({"wide": wide})
+    record = snapshot.objects[snapshot.names["wide"]]
+    assert len(record.children) == 5
+    assert record.payload[5] == [5]
+
+
+def test_nested_mutation_is_reported() -> None:
+    snapshotter = Snapshotter()
+    values: dict[str, object] = {"grid": [[1], [2]]}
+    before = snapshotter.snapshot(values)
+    values["grid"][1].append(3)
+    after = snapshotter.snapshot(values, previous=before, names=["grid"])
+    delta = diff_snapshots(before, after, ["grid"])
+    assert list(delta.names) == ["grid"]
+    headers = [block.header for block in get_memory_blocks(delta)]
+    assert headers == ["grid ──▶ Array", "grid[0] ──▶ Array", "grid[1] ──▶ Array"]
+
+
+def test_unreachable_nested_records_are_dropped() -> None:
+    snapshotter = Snapshotter()
+    values: dict[str, object] = {"grid": [[1], [2]]}
+    before = snapshotter.snapshot(values)
+    values["grid"].pop()
+    after = snapshotter.snapshot(values, previous=before, names=["grid"])
+    assert len(before.objects) == 3
+    assert len(after.objects) == 2
@@ -0,0 +1,113 @@
+from dsa_visualizer.core import snapshotter
+from dsa_visualizer.core.executor import Executor
+from dsa_visualizer.core.snapshotter import ObjectRef, Snapshotter
+from dsa_visualizer.data_structures.render.object_fields import render_object_fields
+from dsa_visualizer.render.memory_view import get_memory_blocks
+
+
+class City:
+    def __init__(self, name: str, roads: list[str]) -> None:
+        self.name = name
+        self.roads = roads
+
+
+class Point:
+    __slots__ = ("__tag", "x")
+
+    def __init__(self, x: int) -> None:
+        self.x = x
+
+
+class Labeled(Point):
+    __slots__ = ("label",)
+
+
+def test_dict_fields_are_recorded() -> None:
+    snapshot = Snapshotter().snapshot({"c": City("Paris", ["Lyon"])})
+    record = snapshot.objects[snapshot.names["c"]]
+    assert record.dsa_type == "Object"
+    assert record.summary == "fields=2"
+    name, roads = record.payload["name"], record.payload["roads"]
+    assert name == "Paris"
+    assert isinstance(roads, ObjectRef)
+    assert str(roads) == "→c.roads"
+    assert snapshot.objects[roads.obj_id].payload == ["Lyon"]
+
+
+def test_slots_across_mro_with_mangled_and_unset_names() -> None:
+    point = Labeled(3)
+    point._Point__tag = "p"
+    snapshot = Snapshotter().snapshot({"p": point})
+    record = snapshot.objects[snapshot.names["p"]]
+    # ``label`` is declared but never assigned.
+    assert record.payload == {"x": 3, "_Point__tag": "p"}
+
+
+def test_field_schema_is_computed_once_per_class(monkeypatch) -> None:
+    calls: list[type] = []
+    original = snapshotter._field_schema
+
+    def counting(kind: type) -> tuple[tuple[str, ...], bool]:
+        calls.append(kind)
+        return original(kind)
+
+    monkeypatch.setattr(snapshotter, "_field_schema", counting)
+
+    class Pair:
+        __slots__ = ("a", "b")
+
+        def __init__(self) -> None:
+            self.a = self.b = 0
+
+    Snapshotter().snapshot({f"p{i}": Pair() for i in range(20)})
+    assert calls == [Pair]
+
+    Pair.extra = 1  # Changing the class invalidates its cached schema.
+    Snapshotter().snapshot({"p": Pair()})
+    assert calls == [Pair, Pair]
+
+
+def test_modules_and_library_objects_are_not_expanded() -> None:
+    import argparse
+    import sys
+
+    snapshot = Snapshotter().snapshot(
+        {"sys": sys, "parser": argparse.ArgumentParser()}
+    )
+    assert "sys" not in snapshot.names
+    (record,) = snapshot.objects.values()
+    assert (record.dsa_type, record.summary) == ("Object", "unrendered")
+    assert record.payload is None
+
+
+def test_cell_classes_are_expanded() -> None:
+    executor = Executor()
+    assert executor.execute(
+        "class Box:\n    def __init__(self):\n        self.n = 1\nb = Box()"
+    ).ok
+    snapshot = Snapshotter().snapshot(executor.globals)
+    assert snapshot.objects[snapshot.names["b"]].payload == {"n": 1}
+
+
+def test_fields_are_rendered_as_a_table() -> None:
+    block, _roads = get_memory_blocks(
+        Snapshotter().snapshot({"c": City("Paris", [])})
+    )
+    assert "Paris" in block.content
+    assert "→c.roads" in block.content
+
+
+def test_render_object_fields() -> None:
+    expected = (
+        "┌───────┬───────┐\n"
+        "│ field │ value │\n"
+        "├───────┼───────┤\n"
+        "│ x     │ 1     │\n"
+        "│ label │ start │\n"
+        "└───────┴───────┘"
+    )
+    assert render_object_fields({"x": 1, "label": "start"}) == expected
+
+
+def test_render_object_without_fields() -> None:
+    assert render_object_fields({}) == "(no fields)"
@@ -0,0 +1,101 @@
+from dsa_visualizer.core.session import Session
+from dsa_visualizer.core.snapshotter import Snapshotter
+from dsa_visualizer.core.timeline import SnapshotTimeline
+
+
+def _record_history(cells: list[dict[str, object]], interval: int = 3):
+    """Snapshot a namespace after each step, as a session does."""
+    snapshotter = Snapshotter()
+    timeline = SnapshotTimeline(keyframe_interval=interval)
+    namespace: dict[str, object] = {}
+    snapshot = snapshotter.snapshot(namespace)
+    expected = []
+    for changes in cells:
+        for name, value in changes.items():
+            if value is None:
+                namespace.pop(name, None)
+            else:
+                namespace[name] = value
+        snapshot = snapshotter.snapshot(namespace, previous=snapshot, names=changes)
+        timeline.append(snapshot)
+        expected.append(snapshot)
+    return timeline, expected
+
+
+def test_timeline_rebuilds_every_snapshot() -> None:
+    cells: list[dict[str, object]] = [
+        {"a": [1, 2]},
+        {"b": 3},
+        {"a": [4]},
+        {"c": {"k": 1}, "b": None},
+        {"b": True},
+        {"d": 5},
+        {"a": None},
+    ]
+    timeline, expected = _record_history(cells)
+    assert len(timeline) == len(cells)
+    for index, snapshot in enumerate(expected):
+        rebuilt = timeline.snapshot_at(index)
+        assert list(rebuilt.names.items()) == list(snapshot.names.items())
+        assert {
+            obj_id: record.payload for obj_id, record in rebuilt.objects.items()
+        } == {obj_id: record.payload for obj_id, record in snapshot.objects.items()}
+    assert timeline.snapshot_at(-1).names == expected[-1].names
+
+
+def test_bool_rebinding_is_not_mistaken_for_int() -> None:
+    timeline, _ = _record_history([{"x": 1}, {"x": True}], interval=10)
+    assert timeline.snapshot_at(1).names["x"] is True
+
+
+def test_growing_list_shares_unchanged_chunks() -> None:
+    snapshotter = Snapshotter()
+    timeline = SnapshotTimeline()
+    values = list(range(100))
+    namespace: dict[str, object] = {"arr": values}
+    snapshot = snapshotter.snapshot(namespace)
+    timeline.append(snapshot)
+    values.append(100)
+    snapshot = snapshotter.snapshot(namespace, previous=snapshot, names=["arr"])
+    timeline.append(snapshot)
+
+    obj_id = snapshot.names["arr"]
+    first, second = (frame.objects[obj_id].payload for frame in timeline._frames)
+    assert first.chunks[:3] == second.chunks[:3]
+    assert all(a is b for a, b in zip(first.chunks[:3], second.chunks[:3]))
+    assert first.chunks[3] is not second.chunks[3]
+    assert timeline.snapshot_at(0).objects[obj_id].payload == list(range(100))
+    assert timeline.snapshot_at(1).objects[obj_id].payload == list(range(101))
+
+
+def test_session_timeline_view() -> None:
+    session = Session()
+    session.run_cell("x = 1", cell_id=1)
+    session.run_cell("x = 2\narr = [1, 2]", cell_id=2)
+
+    start = session.timeline_view(0)
+    assert start is not None
+    assert (start.position, start.length, start.cell_id) == (0, 3, None)
+    assert start.blocks == []
+
+    view = session.timeline_view(-2)
+    assert view is not None
+    assert (view.position, view.cell_id) == (1, 1)
+    assert [block.summary for block in view.blocks] == ["1"]
+    assert session.timeline_view(3) is None
+
+
+def test_timeline_keeps_node_structures_as_they_were() -> None:
+    from dsa_visualizer.render import memory_view
+
+    session = Session()
+    session.run_cell("ll = LinkedList([1, 2, 3])", cell_id=1)
+    session.run_cell("ll.head.next = None", cell_id=2)
+    with memory_view._content_cache_lock:
+        memory_view._content_cache.clear()
+
+    before = session.timeline_view(1)
+    after = session.timeline_view(2)
+    assert before is not None and after is not None
+    assert "3" in before.blocks[0].content
+    assert "3" not in after.blocks[0].content